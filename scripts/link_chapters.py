@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Link USC sections to Chapter nodes.
+
+New ingests do this automatically; run this once against an existing
+database (local or Aura) so related-section lookups can traverse
+IN_CHAPTER edges instead of comparing chapter properties.
+
+Usage:
+    python scripts/link_chapters.py
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from rich.console import Console
+
+from src.graph.neo4j_store import Neo4jStore
+
+console = Console()
+
+
+def link_chapters():
+    """Create the Chapter constraint, Chapter nodes and IN_CHAPTER edges."""
+    store = Neo4jStore()
+    store.connect()
+
+    console.print("[bold]Linking USC sections to chapters[/bold]\n")
+
+    with store.session() as session:
+        session.run(
+            "CREATE CONSTRAINT chapter_id_unique "
+            "IF NOT EXISTS FOR (n:Chapter) REQUIRE n.id IS UNIQUE"
+        )
+
+    linked = store.link_chapters()
+
+    with store.session() as session:
+        chapters = session.run("MATCH (c:Chapter) RETURN count(c) AS count").single()["count"]
+
+    console.print(f"[bold green]Linked {linked} sections to {chapters} chapters[/bold green]")
+
+    store.close()
+
+
+if __name__ == "__main__":
+    link_chapters()
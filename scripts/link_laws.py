@@ -107,6 +107,11 @@ def link_laws_to_sections():
     console.print(f"  ENACTS edges created: [green]{enacts_created}[/green]")
     console.print(f"  AMENDS edges created: [green]{amends_created}[/green]")
 
+    stamped = store.stamp_enactment_dates()
+    console.print(f"  ENACTS edges dated: [green]{stamped}[/green]")
+    counted = store.refresh_amendment_counts()
+    console.print(f"  Section amendment counts refreshed: [green]{counted}[/green]")
+
     # Verify in database
     with store.session() as session:
         result = session.run("""
@@ -20,6 +20,7 @@ try:
         ChainSummary,
         TrivialChangeResult,
         Confidence,
+        SummarizerStats,
     )
     _LLM_AVAILABLE = True
 except ImportError:
@@ -29,6 +30,7 @@ except ImportError:
     ChainSummary = None
     TrivialChangeResult = None
     Confidence = None
+    SummarizerStats = None
 
 __all__ = [
     # Tier 3: Text diff
@@ -42,4 +44,5 @@ __all__ = [
     "ChainSummary",
     "TrivialChangeResult",
     "Confidence",
+    "SummarizerStats",
 ]
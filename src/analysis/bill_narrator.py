@@ -9,19 +9,236 @@ Uses Claude to synthesize structured data into engaging prose.
 """
 from __future__ import annotations
 
+import asyncio
 import os
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
+from string import Template
 from typing import Any
 
 import anthropic
 from dotenv import load_dotenv
 
-# Ensure env is loaded from the right place
-load_dotenv(os.path.join(os.path.dirname(__file__), '..', '..', '.env'), override=True)
+from .llm_summarizer import DEFAULT_REQUESTS_PER_MINUTE, shared_rate_limiter
+
+# tiktoken is optional - without it we fall back to a chars-per-token estimate
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+    tiktoken = None
+
+# Ensure env is loaded from the right place, but only when the key isn't
+# already set (LI_AUTOLOAD_DOTENV=0 disables this entirely)
+if os.environ.get("LI_AUTOLOAD_DOTENV", "1") == "1" and not os.environ.get("ANTHROPIC_API_KEY"):
+    load_dotenv(os.path.join(os.path.dirname(__file__), '..', '..', '.env'), override=True)
 
 logger = logging.getLogger(__name__)
 
+# Token budget for section text in generate_section_context prompts
+SECTION_TEXT_MAX_TOKENS = 1200
+# Rough ratio for English statutory text, used when tiktoken is unavailable
+CHARS_PER_TOKEN = 4
+TRUNCATION_SENTINEL = "\n...[truncated]"
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Load the tokenizer once per process (None if tiktoken is not installed)."""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"Could not load tiktoken encoding, estimating tokens instead: {e}")
+        return None
+
+
+@lru_cache(maxsize=4)
+def _get_client(api_key: str) -> anthropic.Anthropic:
+    """Shared sync client per API key, so narrators reuse one connection pool."""
+    return anthropic.Anthropic(api_key=api_key)
+
+
+@lru_cache(maxsize=4)
+def _get_async_client(api_key: str) -> anthropic.AsyncAnthropic:
+    """Shared async client per API key (see _get_client)."""
+    return anthropic.AsyncAnthropic(api_key=api_key)
+
+
+# =============================================================================
+# Prompts
+# =============================================================================
+#
+# Static instructions are sent as a cached system prompt; only the bill or
+# section data is rendered per call from the precompiled templates.
+# Interpolated blocks are normalized with _block(), so identical inputs
+# always render byte-identical prompts.
+
+EXECUTIVE_SUMMARY_INSTRUCTIONS = """You are a legislative analyst writing an executive summary for policy professionals.
+
+Write an executive summary with these components (use the exact headers):
+
+HEADLINE:
+[One punchy sentence that captures what this law does - suitable for a news headline]
+
+OVERVIEW:
+[2-3 short paragraphs explaining what this law does. IMPORTANT STRUCTURE:
+- First sentence must state the core mechanism (what the law DOES, not that it's "important" or an "investment")
+- Lead with the two main programs and their dollar amounts
+- Avoid throat-clearing phrases like "This legislation represents..." or "Congress has authorized..."
+- Write for someone who follows policy but isn't a legal expert
+Example good opening: "CHIPS creates two parallel programs: a $52.7B fund to incentivize domestic chip manufacturing, and an $81B expansion of NSF to boost research competitiveness."
+Example bad opening: "This landmark legislation represents a major federal investment in American technology leadership."]
+
+KEY PROVISIONS:
+[5-7 bullet points of the most significant provisions. For each provision:
+- Write 1-2 sentences describing the provision
+- Include specific dollar amounts where applicable
+- End each bullet with a bracketed list of the most relevant USC section citations
+Format: "- Description of provision [42 USC 18851, 42 USC 18852]"
+Example: "- Establishes the National Semiconductor Technology Center to advance semiconductor research [42 USC 18851]"
+IMPORTANT: Use actual section citations from the SAMPLE SECTIONS provided. Each provision MUST end with at least one bracketed citation.]
+
+WHY IT MATTERS:
+[One paragraph on the significance and expected impact. Use hedged language for claims about future impact - say "is expected to," "may," "aims to" rather than asserting outcomes as fact.]
+
+HISTORICAL CONTEXT:
+[One paragraph on what led to this legislation - the policy problem it addresses, predecessor efforts, why now. Focus on verifiable facts about the legislative history and stated purposes rather than speculative claims.]
+
+Be concrete and specific. Avoid generic language like "landmark legislation" or "historic investment" unless you explain why. Ground claims in the actual provisions. Use appropriate epistemic hedging for predictions and causal claims."""
+
+EXECUTIVE_SUMMARY_TEMPLATE = Template("""Generate an executive summary for this legislation:
+
+**$bill_title** ($bill_citation)
+Enacted: $enacted_date
+
+SCOPE:
+- Created $sections_created new sections of law
+- Amended $sections_amended existing sections
+$funding_section
+TOPIC BREAKDOWN:
+$topic_breakdown
+
+BUILDS UPON THESE PRIOR LAWS:
+$predecessors
+
+SAMPLE SECTIONS CREATED/AMENDED:
+$sample_sections""")
+
+NAVIGATION_GUIDE_INSTRUCTIONS = """You are helping someone navigate a complex piece of legislation.
+
+Generate a navigation guide with these components (use exact headers):
+
+PATHWAYS:
+[Create 4-5 different "pathways" through the legislation based on different interests. Format each as:]
+- IF YOU CARE ABOUT: [interest area]
+  [1-2 sentence description of what you'll find]
+  START WITH: [specific section citation]
+  ALSO SEE: [2-3 other relevant sections]
+
+MOST INTERESTING THREAD:
+[One paragraph highlighting a noteworthy pattern or observation in this legislation. IMPORTANT: Use appropriate epistemic hedging - say "appears to suggest," "may indicate," "one possible interpretation," etc. Do NOT make strong causal claims without evidence. Focus on observable facts (amendment frequency, unexpected provisions) rather than speculative claims about intent or policy implications.]
+
+Be specific. Don't just say "if you care about research funding" - say "if you want to understand how NSF's budget authority is changing" and point to the actual sections."""
+
+NAVIGATION_GUIDE_TEMPLATE = Template("""Legislation: $bill_title
+
+Here's what the law covers:
+
+TOPICS AND SECTIONS:
+$topic_groups
+
+SECTIONS WITH THE MOST LEGISLATIVE HISTORY (most frequently amended):
+$amended_sections
+
+NEWEST SECTIONS (created by this law):
+$new_sections""")
+
+SECTION_CONTEXT_INSTRUCTIONS = Template("""You are explaining a section of US law to a policy professional.
+
+Generate context with these components (use exact headers):
+
+PLAIN ENGLISH:
+[2-3 sentences explaining what this section does in plain English. Be specific.]
+
+WHY THIS EXISTS:
+[1-2 sentences on the policy purpose - what problem does this solve or what function does it serve?]
+
+CONNECTIONS:
+[2-3 bullet points on how this relates to other sections or laws]
+
+${amendment_story}Be concrete. If you don't know something, say so rather than being vague.""")
+
+SECTION_CONTEXT_TEMPLATE = Template("""SECTION: $section_citation
+NAME: $section_name
+
+TEXT (may be truncated):
+$section_text
+
+AMENDMENT HISTORY:
+$amendments
+
+RELATED SECTIONS:
+$related_sections""")
+
+# Headers each prompt asks the model to use; responses are split on these only
+EXECUTIVE_SUMMARY_HEADERS = frozenset({
+    "HEADLINE", "OVERVIEW", "KEY PROVISIONS", "WHY IT MATTERS", "HISTORICAL CONTEXT",
+})
+NAVIGATION_GUIDE_HEADERS = frozenset({"PATHWAYS", "MOST INTERESTING THREAD"})
+SECTION_CONTEXT_HEADERS = frozenset({
+    "PLAIN ENGLISH", "WHY THIS EXISTS", "CONNECTIONS", "AMENDMENT STORY",
+})
+_KNOWN_HEADERS = EXECUTIVE_SUMMARY_HEADERS | NAVIGATION_GUIDE_HEADERS | SECTION_CONTEXT_HEADERS
+
+AMENDMENT_STORY_INSTRUCTIONS = """AMENDMENT STORY:
+[One paragraph telling the story of how this section has evolved through its amendments. What patterns do you see?]"""
+
+
+def _block(text: str) -> str:
+    """Normalize an interpolated prompt block (no trailing whitespace drift)."""
+    return "\n".join(line.rstrip() for line in text.strip("\n").splitlines())
+
+
+# =============================================================================
+# Prompt Fragments
+# =============================================================================
+#
+# Pure formatters over hashable inputs, cached so re-narrating the same bill
+# reuses the rendered fragments.
+
+
+@lru_cache(maxsize=256)
+def _format_topic_breakdown(topics: tuple[tuple[str, int], ...]) -> str:
+    lines = []
+    for topic, count in sorted(topics, key=lambda x: -x[1]):
+        lines.append(f"- {topic}: {count} sections")
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=256)
+def _format_predecessors(laws: tuple[tuple[str, str, Any], ...]) -> str:
+    lines = []
+    for citation, title, year in laws:
+        if not title:
+            lines.append(f"- {citation}")
+        elif year:
+            lines.append(f"- {citation}: {title} ({year})")
+        else:
+            lines.append(f"- {citation}: {title}")
+    return "\n".join(lines) if lines else "None identified"
+
+
+@lru_cache(maxsize=256)
+def _format_sample_sections(sections: tuple[tuple[str, str], ...]) -> str:
+    lines = []
+    for citation, name in sections:
+        lines.append(f"- {citation}: {name}")
+    return "\n".join(lines)
+
 
 @dataclass
 class ProvisionLink:
@@ -75,20 +292,40 @@ class BillNarrator:
     synthesizes it into engaging, useful prose.
     """
 
-    def __init__(self, api_key: str | None = None, model: str = "claude-sonnet-4-20250514"):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str = "claude-sonnet-4-20250514",
+        requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+    ):
         """
         Initialize the narrator.
 
         Args:
             api_key: Anthropic API key (or uses ANTHROPIC_API_KEY env var)
             model: Model to use for generation
+            requests_per_minute: Rate limit for API calls (shared process-wide)
         """
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         if not self.api_key:
             raise ValueError("Anthropic API key required")
 
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        self.client = _get_client(self.api_key)
+        self.async_client = _get_async_client(self.api_key)
         self.model = model
+        self.rate_limiter = shared_rate_limiter(requests_per_minute)
+
+        # System prompt prefixes are fixed per instance so every call sends
+        # byte-identical, cacheable system blocks. Changing the instructions
+        # requires a new BillNarrator.
+        self._exec_prefix = self._system_blocks(EXECUTIVE_SUMMARY_INSTRUCTIONS)
+        self._nav_prefix = self._system_blocks(NAVIGATION_GUIDE_INSTRUCTIONS)
+        self._section_prefix = self._system_blocks(
+            SECTION_CONTEXT_INSTRUCTIONS.substitute(amendment_story="")
+        )
+        self._section_story_prefix = self._system_blocks(
+            SECTION_CONTEXT_INSTRUCTIONS.substitute(amendment_story=AMENDMENT_STORY_INSTRUCTIONS + "\n\n")
+        )
 
     def generate_executive_summary(
         self,
@@ -121,67 +358,26 @@ class BillNarrator:
         # Format funding information if available
         funding_section = ""
         if funding_data:
-            funding_section = f"""
-FUNDING AUTHORIZATIONS:
-Total: {funding_data.get('total', 'Not specified')}
-{self._format_funding_categories(funding_data.get('categories', []))}
-Note: {funding_data.get('note', 'Authorization levels may differ from actual appropriations.')}
-"""
-
-        prompt = f"""You are a legislative analyst writing an executive summary for policy professionals.
-
-Generate an executive summary for this legislation:
-
-**{bill_title}** ({bill_citation})
-Enacted: {enacted_date}
-
-SCOPE:
-- Created {sections_created} new sections of law
-- Amended {sections_amended} existing sections
-{funding_section}
-TOPIC BREAKDOWN:
-{self._format_topic_breakdown(topic_breakdown)}
-
-BUILDS UPON THESE PRIOR LAWS:
-{self._format_predecessors(predecessor_laws)}
-
-SAMPLE SECTIONS CREATED/AMENDED:
-{self._format_sample_sections(sample_sections)}
-
----
-
-Write an executive summary with these components (use the exact headers):
-
-HEADLINE:
-[One punchy sentence that captures what this law does - suitable for a news headline]
-
-OVERVIEW:
-[2-3 short paragraphs explaining what this law does. IMPORTANT STRUCTURE:
-- First sentence must state the core mechanism (what the law DOES, not that it's "important" or an "investment")
-- Lead with the two main programs and their dollar amounts
-- Avoid throat-clearing phrases like "This legislation represents..." or "Congress has authorized..."
-- Write for someone who follows policy but isn't a legal expert
-Example good opening: "CHIPS creates two parallel programs: a $52.7B fund to incentivize domestic chip manufacturing, and an $81B expansion of NSF to boost research competitiveness."
-Example bad opening: "This landmark legislation represents a major federal investment in American technology leadership."]
-
-KEY PROVISIONS:
-[5-7 bullet points of the most significant provisions. For each provision:
-- Write 1-2 sentences describing the provision
-- Include specific dollar amounts where applicable
-- End each bullet with a bracketed list of the most relevant USC section citations
-Format: "- Description of provision [42 USC 18851, 42 USC 18852]"
-Example: "- Establishes the National Semiconductor Technology Center to advance semiconductor research [42 USC 18851]"
-IMPORTANT: Use actual section citations from the SAMPLE SECTIONS provided above. Each provision MUST end with at least one bracketed citation.]
-
-WHY IT MATTERS:
-[One paragraph on the significance and expected impact. Use hedged language for claims about future impact - say "is expected to," "may," "aims to" rather than asserting outcomes as fact.]
-
-HISTORICAL CONTEXT:
-[One paragraph on what led to this legislation - the policy problem it addresses, predecessor efforts, why now. Focus on verifiable facts about the legislative history and stated purposes rather than speculative claims.]
+            funding_section = (
+                "\nFUNDING AUTHORIZATIONS:\n"
+                f"Total: {funding_data.get('total', 'Not specified')}\n"
+                f"{self._format_funding_categories(funding_data.get('categories', []))}\n"
+                f"Note: {funding_data.get('note', 'Authorization levels may differ from actual appropriations.')}\n"
+            )
 
-Be concrete and specific. Avoid generic language like "landmark legislation" or "historic investment" unless you explain why. Ground claims in the actual provisions. Use appropriate epistemic hedging for predictions and causal claims."""
+        prompt = EXECUTIVE_SUMMARY_TEMPLATE.substitute(
+            bill_title=bill_title,
+            bill_citation=bill_citation,
+            enacted_date=enacted_date,
+            sections_created=sections_created,
+            sections_amended=sections_amended,
+            funding_section=funding_section,
+            topic_breakdown=_block(self._format_topic_breakdown(topic_breakdown)),
+            predecessors=_block(self._format_predecessors(predecessor_laws)),
+            sample_sections=_block(self._format_sample_sections(sample_sections)),
+        )
 
-        response = self._call_api(prompt)
+        response = self._call_api(prompt, system=self._exec_prefix)
         return self._parse_executive_summary(response)
 
     def generate_navigation_guide(
@@ -203,36 +399,14 @@ Be concrete and specific. Avoid generic language like "landmark legislation" or
         Returns:
             NavigationGuide with pathways, highlights, etc.
         """
-        prompt = f"""You are helping someone navigate a complex piece of legislation: {bill_title}
-
-Here's what the law covers:
-
-TOPICS AND SECTIONS:
-{self._format_topic_groups(topic_groups)}
-
-SECTIONS WITH THE MOST LEGISLATIVE HISTORY (most frequently amended):
-{self._format_amended_sections(most_amended_sections)}
-
-NEWEST SECTIONS (created by this law):
-{self._format_new_sections(newest_sections)}
-
----
-
-Generate a navigation guide with these components (use exact headers):
-
-PATHWAYS:
-[Create 4-5 different "pathways" through the legislation based on different interests. Format each as:]
-- IF YOU CARE ABOUT: [interest area]
-  [1-2 sentence description of what you'll find]
-  START WITH: [specific section citation]
-  ALSO SEE: [2-3 other relevant sections]
-
-MOST INTERESTING THREAD:
-[One paragraph highlighting a noteworthy pattern or observation in this legislation. IMPORTANT: Use appropriate epistemic hedging - say "appears to suggest," "may indicate," "one possible interpretation," etc. Do NOT make strong causal claims without evidence. Focus on observable facts (amendment frequency, unexpected provisions) rather than speculative claims about intent or policy implications.]
-
-Be specific. Don't just say "if you care about research funding" - say "if you want to understand how NSF's budget authority is changing" and point to the actual sections."""
+        prompt = NAVIGATION_GUIDE_TEMPLATE.substitute(
+            bill_title=bill_title,
+            topic_groups=_block(self._format_topic_groups(topic_groups)),
+            amended_sections=_block(self._format_amended_sections(most_amended_sections)),
+            new_sections=_block(self._format_new_sections(newest_sections)),
+        )
 
-        response = self._call_api(prompt)
+        response = self._call_api(prompt, system=self._nav_prefix)
         return self._parse_navigation_guide(response, most_amended_sections, newest_sections)
 
     def generate_section_context(
@@ -256,50 +430,106 @@ Be specific. Don't just say "if you care about research funding" - say "if you w
         Returns:
             SectionContext with plain English explanation, etc.
         """
-        # Truncate text if too long
-        text_for_prompt = section_text[:3000] if section_text else "[Text not available]"
-
-        prompt = f"""You are explaining a section of US law to a policy professional.
-
-SECTION: {section_citation}
-NAME: {section_name}
-
-TEXT (may be truncated):
-{text_for_prompt}
-
-AMENDMENT HISTORY:
-{self._format_amendments(amendments)}
-
-RELATED SECTIONS:
-{self._format_related_sections(related_sections)}
-
----
-
-Generate context with these components (use exact headers):
+        system, prompt = self._build_section_context_prompt(
+            section_citation, section_name, section_text, amendments, related_sections
+        )
+        response = self._call_api(prompt, system=system)
+        return self._parse_section_context(response)
 
-PLAIN ENGLISH:
-[2-3 sentences explaining what this section does in plain English. Be specific.]
+    async def agenerate_section_context(
+        self,
+        section_citation: str,
+        section_name: str,
+        section_text: str,
+        amendments: list[dict],
+        related_sections: list[dict],
+    ) -> SectionContext:
+        """Async version of generate_section_context."""
+        system, prompt = self._build_section_context_prompt(
+            section_citation, section_name, section_text, amendments, related_sections
+        )
+        response = await self._acall_api(prompt, system=system)
+        return self._parse_section_context(response)
 
-WHY THIS EXISTS:
-[1-2 sentences on the policy purpose - what problem does this solve or what function does it serve?]
+    async def agenerate_bill_contexts(
+        self,
+        sections: list[dict],
+        concurrency: int = 10,
+    ) -> list[SectionContext]:
+        """
+        Generate context for every section of a bill concurrently.
 
-CONNECTIONS:
-[2-3 bullet points on how this relates to other sections or laws]
+        Args:
+            sections: List of keyword dicts for agenerate_section_context
+            concurrency: Maximum number of requests in flight at once
 
-{"AMENDMENT STORY:" if amendments else ""}
-{("[One paragraph telling the story of how this section has evolved through its amendments. What patterns do you see?]" if amendments else "")}
+        Returns:
+            SectionContext list in the same order as sections
+        """
+        sem = asyncio.Semaphore(concurrency)
 
-Be concrete. If you don't know something, say so rather than being vague."""
+        async def _one(section: dict) -> SectionContext:
+            async with sem:
+                return await self.agenerate_section_context(**section)
 
-        response = self._call_api(prompt)
-        return self._parse_section_context(response)
+        return await asyncio.gather(*(_one(s) for s in sections))
 
-    def _call_api(self, prompt: str) -> str:
+    def _build_section_context_prompt(
+        self,
+        section_citation: str,
+        section_name: str,
+        section_text: str,
+        amendments: list[dict],
+        related_sections: list[dict],
+    ) -> tuple[list[dict], str]:
+        """Render the section context prompt as (system blocks, user prompt)."""
+        # Truncate text to a fixed token budget
+        text_for_prompt = self._truncate_to_tokens(section_text) if section_text else "[Text not available]"
+
+        prompt = SECTION_CONTEXT_TEMPLATE.substitute(
+            section_citation=section_citation,
+            section_name=section_name,
+            section_text=_block(text_for_prompt),
+            amendments=_block(self._format_amendments(amendments)),
+            related_sections=_block(self._format_related_sections(related_sections)),
+        )
+        system = self._section_story_prefix if amendments else self._section_prefix
+        return system, prompt
+
+    @staticmethod
+    def _system_blocks(instructions: str) -> list[dict]:
+        """Wrap static instructions as a system prompt marked for prompt caching."""
+        return [{
+            "type": "text",
+            "text": instructions.rstrip(),
+            "cache_control": {"type": "ephemeral"},
+        }]
+
+    def _call_api(self, prompt: str, system: list[dict] | None = None) -> str:
         """Make API call to Claude."""
+        self.rate_limiter.wait()
         try:
             message = self.client.messages.create(
                 model=self.model,
                 max_tokens=2000,
+                system=system or anthropic.NOT_GIVEN,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ]
+            )
+            return message.content[0].text
+        except Exception as e:
+            logger.error(f"API call failed: {e}")
+            raise
+
+    async def _acall_api(self, prompt: str, system: list[dict] | None = None) -> str:
+        """Make async API call to Claude."""
+        await self.rate_limiter.wait_async()
+        try:
+            message = await self.async_client.messages.create(
+                model=self.model,
+                max_tokens=2000,
+                system=system or anthropic.NOT_GIVEN,
                 messages=[
                     {"role": "user", "content": prompt}
                 ]
@@ -309,11 +539,32 @@ Be concrete. If you don't know something, say so rather than being vague."""
             logger.error(f"API call failed: {e}")
             raise
 
+    def _truncate_to_tokens(self, text: str, max_tokens: int = SECTION_TEXT_MAX_TOKENS) -> str:
+        """
+        Truncate text to at most max_tokens tokens.
+
+        Cuts on a token boundary when tiktoken is available, otherwise on the
+        last whitespace within an estimated character budget. Truncated text
+        ends with TRUNCATION_SENTINEL so the model knows content was cut.
+
+        cl100k_base is OpenAI's encoding, not Claude's tokenizer, so even with
+        tiktoken the count only approximates what the model will see.
+        """
+        encoding = _get_encoding()
+        if encoding is not None:
+            tokens = encoding.encode(text)
+            if len(tokens) <= max_tokens:
+                return text
+            return encoding.decode(tokens[:max_tokens]).rstrip() + TRUNCATION_SENTINEL
+
+        max_chars = max_tokens * CHARS_PER_TOKEN
+        if len(text) <= max_chars:
+            return text
+        cut = text.rfind(" ", 0, max_chars)
+        return text[:cut if cut > 0 else max_chars].rstrip() + TRUNCATION_SENTINEL
+
     def _format_topic_breakdown(self, topics: dict[str, int]) -> str:
-        lines = []
-        for topic, count in sorted(topics.items(), key=lambda x: -x[1]):
-            lines.append(f"- {topic}: {count} sections")
-        return "\n".join(lines)
+        return _format_topic_breakdown(tuple(topics.items()))
 
     def _format_funding_categories(self, categories: list[dict]) -> str:
         """Format funding categories for the prompt."""
@@ -326,21 +577,16 @@ Be concrete. If you don't know something, say so rather than being vague."""
         return "\n".join(lines) if lines else "Not specified"
 
     def _format_predecessors(self, laws: list[dict]) -> str:
-        lines = []
-        for law in laws:
-            citation = law.get("citation", "Unknown")
-            title = law.get("title", "")
-            year = law.get("year", "")
-            lines.append(f"- {citation}: {title} ({year})" if title else f"- {citation}")
-        return "\n".join(lines) if lines else "None identified"
+        return _format_predecessors(tuple(
+            (law.get("citation", "Unknown"), law.get("title", ""), law.get("year", ""))
+            for law in laws
+        ))
 
     def _format_sample_sections(self, sections: list[dict]) -> str:
-        lines = []
-        for s in sections[:10]:  # Limit to 10
-            citation = s.get("citation", "")
-            name = s.get("name", "")
-            lines.append(f"- {citation}: {name}")
-        return "\n".join(lines)
+        return _format_sample_sections(tuple(
+            (s.get("citation", ""), s.get("name", ""))
+            for s in sections[:10]  # Limit to 10
+        ))
 
     def _format_topic_groups(self, groups: list[dict]) -> str:
         lines = []
@@ -389,7 +635,7 @@ Be concrete. If you don't know something, say so rather than being vague."""
     def _parse_executive_summary(self, response: str) -> ExecutiveSummary:
         """Parse LLM response into ExecutiveSummary."""
         import re
-        sections = self._split_by_headers(response)
+        sections = self._split_by_headers(response, EXECUTIVE_SUMMARY_HEADERS)
 
         # Extract key provisions as bullet points, parsing out section citations
         key_provisions = []  # Legacy plain text
@@ -443,7 +689,7 @@ Be concrete. If you don't know something, say so rather than being vague."""
         newest: list[dict],
     ) -> NavigationGuide:
         """Parse LLM response into NavigationGuide."""
-        sections = self._split_by_headers(response)
+        sections = self._split_by_headers(response, NAVIGATION_GUIDE_HEADERS)
         logger.debug(f"Parsed sections headers: {list(sections.keys())}")
 
         # Parse pathways
@@ -491,7 +737,7 @@ Be concrete. If you don't know something, say so rather than being vague."""
 
     def _parse_section_context(self, response: str) -> SectionContext:
         """Parse LLM response into SectionContext."""
-        sections = self._split_by_headers(response)
+        sections = self._split_by_headers(response, SECTION_CONTEXT_HEADERS)
 
         # Extract connections as bullet points
         connections = []
@@ -508,8 +754,12 @@ Be concrete. If you don't know something, say so rather than being vague."""
             amendment_story=sections.get("AMENDMENT STORY", "").strip() or None,
         )
 
-    def _split_by_headers(self, text: str) -> dict[str, str]:
-        """Split response text by headers (handles markdown formatting)."""
+    def _split_by_headers(
+        self,
+        text: str,
+        headers: frozenset[str] = _KNOWN_HEADERS,
+    ) -> dict[str, str]:
+        """Split response text on the given headers (handles markdown formatting)."""
         sections = {}
         current_header = None
         current_content = []
@@ -521,9 +771,10 @@ Be concrete. If you don't know something, say so rather than being vague."""
             stripped = stripped.lstrip("#").strip()  # Remove # headers
             stripped = stripped.strip("*").strip()   # Remove ** bold markers
             stripped = stripped.rstrip(":").strip()  # Remove trailing colon
+            stripped = stripped.strip("*").strip()   # **HEADLINE**: leaves ** after the colon
 
-            # Check if this is a header (all caps, possibly with colon)
-            if stripped.isupper() and len(stripped) > 2 and len(stripped) < 50:
+            # Only lines that are exactly one of the expected headers count
+            if stripped in headers:
                 if current_header:
                     sections[current_header] = "\n".join(current_content).strip()
                 current_header = stripped
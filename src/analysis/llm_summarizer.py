@@ -32,18 +32,40 @@ Usage:
 """
 from __future__ import annotations
 
+import hashlib
 import os
+import re
+import sqlite3
+import string
+import sys
 import time
 import asyncio
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Literal
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Final, Iterator, Literal
 
+import orjson
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-
-load_dotenv()
+from tenacity import (
+    AsyncRetrying,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+    wait_exponential_jitter,
+)
+
+# Only read .env when the key isn't already in the environment (set
+# LI_AUTOLOAD_DOTENV=0 to disable entirely, e.g. in containers)
+if os.environ.get("LI_AUTOLOAD_DOTENV", "1") == "1" and not os.environ.get("ANTHROPIC_API_KEY"):
+    load_dotenv()
 
 # Import Anthropic client - handle import error gracefully
 try:
@@ -53,6 +75,13 @@ except ImportError:
     ANTHROPIC_AVAILABLE = False
     anthropic = None
 
+# Transient API errors worth retrying, resolved once at import time
+if ANTHROPIC_AVAILABLE:
+    _RETRY_EXC = (anthropic.RateLimitError, anthropic.APIConnectionError)
+else:
+    _RETRY_EXC = (Exception,)
+
+from ..compat import DATACLASS_SLOTS
 from .text_diff import DiffResult, DiffChunk, ChunkType
 
 logger = logging.getLogger(__name__)
@@ -62,15 +91,55 @@ logger = logging.getLogger(__name__)
 # Configuration
 # =============================================================================
 
-DEFAULT_MODEL = "claude-sonnet-4-20250514"
-MAX_RETRIES = 3
-BASE_DELAY_SECONDS = 1.0
-MAX_DELAY_SECONDS = 30.0
-
-# Rate limiting: Anthropic has varying limits, we'll be conservative
-# Default tier: 50 requests/minute = ~0.83 requests/second
-# We'll use 1 request per 1.2 seconds to be safe
-REQUEST_INTERVAL_SECONDS = 1.2
+DEFAULT_MODEL: Final = "claude-sonnet-4-20250514"
+MAX_RETRIES: Final = 3
+BASE_DELAY_SECONDS: Final = 1.0
+MAX_DELAY_SECONDS: Final = 30.0
+# Longest server-requested Retry-After honored; a bogus header can't park a worker
+MAX_RETRY_AFTER_SECONDS: Final = 60.0
+
+# Rate limiting: Anthropic has varying limits, default tier is 50 requests/minute.
+# Requests are smoothed by a token bucket that allows short bursts.
+DEFAULT_REQUESTS_PER_MINUTE: Final = 50.0
+DEFAULT_BURST: Final = 5
+# Waits shorter than this yield to the event loop instead of scheduling a timer
+MIN_TIMER_SLEEP_SECONDS: Final = 0.001
+
+# Message Batches polling: start at the base interval and back off to the max
+BATCH_POLL_INTERVAL_SECONDS: Final = 10.0
+BATCH_MAX_POLL_INTERVAL_SECONDS: Final = 60.0
+
+# Outermost JSON object / array in an LLM response (skips markdown fences and
+# any stray prose around the payload)
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.DOTALL)
+
+# On-disk response cache (opt-in via AmendmentSummarizer(cache=True))
+DEFAULT_RESPONSE_CACHE_PATH = Path(__file__).parent.parent.parent / "data" / "cache" / "llm_responses.sqlite3"
+
+# Trivial changes are answered locally instead of calling the LLM
+TRIVIAL_SIMILARITY_THRESHOLD: Final = 0.98
+TRIVIAL_WORD_CHANGE_LIMIT: Final = 5
+# Bit i of a trivial-change mask means _TRIVIAL_KINDS[i]; lower bits take precedence
+_TRIVIAL_KINDS = ("empty", "technical", "renumbering")
+_RENUMBERING_BIT = 1 << _TRIVIAL_KINDS.index("renumbering")
+TRIVIAL_DESCRIPTIONS = {
+    "empty": "No substantive changes detected.",
+    "technical": "Technical amendment with minimal text changes (punctuation, formatting).",
+    "renumbering": "Renumbering or redesignation of subsections.",
+}
+
+# A line that is only a subsection label, e.g. "(a)" or "(12)"
+_SUBSECTION_LABEL_RE = re.compile(r'^\s*\([a-zA-Z0-9]+\)\s*$')
+
+# Concurrent (async) summarization: requests in flight at once, and worker
+# threads building prompts ahead of them
+DEFAULT_MAX_CONCURRENCY: Final = 10
+DEFAULT_PROMPT_WORKERS: Final = 4
+
+# Row marshaling: several diffs per prompt, capped by an estimated input budget
+MARSHALED_PROMPT_MAX_TOKENS: Final = 8000
+CHARS_PER_TOKEN: Final = 4
 
 
 # =============================================================================
@@ -165,6 +234,47 @@ class ChainSummary(BaseModel):
     )
 
 
+_CONFIDENCE_BY_NAME = {c.value: c for c in Confidence}
+
+
+@dataclass(**DATACLASS_SLOTS)
+class SummarizerStats:
+    """Running counts for an AmendmentSummarizer."""
+
+    total_summarized: int = 0
+    high_confidence: int = 0
+    medium_confidence: int = 0
+    low_confidence: int = 0
+    trivial_changes: int = 0
+    errors: int = 0
+
+    # AmendmentSummarizer.stats used to be a plain dict; keep stats["errors"],
+    # stats["errors"] += 1, dict(stats) and stats.items() working for callers
+    # written against it.
+
+    def __getitem__(self, key: str) -> int:
+        if key not in self.keys():
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: int) -> None:
+        if key not in self.keys():
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def keys(self) -> tuple[str, ...]:
+        return tuple(f.name for f in fields(self))
+
+    def items(self) -> list[tuple[str, int]]:
+        return [(key, getattr(self, key)) for key in self.keys()]
+
+
 class TrivialChangeResult(BaseModel):
     """Result for trivial/technical amendments that don't need full summarization."""
     change_type: Literal["renumbering", "technical", "conforming", "empty"]
@@ -194,7 +304,9 @@ Do NOT:
 - Speculate about legislative intent or political motivations
 - Make claims about practical effects without textual support
 - Use legal jargon unnecessarily
-- Make definitive statements when the change is ambiguous"""
+- Make definitive statements when the change is ambiguous
+
+Respond with raw JSON only - no markdown code fences and no text before or after it."""
 
 DIFF_SUMMARY_USER_TEMPLATE = """Summarize this statutory amendment:
 
@@ -220,6 +332,38 @@ Provide your analysis as JSON with these fields:
 
 Respond ONLY with valid JSON, no other text."""
 
+MARSHALED_SUMMARY_SYSTEM_PROMPT = DIFF_SUMMARY_SYSTEM_PROMPT + """
+
+You will be given several numbered diffs at once. Summarize each one
+independently; do not let one diff's content influence another's summary."""
+
+MARSHALED_ROW_TEMPLATE = """CONTEXT:
+- Section: {section_id} ({section_name})
+- Amended by: {public_law_id} ({public_law_title})
+
+DIFF STATISTICS:
+- Similarity score: {similarity_score:.1%}
+- Words added: {words_added}
+- Words removed: {words_removed}
+- Subsections affected: {paragraphs_affected}
+- Technical summary: {technical_summary}
+
+CHANGES DETECTED:
+{changes_text}"""
+
+MARSHALED_SUMMARY_USER_TEMPLATE = """Summarize each of these {count} statutory amendments:
+
+{rows}
+
+Provide your analysis as a JSON array with one object per diff, each with these fields:
+- index: the DIFF number
+- summary: 1-2 sentence plain English description
+- confidence: "high", "medium", or "low"
+- key_changes: list of bullet points (max 5)
+- is_technical: true if this is just renumbering/conforming amendments
+
+Respond ONLY with a valid JSON array, no other text."""
+
 CHAIN_SUMMARY_SYSTEM_PROMPT = """You are a legislative historian describing how a statute
 has evolved over time through multiple amendments.
 
@@ -230,7 +374,9 @@ Guidelines:
 1. Note the overall direction: expansion, contraction, clarification, etc.
 2. Highlight significant turning points
 3. Use hedging language - you're interpreting text changes, not legislative intent
-4. Keep the narrative accessible to non-lawyers"""
+4. Keep the narrative accessible to non-lawyers
+
+Respond with raw JSON only - no markdown code fences and no text before or after it."""
 
 CHAIN_SUMMARY_USER_TEMPLATE = """Create a narrative summary of how this section has evolved:
 
@@ -246,38 +392,156 @@ Provide your analysis as JSON with these fields:
 Respond ONLY with valid JSON, no other text."""
 
 
+def _compile_template(template: str) -> Callable[..., str]:
+    """
+    Parse a str.format template once and return a renderer for it.
+
+    The renderer only formats the field values and joins the pre-split
+    literal text, instead of re-parsing the braces on every call.
+    """
+    parts: list[tuple[str | None, str]] = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if literal:
+            parts.append((None, literal))
+        if field is not None:
+            if conversion or not field.isidentifier():
+                raise ValueError(f"Unsupported template field: {field!r}")
+            parts.append((field, spec))
+
+    def render(**fields) -> str:
+        return "".join(
+            text if field is None else format(fields[field], text)
+            for field, text in parts
+        )
+
+    return render
+
+
+_render_diff_summary_prompt = _compile_template(DIFF_SUMMARY_USER_TEMPLATE)
+_render_marshaled_row = _compile_template(MARSHALED_ROW_TEMPLATE)
+_render_marshaled_summary_prompt = _compile_template(MARSHALED_SUMMARY_USER_TEMPLATE)
+_render_chain_summary_prompt = _compile_template(CHAIN_SUMMARY_USER_TEMPLATE)
+
+
 # =============================================================================
 # Rate Limiter
 # =============================================================================
 
 
 class RateLimiter:
-    """Simple token bucket rate limiter for API calls."""
+    """
+    Token bucket rate limiter for API calls.
 
-    def __init__(self, requests_per_minute: float = 50.0):
+    Tokens refill at requests_per_minute and up to `burst` requests may go
+    out back to back. A single instance can be shared by sync and async
+    callers across threads (see shared_rate_limiter).
+    """
+
+    __slots__ = ("min_interval", "burst", "tokens", "last_request_time", "_state_lock")
+
+    def __init__(self, requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE, burst: int = 1):
         self.min_interval = 60.0 / requests_per_minute
-        self.last_request_time = 0.0
-        self._lock = asyncio.Lock() if asyncio.get_event_loop().is_running() else None
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last_request_time = time.monotonic()
+        self._state_lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Take a token and return how long to wait before using it.
+
+        Tokens may go negative: each caller reserves the next free slot
+        here, then sleeps outside the lock, so waiting callers don't
+        serialize on the lock while they sleep.
+        """
+        with self._state_lock:
+            now = time.monotonic()
+            elapsed = now - self.last_request_time
+            self.tokens = min(float(self.burst), self.tokens + elapsed / self.min_interval)
+            self.last_request_time = now
+            self.tokens -= 1.0
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens * self.min_interval
 
     def wait(self) -> None:
         """Synchronous wait to respect rate limit."""
-        now = time.time()
-        elapsed = now - self.last_request_time
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
-        self.last_request_time = time.time()
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
 
     async def wait_async(self) -> None:
         """Asynchronous wait to respect rate limit."""
-        if self._lock is None:
-            self._lock = asyncio.Lock()
+        # _reserve never blocks for long, so no asyncio lock is needed (one
+        # would also tie the limiter to whichever event loop used it first)
+        delay = self._reserve()
+        if delay <= 0:
+            return
+        if delay < MIN_TIMER_SLEEP_SECONDS:
+            # Not worth a timer; just yield to the event loop
+            await asyncio.sleep(0)
+        else:
+            await asyncio.sleep(delay)
+
+
+@lru_cache(maxsize=None)
+def shared_rate_limiter(
+    requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+    burst: int = DEFAULT_BURST,
+) -> RateLimiter:
+    """
+    Process-wide rate limiter for a given rate.
 
-        async with self._lock:
-            now = time.time()
-            elapsed = now - self.last_request_time
-            if elapsed < self.min_interval:
-                await asyncio.sleep(self.min_interval - elapsed)
-            self.last_request_time = time.time()
+    BillNarrator and AmendmentSummarizer draw from the same API quota, so
+    they share one bucket instead of each pacing itself independently.
+    """
+    return RateLimiter(requests_per_minute, burst=burst)
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of LLM responses.
+
+    Keys are content hashes of (model, system prompt, user prompt), so any
+    change to the prompt or model misses the cache. Safe to share across
+    threads.
+    """
+
+    def __init__(self, path: Path | str = DEFAULT_RESPONSE_CACHE_PATH):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, user_prompt: str) -> str:
+        digest = hashlib.blake2b(digest_size=32)
+        for part in (model, system_prompt, user_prompt):
+            digest.update(part.encode())
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, response: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)", (key, response)
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
 
 
 # =============================================================================
@@ -306,11 +570,25 @@ class AmendmentSummarizer:
         print(result.summary)
     """
 
+    __slots__ = (
+        "model",
+        "api_key",
+        "client",
+        "async_client",
+        "rate_limiter",
+        "rows_per_prompt",
+        "response_cache",
+        "stats",
+    )
+
     def __init__(
         self,
         model: str = DEFAULT_MODEL,
         api_key: str | None = None,
-        requests_per_minute: float = 50.0,
+        requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+        rows_per_prompt: int = 1,
+        cache: bool = False,
+        cache_path: Path | str = DEFAULT_RESPONSE_CACHE_PATH,
     ):
         """
         Initialize the summarizer.
@@ -318,7 +596,11 @@ class AmendmentSummarizer:
         Args:
             model: Claude model to use (default: claude-sonnet-4-20250514)
             api_key: Anthropic API key (or uses ANTHROPIC_API_KEY env var)
-            requests_per_minute: Rate limit for API calls
+            requests_per_minute: Rate limit for API calls (shared process-wide)
+            rows_per_prompt: Diffs packed into one prompt by batch_summarize
+                (1 = one call per diff)
+            cache: Reuse responses for identical prompts from an on-disk cache
+            cache_path: SQLite file for the response cache
         """
         if not ANTHROPIC_AVAILABLE:
             raise ImportError(
@@ -336,17 +618,13 @@ class AmendmentSummarizer:
             )
 
         self.client = anthropic.Anthropic(api_key=self.api_key)
-        self.rate_limiter = RateLimiter(requests_per_minute)
+        self.async_client = anthropic.AsyncAnthropic(api_key=self.api_key)
+        self.rate_limiter = shared_rate_limiter(requests_per_minute)
+        self.rows_per_prompt = max(1, rows_per_prompt)
+        self.response_cache = ResponseCache(cache_path) if cache else None
 
         # Track statistics
-        self.stats = {
-            "total_summarized": 0,
-            "high_confidence": 0,
-            "medium_confidence": 0,
-            "low_confidence": 0,
-            "trivial_changes": 0,
-            "errors": 0,
-        }
+        self.stats = SummarizerStats()
 
     def summarize_diff(
         self,
@@ -363,33 +641,18 @@ class AmendmentSummarizer:
         Returns:
             SummaryResult with LLM-generated summary, or TrivialChangeResult if trivial
         """
-        section_id = context.get("section_id", "Unknown section")
-        section_name = context.get("section_name", "")
-        public_law_id = context.get("public_law_id", "Unknown law")
-        public_law_title = context.get("public_law_title", "")
-
         # Handle trivial cases without LLM call
         trivial_result = self._check_trivial_change(diff_result, context)
         if trivial_result:
-            self.stats["trivial_changes"] += 1
+            self.stats.trivial_changes += 1
             return trivial_result
 
-        # Build changes text for the prompt
-        changes_text = self._format_changes_for_prompt(diff_result)
+        return self._summarize_nontrivial(diff_result, context)
 
-        # Build the user prompt
-        user_prompt = DIFF_SUMMARY_USER_TEMPLATE.format(
-            section_id=section_id,
-            section_name=section_name or "untitled section",
-            public_law_id=public_law_id,
-            public_law_title=public_law_title or "untitled",
-            similarity_score=diff_result.similarity_score,
-            words_added=diff_result.words_added,
-            words_removed=diff_result.words_removed,
-            paragraphs_affected=diff_result.paragraphs_affected,
-            technical_summary=diff_result.summary,
-            changes_text=changes_text,
-        )
+    def _summarize_nontrivial(self, diff_result: DiffResult, context: dict) -> SummaryResult:
+        """Summarize one diff with the LLM (trivial checks already done)."""
+        section_id = context.get("section_id", "Unknown section")
+        user_prompt = self._build_diff_prompt(diff_result, context)
 
         # Make the API call with rate limiting and retries
         try:
@@ -400,28 +663,53 @@ class AmendmentSummarizer:
 
             # Parse the response
             result = self._parse_summary_response(response, diff_result, context)
-
-            # Update stats
-            self.stats["total_summarized"] += 1
-            self.stats[f"{result.confidence.value}_confidence"] += 1
-
+            self._record_result(result)
             return result
 
         except Exception as e:
             logger.error(f"Error summarizing diff for {section_id}: {e}")
-            self.stats["errors"] += 1
+            self.stats.errors += 1
+            return self._fallback_summary(diff_result, context)
 
-            # Return a fallback result
-            return SummaryResult(
-                summary=f"Unable to generate summary: {diff_result.summary}",
-                confidence=Confidence.LOW,
-                key_changes=[],
-                hedging_note="Automatic summarization failed. Technical diff summary shown instead.",
-                raw_diff_summary=diff_result.summary,
-                section_id=section_id,
-                public_law_id=public_law_id,
+    async def summarize_diff_async(
+        self,
+        diff_result: DiffResult,
+        context: dict,
+    ) -> SummaryResult | TrivialChangeResult:
+        """Async version of summarize_diff."""
+        trivial_result = self._check_trivial_change(diff_result, context)
+        if trivial_result:
+            self.stats.trivial_changes += 1
+            return trivial_result
+
+        return await self._summarize_nontrivial_async(
+            diff_result, context, self._build_diff_prompt(diff_result, context)
+        )
+
+    async def _summarize_nontrivial_async(
+        self,
+        diff_result: DiffResult,
+        context: dict,
+        user_prompt: str,
+    ) -> SummaryResult:
+        """Summarize one diff with the LLM from an already-built prompt."""
+        section_id = context.get("section_id", "Unknown section")
+
+        try:
+            response = await self._call_api_async(
+                system_prompt=DIFF_SUMMARY_SYSTEM_PROMPT,
+                user_prompt=user_prompt,
             )
 
+            result = self._parse_summary_response(response, diff_result, context)
+            self._record_result(result)
+            return result
+
+        except Exception as e:
+            logger.error(f"Error summarizing diff for {section_id}: {e}")
+            self.stats.errors += 1
+            return self._fallback_summary(diff_result, context)
+
     def summarize_amendment_chain(
         self,
         amendments: list[dict],
@@ -462,12 +750,15 @@ class AmendmentSummarizer:
 
         # Format amendments for prompt
         amendments_text = "\n".join([
-            f"- {amend.get('date', 'Unknown date')}: {amend.get('public_law_id', 'Unknown')}\n"
-            f"  {amend.get('summary', 'No summary available')}"
+            "- %s: %s\n  %s" % (
+                amend.get("date", "Unknown date"),
+                amend.get("public_law_id", "Unknown"),
+                amend.get("summary", "No summary available"),
+            )
             for amend in amendments
         ])
 
-        user_prompt = CHAIN_SUMMARY_USER_TEMPLATE.format(
+        user_prompt = _render_chain_summary_prompt(
             section_id=section_id,
             section_name=section_name or "untitled section",
             amendments_text=amendments_text,
@@ -504,17 +795,177 @@ class AmendmentSummarizer:
         """
         Efficiently summarize multiple diffs.
 
+        With rows_per_prompt > 1, non-trivial diffs are packed into shared
+        prompts (up to MARSHALED_PROMPT_MAX_TOKENS) and the model returns one
+        JSON object per diff. Diffs that don't fit, or that are missing from
+        the response, get their own call.
+
         Args:
             items: List of (DiffResult, context) tuples
 
         Returns:
             List of SummaryResult or TrivialChangeResult objects
         """
-        results = []
+        results = self._resolve_trivial(items)
+
+        if self.rows_per_prompt == 1:
+            for i, (diff_result, context) in enumerate(items):
+                if results[i] is None:
+                    results[i] = self._summarize_nontrivial(diff_result, context)
+            return results
+
+        budget = MARSHALED_PROMPT_MAX_TOKENS * CHARS_PER_TOKEN
+        group: list[tuple[int, str]] = []
+        group_chars = 0
+
+        for i, (diff_result, context) in enumerate(items):
+            if results[i] is not None:
+                continue
+
+            row = self._build_marshaled_row(diff_result, context)
+            if group and (len(group) == self.rows_per_prompt or group_chars + len(row) > budget):
+                self._summarize_marshaled(group, items, results)
+                group, group_chars = [], 0
+            group.append((i, row))
+            group_chars += len(row)
+
+        if group:
+            self._summarize_marshaled(group, items, results)
 
-        for diff_result, context in items:
-            result = self.summarize_diff(diff_result, context)
-            results.append(result)
+        # Single-row fallback for anything a marshaled call didn't cover
+        for i, (diff_result, context) in enumerate(items):
+            if results[i] is None:
+                results[i] = self._summarize_nontrivial(diff_result, context)
+
+        return results
+
+    async def batch_summarize_async(
+        self,
+        items: list[tuple[DiffResult, dict]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        prompt_workers: int = DEFAULT_PROMPT_WORKERS,
+    ) -> list[SummaryResult | TrivialChangeResult]:
+        """
+        Summarize multiple diffs concurrently.
+
+        Trivial diffs are resolved up front. Prompts for the rest are built
+        on a thread pool so formatting overlaps with in-flight API calls.
+        Up to max_concurrency requests are in flight at once; the shared
+        rate limiter still gates how fast they are submitted.
+
+        Args:
+            items: List of (DiffResult, context) tuples
+            max_concurrency: Maximum simultaneous API calls
+            prompt_workers: Threads building prompts
+
+        Returns:
+            List of SummaryResult or TrivialChangeResult objects, in input order
+        """
+        results = self._resolve_trivial(items)
+        sem = asyncio.Semaphore(max_concurrency)
+        loop = asyncio.get_running_loop()
+
+        with ThreadPoolExecutor(max_workers=prompt_workers) as pool:
+            async def _one(i: int) -> None:
+                diff_result, context = items[i]
+                user_prompt = await loop.run_in_executor(
+                    pool, self._build_diff_prompt, diff_result, context
+                )
+                async with sem:
+                    results[i] = await self._summarize_nontrivial_async(
+                        diff_result, context, user_prompt
+                    )
+
+            await asyncio.gather(*(_one(i) for i, result in enumerate(results) if result is None))
+
+        return results
+
+    def batch_summarize_concurrent(
+        self,
+        items: list[tuple[DiffResult, dict]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        prompt_workers: int = DEFAULT_PROMPT_WORKERS,
+    ) -> list[SummaryResult | TrivialChangeResult]:
+        """Blocking wrapper around batch_summarize_async (not for use inside an event loop)."""
+        return asyncio.run(self.batch_summarize_async(items, max_concurrency, prompt_workers))
+
+    def batch_summarize_api(
+        self,
+        items: list[tuple[DiffResult, dict]],
+        poll_interval: float = BATCH_POLL_INTERVAL_SECONDS,
+    ) -> list[SummaryResult | TrivialChangeResult]:
+        """
+        Summarize multiple diffs through the Message Batches API.
+
+        Trivial changes are resolved locally; everything else is submitted
+        as a single batch and polled until it ends. Batches cost about half
+        as much as individual calls but may take minutes to hours, so use
+        batch_summarize when results are needed interactively.
+
+        Args:
+            items: List of (DiffResult, context) tuples
+            poll_interval: Initial seconds between status checks (backs off)
+
+        Returns:
+            List of SummaryResult or TrivialChangeResult objects, in input order
+        """
+        results = self._resolve_trivial(items)
+        requests = []
+
+        for i, (diff_result, context) in enumerate(items):
+            if results[i] is not None:
+                continue
+
+            requests.append({
+                "custom_id": f"diff-{i}",
+                "params": {
+                    "model": self.model,
+                    "max_tokens": 1024,
+                    "system": DIFF_SUMMARY_SYSTEM_PROMPT,
+                    "messages": [
+                        {"role": "user", "content": self._build_diff_prompt(diff_result, context)}
+                    ],
+                },
+            })
+
+        if not requests:
+            return results
+
+        try:
+            batch = self.client.messages.batches.create(requests=requests)
+
+            delay = poll_interval
+            while batch.processing_status != "ended":
+                time.sleep(delay)
+                delay = min(delay * 2, BATCH_MAX_POLL_INTERVAL_SECONDS)
+                batch = self.client.messages.batches.retrieve(batch.id)
+
+            for entry in self.client.messages.batches.results(batch.id):
+                i = int(entry.custom_id.removeprefix("diff-"))
+                diff_result, context = items[i]
+
+                if entry.result.type != "succeeded":
+                    logger.error(
+                        f"Batch request failed for {context.get('section_id', 'Unknown section')}: "
+                        f"{entry.result.type}"
+                    )
+                    self.stats.errors += 1
+                    results[i] = self._fallback_summary(diff_result, context)
+                    continue
+
+                result = self._parse_summary_response(
+                    entry.result.message.content[0].text, diff_result, context
+                )
+                self._record_result(result)
+                results[i] = result
+
+        except Exception as e:
+            logger.error(f"Batch summarization failed, falling back to sequential calls: {e}")
+
+        # Anything the batch didn't resolve goes through the regular path
+        for i, (diff_result, context) in enumerate(items):
+            if results[i] is None:
+                results[i] = self._summarize_nontrivial(diff_result, context)
 
         return results
 
@@ -522,53 +973,186 @@ class AmendmentSummarizer:
     # Private Methods
     # =========================================================================
 
+    def classify_trivial_bulk(self, diffs: list[DiffResult]) -> list[str | None]:
+        """
+        Classify many diffs as trivial in one pass.
+
+        The cheap numeric checks run column-wise over all diffs first; only
+        diffs that survive them get the per-modification renumbering scan.
+
+        Returns:
+            Per diff, the TrivialChangeResult change_type ("empty",
+            "technical", "renumbering") or None if it needs the LLM
+        """
+        has_changes = [d.has_changes for d in diffs]
+        similarity = [d.similarity_score for d in diffs]
+        word_change = [d.words_added + d.words_removed for d in diffs]
+
+        # One mask per diff: bit 0 = empty, bit 1 = technical (very high
+        # similarity with punctuation/whitespace-sized edits)
+        masks = [
+            (not changed)
+            | ((sim > TRIVIAL_SIMILARITY_THRESHOLD and words < TRIVIAL_WORD_CHANGE_LIMIT) << 1)
+            for changed, sim, words in zip(has_changes, similarity, word_change)
+        ]
+
+        kinds: list[str | None] = []
+        for diff_result, mask in zip(diffs, masks):
+            if not mask and self._is_renumbering(diff_result):
+                mask = _RENUMBERING_BIT
+            # Lowest set bit wins
+            kinds.append(_TRIVIAL_KINDS[(mask & -mask).bit_length() - 1] if mask else None)
+
+        return kinds
+
     def _check_trivial_change(
         self,
         diff_result: DiffResult,
         context: dict,
     ) -> TrivialChangeResult | None:
         """Check if this is a trivial change that doesn't need LLM summarization."""
-        section_id = context.get("section_id")
-        public_law_id = context.get("public_law_id")
+        return self._trivial_result(self.classify_trivial_bulk([diff_result])[0], context)
+
+    def _trivial_result(self, kind: str | None, context: dict) -> TrivialChangeResult | None:
+        """Build the TrivialChangeResult for a classify_trivial_bulk label."""
+        if kind is None:
+            return None
+        return TrivialChangeResult(
+            change_type=kind,
+            description=TRIVIAL_DESCRIPTIONS[kind],
+            section_id=context.get("section_id"),
+            public_law_id=context.get("public_law_id"),
+        )
 
-        # Empty diff
-        if not diff_result.has_changes:
-            return TrivialChangeResult(
-                change_type="empty",
-                description="No substantive changes detected.",
-                section_id=section_id,
-                public_law_id=public_law_id,
-            )
+    def _resolve_trivial(
+        self,
+        items: list[tuple[DiffResult, dict]],
+    ) -> list[SummaryResult | TrivialChangeResult | None]:
+        """Results list with trivial diffs filled in and the rest left as None."""
+        kinds = self.classify_trivial_bulk([diff_result for diff_result, _ in items])
+        results: list[SummaryResult | TrivialChangeResult | None] = []
+        for (_, context), kind in zip(items, kinds):
+            if kind is not None:
+                self.stats.trivial_changes += 1
+            results.append(self._trivial_result(kind, context))
+        return results
 
-        # Very high similarity with only minor modifications
-        if diff_result.similarity_score > 0.98:
-            # Check if it's just punctuation or whitespace
-            total_word_change = diff_result.words_added + diff_result.words_removed
-            if total_word_change < 5:
-                return TrivialChangeResult(
-                    change_type="technical",
-                    description="Technical amendment with minimal text changes (punctuation, formatting).",
-                    section_id=section_id,
-                    public_law_id=public_law_id,
-                )
+    def _build_diff_prompt(self, diff_result: DiffResult, context: dict) -> str:
+        """Build the user prompt for summarizing one diff."""
+        return _render_diff_summary_prompt(
+            section_id=context.get("section_id", "Unknown section"),
+            section_name=context.get("section_name", "") or "untitled section",
+            public_law_id=context.get("public_law_id", "Unknown law"),
+            public_law_title=context.get("public_law_title", "") or "untitled",
+            similarity_score=diff_result.similarity_score,
+            words_added=diff_result.words_added,
+            words_removed=diff_result.words_removed,
+            paragraphs_affected=diff_result.paragraphs_affected,
+            technical_summary=diff_result.summary,
+            changes_text=self._format_changes_for_prompt(diff_result),
+        )
 
-        # Check for renumbering patterns
-        if self._is_renumbering(diff_result):
-            return TrivialChangeResult(
-                change_type="renumbering",
-                description="Renumbering or redesignation of subsections.",
-                section_id=section_id,
-                public_law_id=public_law_id,
-            )
+    def _build_marshaled_row(self, diff_result: DiffResult, context: dict) -> str:
+        """Format one diff for a marshaled prompt (numbered when the prompt is built)."""
+        return _render_marshaled_row(
+            section_id=context.get("section_id", "Unknown section"),
+            section_name=context.get("section_name", "") or "untitled section",
+            public_law_id=context.get("public_law_id", "Unknown law"),
+            public_law_title=context.get("public_law_title", "") or "untitled",
+            similarity_score=diff_result.similarity_score,
+            words_added=diff_result.words_added,
+            words_removed=diff_result.words_removed,
+            paragraphs_affected=diff_result.paragraphs_affected,
+            technical_summary=diff_result.summary,
+            changes_text=self._format_changes_for_prompt(diff_result),
+        )
+
+    def _summarize_marshaled(
+        self,
+        group: list[tuple[int, str]],
+        items: list[tuple[DiffResult, dict]],
+        results: list,
+    ) -> None:
+        """
+        Summarize a group of diffs with one API call, filling results in place.
 
-        return None
+        Groups of one, failed calls and diffs missing from the response are
+        left as None for the single-row fallback.
+        """
+        if len(group) == 1:
+            return
+
+        user_prompt = _render_marshaled_summary_prompt(
+            count=len(group),
+            rows="\n\n".join(
+                f"### DIFF {position}\n\n{row}" for position, (_, row) in enumerate(group, start=1)
+            ),
+        )
+
+        try:
+            response = self._call_api(
+                system_prompt=MARSHALED_SUMMARY_SYSTEM_PROMPT,
+                user_prompt=user_prompt,
+            )
+            rows = _load_json(response, _JSON_ARRAY_RE)
+        except Exception as e:
+            logger.warning(f"Marshaled summary of {len(group)} diffs failed, retrying individually: {e}")
+            return
+
+        if not isinstance(rows, list):
+            logger.warning("Marshaled summary response was not a JSON array, retrying individually")
+            return
+
+        by_index = {}
+        for row in rows:
+            if not isinstance(row, dict):
+                continue
+            # The model sometimes answers "index": "1"
+            try:
+                by_index[int(row.get("index"))] = row
+            except (TypeError, ValueError):
+                continue
+
+        for position, (i, _) in enumerate(group, start=1):
+            data = by_index.get(position)
+            if data is None:
+                continue
+            diff_result, context = items[i]
+            try:
+                result = self._summary_from_data(data, diff_result, context)
+            except Exception as e:
+                # Leave it for the single-row retry rather than failing the batch
+                logger.warning(f"Malformed row {position} in marshaled summary, retrying individually: {e}")
+                continue
+            self._record_result(result)
+            results[i] = result
+
+    def _record_result(self, result: SummaryResult) -> None:
+        """Update stats for a successfully parsed summary."""
+        stats = self.stats
+        stats.total_summarized += 1
+        if result.confidence is Confidence.HIGH:
+            stats.high_confidence += 1
+        elif result.confidence is Confidence.MEDIUM:
+            stats.medium_confidence += 1
+        else:
+            stats.low_confidence += 1
+
+    def _fallback_summary(self, diff_result: DiffResult, context: dict) -> SummaryResult:
+        """Result returned when the LLM call fails."""
+        return SummaryResult(
+            summary=f"Unable to generate summary: {diff_result.summary}",
+            confidence=Confidence.LOW,
+            key_changes=[],
+            hedging_note="Automatic summarization failed. Technical diff summary shown instead.",
+            raw_diff_summary=diff_result.summary,
+            section_id=context.get("section_id", "Unknown section"),
+            public_law_id=context.get("public_law_id", "Unknown law"),
+        )
 
     def _is_renumbering(self, diff_result: DiffResult) -> bool:
         """Check if the diff represents just renumbering of subsections."""
         # Look for patterns like (a) -> (b), (1) -> (2)
-        import re
-        subsection_pattern = re.compile(r'^\s*\([a-zA-Z0-9]+\)\s*$')
-
         renumber_count = 0
         total_changes = len(diff_result.modifications)
 
@@ -580,7 +1164,7 @@ class AmendmentSummarizer:
             new = mod.text.strip()
 
             # Check if both old and new are just subsection labels
-            if subsection_pattern.match(old) and subsection_pattern.match(new):
+            if _SUBSECTION_LABEL_RE.match(old) and _SUBSECTION_LABEL_RE.match(new):
                 renumber_count += 1
 
         # If more than 80% of modifications are just renumbering
@@ -588,37 +1172,31 @@ class AmendmentSummarizer:
 
     def _format_changes_for_prompt(self, diff_result: DiffResult) -> str:
         """Format the diff changes into text for the LLM prompt."""
-        lines = []
-
-        if diff_result.additions:
-            lines.append("ADDITIONS:")
-            for chunk in diff_result.additions[:10]:  # Limit to avoid huge prompts
-                subsection = f" [in {chunk.subsection}]" if chunk.subsection else ""
-                lines.append(f"  + {chunk.text[:500]}{subsection}")
-
-        if diff_result.deletions:
-            lines.append("\nDELETIONS:")
-            for chunk in diff_result.deletions[:10]:
-                subsection = f" [in {chunk.subsection}]" if chunk.subsection else ""
-                lines.append(f"  - {chunk.text[:500]}{subsection}")
-
-        if diff_result.modifications:
-            lines.append("\nMODIFICATIONS:")
-            for chunk in diff_result.modifications[:10]:
-                subsection = f" [in {chunk.subsection}]" if chunk.subsection else ""
-                lines.append(f"  OLD: {(chunk.old_text or '')[:250]}")
-                lines.append(f"  NEW: {chunk.text[:250]}{subsection}")
-                lines.append("")
-
-        return "\n".join(lines) if lines else "No detailed changes available."
+        # Only the first 10 chunks of each kind are shown, clipped to the
+        # lengths the prompt uses (avoids huge prompts), so that is the whole
+        # cache key
+        return _format_changes(
+            tuple((_clip(c.text, 500), c.subsection) for c in islice(diff_result.additions, 10)),
+            tuple((_clip(c.text, 500), c.subsection) for c in islice(diff_result.deletions, 10)),
+            tuple(
+                (_clip(c.old_text or "", 250), _clip(c.text, 250), c.subsection)
+                for c in islice(diff_result.modifications, 10)
+            ),
+        )
 
     @retry(
         stop=stop_after_attempt(MAX_RETRIES),
         wait=wait_exponential(multiplier=BASE_DELAY_SECONDS, max=MAX_DELAY_SECONDS),
-        retry=retry_if_exception_type((anthropic.RateLimitError, anthropic.APIConnectionError)) if ANTHROPIC_AVAILABLE else (Exception,),
+        retry=retry_if_exception_type(_RETRY_EXC),
     )
     def _call_api(self, system_prompt: str, user_prompt: str) -> str:
         """Make an API call with rate limiting and retries."""
+        cache_key = self._cache_key(system_prompt, user_prompt)
+        if cache_key:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         self.rate_limiter.wait()
 
         message = self.client.messages.create(
@@ -630,7 +1208,53 @@ class AmendmentSummarizer:
             ]
         )
 
-        return message.content[0].text
+        text = message.content[0].text
+        if cache_key:
+            self.response_cache.set(cache_key, text)
+        return text
+
+    async def _call_api_async(self, system_prompt: str, user_prompt: str) -> str:
+        """
+        Make an async API call with rate limiting and retries.
+
+        Retries back off exponentially with jitter (so concurrent callers
+        don't retry in lockstep), or wait as long as a rate-limit
+        response's Retry-After header asks.
+        """
+        cache_key = self._cache_key(system_prompt, user_prompt)
+        if cache_key:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(MAX_RETRIES),
+            wait=_wait_retry_after_or_jitter,
+            retry=retry_if_exception_type(_RETRY_EXC),
+            reraise=True,
+        ):
+            with attempt:
+                await self.rate_limiter.wait_async()
+
+                message = await self.async_client.messages.create(
+                    model=self.model,
+                    max_tokens=1024,
+                    system=system_prompt,
+                    messages=[
+                        {"role": "user", "content": user_prompt}
+                    ]
+                )
+
+        text = message.content[0].text
+        if cache_key:
+            self.response_cache.set(cache_key, text)
+        return text
+
+    def _cache_key(self, system_prompt: str, user_prompt: str) -> str | None:
+        """Response cache key for a prompt, or None when caching is off."""
+        if self.response_cache is None:
+            return None
+        return ResponseCache.make_key(self.model, system_prompt, user_prompt)
 
     def _parse_summary_response(
         self,
@@ -639,53 +1263,15 @@ class AmendmentSummarizer:
         context: dict,
     ) -> SummaryResult:
         """Parse the LLM response into a SummaryResult."""
-        import json
-
         section_id = context.get("section_id")
         public_law_id = context.get("public_law_id")
 
         try:
-            # Try to extract JSON from the response
-            # Handle potential markdown code blocks
-            response_text = response.strip()
-            if response_text.startswith("```"):
-                # Remove markdown code blocks
-                lines = response_text.split("\n")
-                response_text = "\n".join(
-                    line for line in lines
-                    if not line.startswith("```")
-                )
-
-            data = json.loads(response_text)
-
-            # Map confidence string to enum
-            confidence_str = data.get("confidence", "medium").lower()
-            confidence_map = {
-                "high": Confidence.HIGH,
-                "medium": Confidence.MEDIUM,
-                "low": Confidence.LOW,
-            }
-            confidence = confidence_map.get(confidence_str, Confidence.MEDIUM)
-
-            # Build key changes list
-            key_changes = data.get("key_changes", [])
-            if isinstance(key_changes, str):
-                key_changes = [key_changes]
+            data = _load_json(response, _JSON_OBJECT_RE)
 
-            # Determine hedging note based on confidence
-            hedging_note = self._generate_hedging_note(confidence, diff_result)
-
-            return SummaryResult(
-                summary=data.get("summary", diff_result.summary),
-                confidence=confidence,
-                key_changes=key_changes[:5],  # Cap at 5
-                hedging_note=hedging_note,
-                raw_diff_summary=diff_result.summary,
-                section_id=section_id,
-                public_law_id=public_law_id,
-            )
+            return self._summary_from_data(data, diff_result, context)
 
-        except (json.JSONDecodeError, KeyError) as e:
+        except (orjson.JSONDecodeError, KeyError) as e:
             logger.warning(f"Failed to parse LLM response as JSON: {e}")
 
             # Fallback: use the raw response as summary
@@ -699,6 +1285,37 @@ class AmendmentSummarizer:
                 public_law_id=public_law_id,
             )
 
+    def _summary_from_data(
+        self,
+        data: dict,
+        diff_result: DiffResult,
+        context: dict,
+    ) -> SummaryResult:
+        """Build a SummaryResult from one parsed JSON summary object."""
+        # Map confidence string to enum (the model usually answers in lowercase)
+        confidence_str = data.get("confidence", "medium")
+        confidence = _CONFIDENCE_BY_NAME.get(confidence_str)
+        if confidence is None:
+            confidence = _CONFIDENCE_BY_NAME.get(confidence_str.lower(), Confidence.MEDIUM)
+
+        # Build key changes list
+        key_changes = data.get("key_changes", [])
+        if isinstance(key_changes, str):
+            key_changes = [key_changes]
+
+        # Determine hedging note based on confidence
+        hedging_note = self._generate_hedging_note(confidence, diff_result)
+
+        return SummaryResult(
+            summary=data.get("summary", diff_result.summary),
+            confidence=confidence,
+            key_changes=key_changes[:5],  # Cap at 5
+            hedging_note=hedging_note,
+            raw_diff_summary=diff_result.summary,
+            section_id=context.get("section_id"),
+            public_law_id=context.get("public_law_id"),
+        )
+
     def _parse_chain_response(
         self,
         response: str,
@@ -707,18 +1324,8 @@ class AmendmentSummarizer:
         section_name: str | None,
     ) -> ChainSummary:
         """Parse the LLM response for chain summary."""
-        import json
-
         try:
-            response_text = response.strip()
-            if response_text.startswith("```"):
-                lines = response_text.split("\n")
-                response_text = "\n".join(
-                    line for line in lines
-                    if not line.startswith("```")
-                )
-
-            data = json.loads(response_text)
+            data = _load_json(response, _JSON_OBJECT_RE)
 
             return ChainSummary(
                 section_id=section_id,
@@ -729,7 +1336,7 @@ class AmendmentSummarizer:
                 overall_trend=data.get("overall_trend"),
             )
 
-        except (json.JSONDecodeError, KeyError) as e:
+        except (orjson.JSONDecodeError, KeyError) as e:
             logger.warning(f"Failed to parse chain summary response: {e}")
 
             return ChainSummary(
@@ -746,37 +1353,128 @@ class AmendmentSummarizer:
         diff_result: DiffResult,
     ) -> str:
         """Generate appropriate hedging language based on confidence."""
-        if confidence == Confidence.HIGH:
-            return "Based on text comparison; legislative intent may differ from textual changes."
-
-        elif confidence == Confidence.MEDIUM:
-            if diff_result.change_magnitude == "substantial":
-                return (
-                    "This summary is based on text analysis of substantial changes. "
-                    "The actual scope and effect of the amendment may be broader or "
-                    "narrower than what the text comparison suggests."
-                )
-            else:
-                return (
-                    "Based on text comparison. Some aspects of this amendment "
-                    "may not be fully captured by the textual analysis."
-                )
+        return _hedging_note(
+            confidence,
+            diff_result.change_magnitude,
+            diff_result.paragraphs_affected > 5,
+            diff_result.similarity_score < 0.5,
+        )
+
+
+# =============================================================================
+# Parsing and Formatting Helpers
+# =============================================================================
+
+
+_jitter_wait = wait_exponential_jitter(initial=BASE_DELAY_SECONDS, max=MAX_DELAY_SECONDS)
+
 
-        else:  # LOW
-            reasons = []
-            if diff_result.change_magnitude == "major":
-                reasons.append("extensive restructuring")
-            if diff_result.paragraphs_affected > 5:
-                reasons.append("many affected subsections")
-            if diff_result.similarity_score < 0.5:
-                reasons.append("significant text replacement")
+def _wait_retry_after_or_jitter(retry_state) -> float:
+    """Tenacity wait: the server's Retry-After if given, else jittered exponential backoff."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    response = getattr(exc, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            seconds = float(retry_after)
+        except ValueError:
+            seconds = None
+        if seconds is not None and seconds == seconds:  # not NaN
+            return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+    return _jitter_wait(retry_state)
+
+
+def _load_json(response: str, pattern: re.Pattern):
+    """
+    Parse the JSON payload of an LLM response.
 
-            reason_text = ", ".join(reasons) if reasons else "complex changes"
+    Raw JSON (what the prompts ask for) is parsed directly; otherwise the
+    payload matched by pattern is extracted from fences or prose first.
+    """
+    try:
+        return orjson.loads(response)
+    except orjson.JSONDecodeError:
+        match = pattern.search(response)
+        if match is None:
+            raise
+        return orjson.loads(match.group(0))
+
+
+def _clip(text: str, limit: int) -> str:
+    return text if len(text) <= limit else text[:limit]
+
+
+@lru_cache(maxsize=1024)
+def _format_changes(
+    additions: tuple[tuple[str, str | None], ...],
+    deletions: tuple[tuple[str, str | None], ...],
+    modifications: tuple[tuple[str, str, str | None], ...],
+) -> str:
+    """Render clipped (text, subsection) chunk fingerprints as the prompt's changes block."""
+    lines = []
+
+    if additions:
+        lines.append("ADDITIONS:")
+        for text, subsection in additions:
+            subsection = f" [in {subsection}]" if subsection else ""
+            lines.append(f"  + {text}{subsection}")
+
+    if deletions:
+        lines.append("\nDELETIONS:")
+        for text, subsection in deletions:
+            subsection = f" [in {subsection}]" if subsection else ""
+            lines.append(f"  - {text}{subsection}")
+
+    if modifications:
+        lines.append("\nMODIFICATIONS:")
+        for old_text, text, subsection in modifications:
+            subsection = f" [in {subsection}]" if subsection else ""
+            lines.append(f"  OLD: {old_text}")
+            lines.append(f"  NEW: {text}{subsection}")
+            lines.append("")
+
+    return "\n".join(lines) if lines else "No detailed changes available."
+
+
+@lru_cache(maxsize=64)
+def _hedging_note(
+    confidence: Confidence,
+    change_magnitude: str,
+    many_paragraphs: bool,
+    low_similarity: bool,
+) -> str:
+    """Hedging language for a confidence level and the diff facts it depends on."""
+    if confidence == Confidence.HIGH:
+        return "Based on text comparison; legislative intent may differ from textual changes."
+
+    elif confidence == Confidence.MEDIUM:
+        if change_magnitude == "substantial":
+            return (
+                "This summary is based on text analysis of substantial changes. "
+                "The actual scope and effect of the amendment may be broader or "
+                "narrower than what the text comparison suggests."
+            )
+        else:
             return (
-                f"Low confidence summary due to {reason_text}. "
-                "This interpretation should be verified against the full legislative record."
+                "Based on text comparison. Some aspects of this amendment "
+                "may not be fully captured by the textual analysis."
             )
 
+    else:  # LOW
+        reasons = []
+        if change_magnitude == "major":
+            reasons.append("extensive restructuring")
+        if many_paragraphs:
+            reasons.append("many affected subsections")
+        if low_similarity:
+            reasons.append("significant text replacement")
+
+        reason_text = ", ".join(reasons) if reasons else "complex changes"
+        return (
+            f"Low confidence summary due to {reason_text}. "
+            "This interpretation should be verified against the full legislative record."
+        )
+
 
 # =============================================================================
 # CLI Entry Point
@@ -795,6 +1493,7 @@ def main():
 Examples:
   python -m src.analysis.llm_summarizer --section "42 USC 1863" --law "Pub. L. 117-167"
   python -m src.analysis.llm_summarizer --test
+  python -m src.analysis.llm_summarizer --test --json > result.json
         """,
     )
 
@@ -819,6 +1518,11 @@ Examples:
         default=DEFAULT_MODEL,
         help=f"Claude model to use (default: {DEFAULT_MODEL})",
     )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Write the result to stdout as JSON instead of a table (progress goes to stderr)",
+    )
 
     args = parser.parse_args()
 
@@ -830,7 +1534,8 @@ Examples:
     from rich.panel import Panel
     from rich.table import Table
 
-    console = Console()
+    # Keep stdout clean for the JSON result
+    console = Console(stderr=args.json)
 
     if args.test:
         # Run with sample data
@@ -889,7 +1594,10 @@ household income.
             result = summarizer.summarize_diff(diff_result, context)
 
             # Display result
-            if isinstance(result, TrivialChangeResult):
+            if args.json:
+                sys.stdout.buffer.write(orjson.dumps(result.model_dump(mode="json")) + b"\n")
+                sys.stdout.flush()
+            elif isinstance(result, TrivialChangeResult):
                 console.print(Panel(
                     f"[yellow]Trivial Change Detected[/yellow]\n\n"
                     f"Type: {result.change_type}\n"
@@ -51,12 +51,37 @@ Usage:
 from __future__ import annotations
 
 import difflib
+import hashlib
 import re
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Iterator
+from itertools import groupby
+from typing import Hashable, Iterator, Literal, Sequence
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+from ..compat import DATACLASS_SLOTS
+
+# rapidfuzz computes line edit scripts (LCS-based Indel opcodes) in C++ -
+# optional, fall back to difflib when it isn't installed
+try:
+    from rapidfuzz.distance import Indel
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    Indel = None
+    RAPIDFUZZ_AVAILABLE = False
+
+# re2 matches in guaranteed linear time (no backtracking) - optional, used for
+# the amendment instruction scanners when installed
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = None
+    RE2_AVAILABLE = False
 
 
 # =============================================================================
@@ -72,10 +97,15 @@ class ChunkType(str, Enum):
     UNCHANGED = "unchanged"
 
 
-class DiffChunk(BaseModel):
+@dataclass(**DATACLASS_SLOTS)
+class DiffChunk:
     """
     A chunk of text that was added, removed, or modified.
 
+    A plain slotted dataclass rather than a pydantic model: chunks are built
+    in the inner diff loop, and pydantic still serializes them as DiffResult
+    fields.
+
     Attributes:
         chunk_type: Whether this is an addition, deletion, or modification
         text: The text content of this chunk
@@ -84,6 +114,7 @@ class DiffChunk(BaseModel):
         line_number: Approximate line number (1-indexed)
         context: Surrounding text for context (optional)
         subsection: If this chunk is within a numbered subsection, its identifier
+        word_count: Number of words in text, counted when the chunk is built
     """
     chunk_type: ChunkType
     text: str
@@ -92,6 +123,7 @@ class DiffChunk(BaseModel):
     line_number: int = 1
     context: str | None = None
     subsection: str | None = None  # e.g., "(a)(1)(A)"
+    word_count: int = 0
 
     def __str__(self) -> str:
         prefix = {
@@ -103,6 +135,14 @@ class DiffChunk(BaseModel):
         return f"{prefix} {self.text[:80]}{'...' if len(self.text) > 80 else ''}"
 
 
+ChangeMagnitude = Literal["none", "minor", "moderate", "substantial", "major"]
+
+# Similarity cut-offs between magnitudes: a score at or above a threshold
+# lands in the next category up (>= 0.95 is minor)
+_MAGNITUDE_THRESHOLDS = (0.50, 0.80, 0.95)
+_MAGNITUDES: tuple[ChangeMagnitude, ...] = ("major", "substantial", "moderate", "minor")
+
+
 class DiffResult(BaseModel):
     """
     Result of comparing two versions of statutory text.
@@ -113,6 +153,7 @@ class DiffResult(BaseModel):
         modifications: List of modified chunks (old_text -> text)
         similarity_score: Ratio of unchanged to total content (0-1)
         summary: Human-readable summary of changes
+        change_magnitude: Category derived from similarity_score at construction
         old_word_count: Word count in original text
         new_word_count: Word count in new text
         words_added: Net words added
@@ -124,6 +165,7 @@ class DiffResult(BaseModel):
     modifications: list[DiffChunk] = Field(default_factory=list)
     similarity_score: float = 1.0
     summary: str = "No changes"
+    change_magnitude: ChangeMagnitude = "none"
 
     # Statistics
     old_word_count: int = 0
@@ -132,31 +174,47 @@ class DiffResult(BaseModel):
     words_removed: int = 0
     paragraphs_affected: int = 0
 
+    @model_validator(mode="after")
+    def _classify_magnitude(self) -> DiffResult:
+        """Categorize the magnitude of changes once, from the similarity score."""
+        if self.has_changes:
+            self.change_magnitude = _MAGNITUDES[
+                bisect_right(_MAGNITUDE_THRESHOLDS, self.similarity_score)
+            ]
+        else:
+            self.change_magnitude = "none"
+        return self
+
     @property
     def has_changes(self) -> bool:
         """Returns True if any changes were detected."""
         return bool(self.additions or self.deletions or self.modifications)
 
-    @property
-    def change_magnitude(self) -> str:
-        """Categorize the magnitude of changes."""
-        if not self.has_changes:
-            return "none"
-        if self.similarity_score >= 0.95:
-            return "minor"
-        if self.similarity_score >= 0.80:
-            return "moderate"
-        if self.similarity_score >= 0.50:
-            return "substantial"
-        return "major"
-
 
 # =============================================================================
 # Amendment Instruction Parser
 # =============================================================================
 
 
-@dataclass
+def _compile_instruction_pattern(pattern: re.Pattern):
+    """
+    Recompile an instruction pattern with re2 when available.
+
+    re2 has no lookahead and spells end-of-text as \\z, so the "followed by
+    a blank line or end" lookahead is rewritten to consume the blank line
+    instead; anything else re2 rejects keeps the standard library pattern.
+    """
+    if RE2_AVAILABLE:
+        re2_source = "(?is)" + pattern.pattern.replace(r"(?=\n\n|\Z)", r"(?:\n\n|\z)")
+        try:
+            return re2.compile(re2_source)
+        except re2.error:
+            pass
+
+    return pattern
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class AmendmentInstruction:
     """
     A parsed amendment instruction from Public Law text.
@@ -221,6 +279,23 @@ class AmendmentParser:
         re.IGNORECASE
     )
 
+    # Literal words at least one of which every instruction pattern contains
+    INSTRUCTION_KEYWORDS = ("striking", "inserting", "adding", "amended", "redesignating")
+
+    # (kind, keyword, pattern) per instruction type, in output order. Each
+    # pattern gets its own scan - one fused alternation would only report
+    # non-overlapping matches, and ADD_END/REPLACE_ALL bodies swallow the
+    # instructions after them - but a pattern whose keyword isn't in the
+    # text is skipped.
+    INSTRUCTION_SCANNERS = tuple(
+        (kind, keyword, _compile_instruction_pattern(pattern))
+        for kind, keyword, pattern in zip(
+            ("strike_insert", "insert_after", "add_end", "replace_all", "redesignate"),
+            ("striking", "inserting", "adding", "amended", "redesignating"),
+            (STRIKE_INSERT, INSERT_AFTER, ADD_END, REPLACE_ALL, REDESIGNATE),
+        )
+    )
+
     def parse(self, text: str) -> list[AmendmentInstruction]:
         """
         Parse amendment instructions from Public Law text.
@@ -229,9 +304,13 @@ class AmendmentParser:
             text: The text of a Public Law section describing amendments
 
         Returns:
-            List of parsed amendment instructions
+            List of parsed amendment instructions, grouped by instruction type
         """
-        instructions = []
+        # Text without any instruction keyword (most non-amendment input)
+        # skips the regex scans entirely
+        lowered = text.lower()
+        if not any(keyword in lowered for keyword in self.INSTRUCTION_KEYWORDS):
+            return []
 
         # Find section references to associate with instructions
         current_section = None
@@ -239,56 +318,72 @@ class AmendmentParser:
         if section_match:
             current_section = section_match.group(1)
 
-        # Strike and insert
-        for match in self.STRIKE_INSERT.finditer(text):
-            instructions.append(AmendmentInstruction(
-                instruction_type="strike_insert",
+        instructions = []
+        for kind, keyword, scanner in self.INSTRUCTION_SCANNERS:
+            if keyword not in lowered:
+                continue
+            for match in scanner.finditer(text):
+                raw_text = match.group(0)
+                if kind == "replace_all" and raw_text.endswith("\n\n"):
+                    # re2 consumes the blank line ending a "read as follows" block
+                    raw_text = raw_text[:-2]
+                groups = match.groups()
+                instructions.append(self._build_instruction(
+                    kind, (groups[0], groups[1] if len(groups) > 1 else None),
+                    raw_text, current_section
+                ))
+
+        return instructions
+
+    @staticmethod
+    def _build_instruction(
+        kind: str,
+        groups: tuple[str | None, str | None],
+        raw_text: str,
+        current_section: str | None
+    ) -> AmendmentInstruction:
+        """Build an AmendmentInstruction from one pattern's captures."""
+        first, second = groups
+
+        if kind == "strike_insert":
+            return AmendmentInstruction(
+                instruction_type=kind,
                 target_section=current_section,
-                strike_text=match.group(1),
-                insert_text=match.group(2),
-                raw_text=match.group(0)
-            ))
-
-        # Insert after
-        for match in self.INSERT_AFTER.finditer(text):
-            instructions.append(AmendmentInstruction(
-                instruction_type="insert_after",
+                strike_text=first,
+                insert_text=second,
+                raw_text=raw_text
+            )
+        if kind == "insert_after":
+            return AmendmentInstruction(
+                instruction_type=kind,
                 target_section=current_section,
-                insert_text=match.group(1),
-                position_reference=f"after '{match.group(2)}'",
-                raw_text=match.group(0)
-            ))
-
-        # Add at end
-        for match in self.ADD_END.finditer(text):
-            instructions.append(AmendmentInstruction(
-                instruction_type="add_end",
+                insert_text=first,
+                position_reference=f"after '{second}'",
+                raw_text=raw_text
+            )
+        if kind == "add_end":
+            return AmendmentInstruction(
+                instruction_type=kind,
                 target_section=current_section,
-                insert_text=match.group(1),
+                insert_text=first,
                 position_reference="at the end",
-                raw_text=match.group(0)
-            ))
-
-        # Replace all
-        for match in self.REPLACE_ALL.finditer(text):
-            instructions.append(AmendmentInstruction(
-                instruction_type="replace_all",
+                raw_text=raw_text
+            )
+        if kind == "replace_all":
+            return AmendmentInstruction(
+                instruction_type=kind,
                 target_section=current_section,
-                insert_text=match.group(1),
-                raw_text=match.group(0)
-            ))
-
+                insert_text=first,
+                raw_text=raw_text
+            )
         # Redesignate
-        for match in self.REDESIGNATE.finditer(text):
-            instructions.append(AmendmentInstruction(
-                instruction_type="redesignate",
-                target_section=current_section,
-                strike_text=f"({match.group(1)})",
-                insert_text=f"({match.group(2)})",
-                raw_text=match.group(0)
-            ))
-
-        return instructions
+        return AmendmentInstruction(
+            instruction_type=kind,
+            target_section=current_section,
+            strike_text=f"({first})",
+            insert_text=f"({second})",
+            raw_text=raw_text
+        )
 
 
 # =============================================================================
@@ -296,6 +391,205 @@ class AmendmentParser:
 # =============================================================================
 
 
+def _line_opcodes(
+    old_lines: Sequence[Hashable],
+    new_lines: Sequence[Hashable]
+) -> list[tuple[str, int, int, int, int]]:
+    """
+    Line-level edit script as difflib-style (tag, i1, i2, j1, j2) opcodes.
+
+    Uses rapidfuzz's C++ Myers implementation when available, otherwise
+    difflib's SequenceMatcher.
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        return [tuple(op) for op in Indel.opcodes(old_lines, new_lines)]
+    return difflib.SequenceMatcher(None, old_lines, new_lines).get_opcodes()
+
+
+def _patience_opcodes(
+    old_lines: Sequence[Hashable],
+    new_lines: Sequence[Hashable]
+) -> list[tuple[str, int, int, int, int]]:
+    """
+    Line-level edit script using patience diff.
+
+    Lines that occur exactly once on both sides anchor the alignment (their
+    longest common subsequence), and only the gaps between anchors go to
+    _line_opcodes(). Statutory text repeats short lines like "(A)" or "and"
+    constantly; anchoring on unique lines keeps those from pulling changes
+    into the wrong subsection.
+    """
+    opcodes: list[tuple[str, int, int, int, int]] = []
+    _patience_diff(old_lines, 0, len(old_lines), new_lines, 0, len(new_lines), opcodes)
+
+    # Merge adjacent opcodes of the same kind
+    merged: list[tuple[str, int, int, int, int]] = []
+    for op in opcodes:
+        if merged and merged[-1][0] == op[0]:
+            tag, i1, _, j1, _ = merged[-1]
+            merged[-1] = (tag, i1, op[2], j1, op[4])
+        else:
+            merged.append(op)
+    return merged
+
+
+def _patience_diff(
+    a: Sequence[Hashable], alo: int, ahi: int,
+    b: Sequence[Hashable], blo: int, bhi: int,
+    out: list[tuple[str, int, int, int, int]]
+) -> None:
+    """Append opcodes aligning a[alo:ahi] with b[blo:bhi] to out."""
+    # Common prefix and suffix
+    prefix = 0
+    while alo + prefix < ahi and blo + prefix < bhi and a[alo + prefix] == b[blo + prefix]:
+        prefix += 1
+    if prefix:
+        out.append(('equal', alo, alo + prefix, blo, blo + prefix))
+        alo += prefix
+        blo += prefix
+
+    suffix = 0
+    while alo < ahi - suffix and blo < bhi - suffix and a[ahi - suffix - 1] == b[bhi - suffix - 1]:
+        suffix += 1
+    ahi -= suffix
+    bhi -= suffix
+
+    if alo == ahi or blo == bhi:
+        if alo < ahi:
+            out.append(('delete', alo, ahi, blo, blo))
+        elif blo < bhi:
+            out.append(('insert', alo, alo, blo, bhi))
+    else:
+        anchors = _unique_anchors(a, alo, ahi, b, blo, bhi)
+        if anchors:
+            i, j = alo, blo
+            for ai, bj in anchors:
+                _patience_diff(a, i, ai, b, j, bj, out)
+                out.append(('equal', ai, ai + 1, bj, bj + 1))
+                i, j = ai + 1, bj + 1
+            _patience_diff(a, i, ahi, b, j, bhi, out)
+        else:
+            for tag, i1, i2, j1, j2 in _line_opcodes(a[alo:ahi], b[blo:bhi]):
+                out.append((tag, i1 + alo, i2 + alo, j1 + blo, j2 + blo))
+
+    if suffix:
+        out.append(('equal', ahi, ahi + suffix, bhi, bhi + suffix))
+
+
+def _unique_anchors(
+    a: Sequence[Hashable], alo: int, ahi: int,
+    b: Sequence[Hashable], blo: int, bhi: int
+) -> list[tuple[int, int]]:
+    """Longest increasing run of (i, j) pairs of lines unique to both ranges."""
+    old_index: dict[Hashable, int] = {}
+    for i in range(alo, ahi):
+        old_index[a[i]] = -1 if a[i] in old_index else i
+    new_index: dict[Hashable, int] = {}
+    for j in range(blo, bhi):
+        new_index[b[j]] = -1 if b[j] in new_index else j
+
+    # Dict order is first occurrence, so pairs are already sorted by i
+    pairs = [
+        (i, new_index[line]) for line, i in old_index.items()
+        if i >= 0 and new_index.get(line, -1) >= 0
+    ]
+
+    # Patience sort: longest increasing subsequence of j
+    tails: list[int] = []
+    tail_pairs: list[int] = []
+    previous: list[int] = [-1] * len(pairs)
+    for k, (_, j) in enumerate(pairs):
+        pos = bisect_left(tails, j)
+        if pos:
+            previous[k] = tail_pairs[pos - 1]
+        if pos == len(tails):
+            tails.append(j)
+            tail_pairs.append(k)
+        else:
+            tails[pos] = j
+            tail_pairs[pos] = k
+
+    anchors = []
+    k = tail_pairs[-1] if tail_pairs else -1
+    while k >= 0:
+        anchors.append(pairs[k])
+        k = previous[k]
+    anchors.reverse()
+    return anchors
+
+
+def _changed_lines(
+    old_lines: list[str],
+    new_lines: list[str]
+) -> Iterator[tuple[str, int, int]]:
+    """
+    Walk a line diff as (marker, index, line_number) triples.
+
+    Markers follow unified diff: '-' removed, '+' added, and a single ' '
+    per unchanged run. index points into old_lines for removals and into
+    new_lines for additions (-1 for unchanged runs). Within a run of changes
+    every removal comes before the additions, as in unified diff output.
+    Line numbers are 1-indexed positions on the old side; additions report
+    the line they were inserted before.
+    """
+    for unchanged, group in groupby(
+        _patience_opcodes(old_lines, new_lines), key=lambda op: op[0] == 'equal'
+    ):
+        ops = list(group)
+        if unchanged:
+            yield ' ', -1, ops[0][1] + 1
+            continue
+
+        for _, i1, i2, _, _ in ops:
+            for i in range(i1, i2):
+                yield '-', i, i + 1
+
+        insert_at = ops[-1][2] + 1
+        for _, _, _, j1, j2 in ops:
+            for j in range(j1, j2):
+                yield '+', j, insert_at
+
+
+def _word_count(normalized: str) -> int:
+    """
+    Count words in text already passed through _normalize_text().
+
+    Whitespace there is collapsed to single spaces or line breaks and
+    stripped, so counting separators gives the same answer as
+    len(text.split()) without building a list.
+    """
+    return normalized.count(' ') + normalized.count('\n') + 1 if normalized else 0
+
+
+# Most recent diff_sections results, keyed by (old, new) content digest
+DIFF_CACHE_SIZE = 1024
+_DIFF_CACHE: OrderedDict[tuple[bytes, bytes], DiffResult] = OrderedDict()
+_DIFF_CACHE_LOCK = threading.Lock()
+
+
+def _content_digest(text: str) -> bytes:
+    """Short fixed-size digest of a text version, used as a cache key."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+# Any run of whitespace within a line, collapsed to a single space when
+# normalizing
+_SPACE_RE = re.compile(r'[^\S\n]+')
+
+# A line break with the spaces and blank lines around it, folded to one '\n'
+_LINE_BREAK_RE = re.compile(r' ?\n[\n ]*')
+
+# Typographic characters folded to their ASCII equivalents before comparing
+_NORMALIZE_TABLE = str.maketrans({
+    '\u201c': '"',  # left double quote
+    '\u201d': '"',  # right double quote
+    '\u2018': "'",  # left single quote
+    '\u2019': "'",  # right single quote
+    '\u2013': '-',  # en dash
+    '\u2014': '-',  # em dash
+})
+
+
 class SectionDiff:
     """
     Compute and represent differences between versions of statutory text.
@@ -353,26 +647,64 @@ class SectionDiff:
         if not new_text:
             return self._handle_deleted_section(old_text)
 
+        # Unchanged between versions is the common case in a time series;
+        # skip hashing and normalizing entirely
+        if old_text is new_text or old_text == new_text:
+            words = len(old_text.split())
+            # Same summary _compare() gives any pair equal after normalization
+            return DiffResult(
+                similarity_score=1.0,
+                summary="No substantive changes (whitespace only)",
+                old_word_count=words,
+                new_word_count=words
+            )
+
+        # The same pair of versions is often compared repeatedly (timelines,
+        # repeated API hits); results are cached by content digest
+        key = (_content_digest(old_text), _content_digest(new_text))
+        with _DIFF_CACHE_LOCK:
+            cached = _DIFF_CACHE.get(key)
+            if cached is not None:
+                _DIFF_CACHE.move_to_end(key)
+        if cached is not None:
+            # Hand out a copy so callers can't mutate the cached result
+            return cached.model_copy(deep=True)
+
+        result = self._compare(old_text, new_text)
+
+        with _DIFF_CACHE_LOCK:
+            _DIFF_CACHE[key] = result
+            if len(_DIFF_CACHE) > DIFF_CACHE_SIZE:
+                _DIFF_CACHE.popitem(last=False)
+        return result.model_copy(deep=True)
+
+    def _compare(self, old_text: str, new_text: str) -> DiffResult:
+        """Diff two non-empty versions of statutory text (uncached)."""
         # Normalize whitespace for comparison
         old_normalized = self._normalize_text(old_text)
         new_normalized = self._normalize_text(new_text)
+        old_words = _word_count(old_normalized)
+        new_words = _word_count(new_normalized)
+
+        # Reflowing lines is a whitespace change too: equality and similarity
+        # are judged on the text with line breaks read as spaces
+        old_flat = old_normalized.replace('\n', ' ')
+        new_flat = new_normalized.replace('\n', ' ')
 
         # If identical after normalization, no changes
-        if old_normalized == new_normalized:
+        if old_flat == new_flat:
             return DiffResult(
                 similarity_score=1.0,
                 summary="No substantive changes (whitespace only)",
-                old_word_count=len(old_text.split()),
-                new_word_count=len(new_text.split())
+                old_word_count=old_words,
+                new_word_count=new_words
             )
 
         # Compute diff at the line level for structure
         old_lines = old_normalized.split('\n')
         new_lines = new_normalized.split('\n')
 
-        # Use SequenceMatcher for similarity score
-        matcher = difflib.SequenceMatcher(None, old_normalized, new_normalized)
-        similarity = matcher.ratio()
+        similarity = self._similarity(old_flat, new_flat)
 
         # Get structured diff
         additions, deletions, modifications = self._extract_chunks(
@@ -380,14 +712,8 @@ class SectionDiff:
         )
 
         # Calculate statistics
-        old_words = len(old_text.split())
-        new_words = len(new_text.split())
-
-        added_text = ' '.join(c.text for c in additions)
-        removed_text = ' '.join(c.text for c in deletions)
-
-        words_added = len(added_text.split()) if added_text else 0
-        words_removed = len(removed_text.split()) if removed_text else 0
+        words_added = sum(c.word_count for c in additions)
+        words_removed = sum(c.word_count for c in deletions)
 
         # Count affected paragraphs
         affected_subsections = set()
@@ -414,6 +740,38 @@ class SectionDiff:
             paragraphs_affected=len(affected_subsections)
         )
 
+    def iter_chunks(self, old_text: str, new_text: str) -> Iterator[DiffChunk]:
+        """
+        Yield changed chunks between two versions one at a time.
+
+        Streaming counterpart to diff_sections(): chunks come out in document
+        order as the diff is walked, without building the addition, deletion
+        and modification lists or the summary statistics. Useful when a
+        caller only needs to scan or count changes, or can stop early.
+
+        Args:
+            old_text: The original version of the text
+            new_text: The modified version of the text
+
+        Yields:
+            DiffChunk for each addition, deletion, or modification
+        """
+        if not old_text or not new_text:
+            if new_text:
+                yield from self._handle_new_section(new_text).additions
+            elif old_text:
+                yield from self._handle_deleted_section(old_text).deletions
+            return
+
+        old_normalized = self._normalize_text(old_text)
+        new_normalized = self._normalize_text(new_text)
+        if old_normalized.replace('\n', ' ') == new_normalized.replace('\n', ' '):
+            return
+
+        yield from self._iter_line_chunks(
+            old_normalized.split('\n'), new_normalized.split('\n')
+        )
+
     def diff_from_amendment(
         self,
         current_text: str,
@@ -444,44 +802,47 @@ class SectionDiff:
         deletions = []
         modifications = []
 
+        # Approximate word changes, counted once per chunk as it is built
+        words_added = 0
+
         for instr in instructions:
-            if instr.instruction_type == "strike_insert":
-                modifications.append(DiffChunk(
-                    chunk_type=ChunkType.MODIFICATION,
-                    text=instr.insert_text or "",
-                    old_text=instr.strike_text,
-                    subsection=instr.target_section
-                ))
-            elif instr.instruction_type in ("insert_after", "add_end"):
-                additions.append(DiffChunk(
+            if instr.instruction_type in ("insert_after", "add_end"):
+                text = instr.insert_text or ""
+                chunk = DiffChunk(
                     chunk_type=ChunkType.ADDITION,
-                    text=instr.insert_text or "",
+                    text=text,
                     context=instr.position_reference,
-                    subsection=instr.target_section
-                ))
+                    subsection=instr.target_section,
+                    word_count=len(text.split())
+                )
+                additions.append(chunk)
+                words_added += chunk.word_count
+                continue
+
+            if instr.instruction_type == "strike_insert":
+                text = instr.insert_text or ""
+                old_text = instr.strike_text
             elif instr.instruction_type == "replace_all":
                 # This is a complete replacement
-                modifications.append(DiffChunk(
-                    chunk_type=ChunkType.MODIFICATION,
-                    text=instr.insert_text or "",
-                    old_text="[entire section]",
-                    subsection=instr.target_section
-                ))
+                text = instr.insert_text or ""
+                old_text = "[entire section]"
             elif instr.instruction_type == "redesignate":
                 # Renumbering
-                modifications.append(DiffChunk(
-                    chunk_type=ChunkType.MODIFICATION,
-                    text=f"Redesignated as {instr.insert_text}",
-                    old_text=f"Was {instr.strike_text}",
-                    subsection=instr.target_section
-                ))
+                text = f"Redesignated as {instr.insert_text}"
+                old_text = f"Was {instr.strike_text}"
+            else:
+                continue
 
-        # Calculate approximate word changes
-        words_added = sum(len(c.text.split()) for c in additions)
-        words_added += sum(
-            len(c.text.split()) - len((c.old_text or "").split())
-            for c in modifications if c.old_text
-        )
+            chunk = DiffChunk(
+                chunk_type=ChunkType.MODIFICATION,
+                text=text,
+                old_text=old_text,
+                subsection=instr.target_section,
+                word_count=len(text.split())
+            )
+            modifications.append(chunk)
+            if old_text:
+                words_added += chunk.word_count - len(old_text.split())
 
         summary = self._generate_summary(
             additions, deletions, modifications,
@@ -497,16 +858,26 @@ class SectionDiff:
             new_word_count=len(current_text.split()) if current_text else 0
         )
 
+    def _similarity(self, old_normalized: str, new_normalized: str) -> float:
+        """
+        Character-level similarity ratio (0-1) of two normalized texts.
+
+        Stays on SequenceMatcher: rapidfuzz's Indel ratio is LCS-based rather
+        than Ratcliff/Obershelp, so it scores the same pair differently and
+        would move texts across the change magnitude thresholds.
+        """
+        return difflib.SequenceMatcher(None, old_normalized, new_normalized).ratio()
+
     def _normalize_text(self, text: str) -> str:
-        """Normalize whitespace and formatting for comparison."""
-        # Normalize various whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Normalize quotes
-        text = text.replace('"', '"').replace('"', '"')
-        text = text.replace(''', "'").replace(''', "'")
-        # Normalize dashes
-        text = text.replace('–', '-').replace('—', '-')
-        return text.strip()
+        """
+        Normalize whitespace and formatting for comparison.
+
+        Line breaks are kept (one per line, blank lines dropped) so the line
+        diff and subsection detection see the text's real lines.
+        """
+        # Smart quotes and dashes in one pass, then collapse whitespace
+        text = _SPACE_RE.sub(' ', text.translate(_NORMALIZE_TABLE))
+        return _LINE_BREAK_RE.sub('\n', text).strip()
 
     def _extract_chunks(
         self,
@@ -519,73 +890,79 @@ class SectionDiff:
         additions = []
         deletions = []
         modifications = []
+        by_type = {
+            ChunkType.ADDITION: additions,
+            ChunkType.DELETION: deletions,
+            ChunkType.MODIFICATION: modifications,
+        }
 
-        # Use unified diff for structured output
-        differ = difflib.unified_diff(old_lines, new_lines, lineterm='')
+        for chunk in self._iter_line_chunks(old_lines, new_lines):
+            by_type[chunk.chunk_type].append(chunk)
+
+        return additions, deletions, modifications
 
-        current_line = 0
+    def _iter_line_chunks(
+        self,
+        old_lines: list[str],
+        new_lines: list[str]
+    ) -> Iterator[DiffChunk]:
+        """Yield diff chunks from line-level comparison as they are completed."""
         pending_deletion = None
 
-        for line in differ:
-            if line.startswith('@@'):
-                # Parse hunk header for line numbers
-                match = re.match(r'@@ -(\d+)', line)
-                if match:
-                    current_line = int(match.group(1))
+        for marker, index, line_number in _changed_lines(old_lines, new_lines):
+            if marker == ' ':
+                # Unchanged run
+                if pending_deletion:
+                    yield pending_deletion
+                    pending_deletion = None
                 continue
 
-            if line.startswith('---') or line.startswith('+++'):
+            if marker == '-':
+                content = old_lines[index].strip()
+                if not content:
+                    continue
+                words = len(content.split())
+                if pending_deletion is None:
+                    pending_deletion = DiffChunk(
+                        chunk_type=ChunkType.DELETION,
+                        text=content,
+                        line_number=line_number,
+                        subsection=self._detect_subsection(content),
+                        word_count=words
+                    )
+                else:
+                    pending_deletion.text += ' ' + content
+                    pending_deletion.word_count += words
                 continue
 
-            # Detect subsection context
-            subsection = self._detect_subsection(line)
-
-            if line.startswith('-'):
-                content = line[1:].strip()
-                if content:
-                    if pending_deletion is None:
-                        pending_deletion = DiffChunk(
-                            chunk_type=ChunkType.DELETION,
-                            text=content,
-                            line_number=current_line,
-                            subsection=subsection
-                        )
-                    else:
-                        pending_deletion.text += ' ' + content
-                current_line += 1
-
-            elif line.startswith('+'):
-                content = line[1:].strip()
-                if content:
-                    if pending_deletion:
-                        # This is likely a modification
-                        modifications.append(DiffChunk(
-                            chunk_type=ChunkType.MODIFICATION,
-                            text=content,
-                            old_text=pending_deletion.text,
-                            line_number=pending_deletion.line_number,
-                            subsection=subsection or pending_deletion.subsection
-                        ))
-                        pending_deletion = None
-                    else:
-                        additions.append(DiffChunk(
-                            chunk_type=ChunkType.ADDITION,
-                            text=content,
-                            line_number=current_line,
-                            subsection=subsection
-                        ))
+            content = new_lines[index].strip()
+            if not content:
+                continue
+            words = len(content.split())
+            subsection = self._detect_subsection(content)
+            if pending_deletion:
+                # This is likely a modification
+                yield DiffChunk(
+                    chunk_type=ChunkType.MODIFICATION,
+                    text=content,
+                    old_text=pending_deletion.text,
+                    line_number=pending_deletion.line_number,
+                    subsection=subsection or pending_deletion.subsection,
+                    word_count=words
+                )
+                pending_deletion = None
             else:
-                # Unchanged line
-                if pending_deletion:
-                    deletions.append(pending_deletion)
-                    pending_deletion = None
-                current_line += 1
+                yield DiffChunk(
+                    chunk_type=ChunkType.ADDITION,
+                    text=content,
+                    line_number=line_number,
+                    subsection=subsection,
+                    word_count=words
+                )
 
         # Don't forget pending deletion
         if pending_deletion:
-            deletions.append(pending_deletion)
-
-        return additions, deletions, modifications
+            yield pending_deletion
 
     def _detect_subsection(self, text: str) -> str | None:
         """Detect subsection identifier from text line."""
@@ -601,7 +978,8 @@ class SectionDiff:
             additions=[DiffChunk(
                 chunk_type=ChunkType.ADDITION,
                 text=new_text,
-                line_number=1
+                line_number=1,
+                word_count=words
             )],
             similarity_score=0.0,
             summary=f"New section added ({words} words)",
@@ -616,7 +994,8 @@ class SectionDiff:
             deletions=[DiffChunk(
                 chunk_type=ChunkType.DELETION,
                 text=old_text,
-                line_number=1
+                line_number=1,
+                word_count=words
             )],
             similarity_score=0.0,
             summary=f"Section deleted ({words} words removed)",
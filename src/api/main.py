@@ -12,27 +12,141 @@ Run: uvicorn src.api.main:app --reload
 """
 from __future__ import annotations
 
+import asyncio
+import logging
+import os
+import re
+import time
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Iterator, Union
 
 from dotenv import load_dotenv
 load_dotenv()
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse
+from neo4j.exceptions import ClientError
+import orjson
 from pydantic import BaseModel, Field
 
 from ..graph.neo4j_store import Neo4jStore
 from ..parsers.citations import CitationParser
 from .story import StoryOfALaw, LawStory
 from ..narrative.generator import NarrativeGenerator, ChipsNarrative, SectionNarrative
-from .narrative_endpoints import router as narrative_router
+from .narrative_endpoints import router as narrative_router, SECTION_CONTEXT_QUERIES, close_store
+from .responses import ORJSONResponse, conditional_response, stream_json
+
+logger = logging.getLogger(__name__)
 
 # Path to web templates
 WEB_TEMPLATES_DIR = Path(__file__).parent.parent / "web" / "templates"
 
+# /ui is served from memory; set LI_RELOAD_UI=1 while editing the template to
+# pick up changes without restarting
+RELOAD_UI = os.environ.get("LI_RELOAD_UI", "0") == "1"
+_ui_html: tuple[int, bytes] | None = None  # (mtime_ns, template bytes)
+
+
+# =============================================================================
+# Cypher Queries
+# =============================================================================
+# Kept as constants so every request sends byte-identical text and hits the
+# same entry in Neo4j's plan cache; primed with EXPLAIN on startup.
+
+_Q_SEARCH = """
+    CALL db.index.fulltext.queryNodes('usc_search_idx', $search_term) YIELD node, score
+    RETURN node.id as id, node.section_name as section_name, score
+    ORDER BY score DESC
+    LIMIT $max_results
+"""
+
+# Label scan used when the full-text index has not been created yet
+_Q_SEARCH_SCAN = """
+    MATCH (usc:USCSection)
+    WHERE toLower(usc.section_name) CONTAINS toLower($search_term)
+       OR toLower(usc.id) CONTAINS toLower($search_term)
+    RETURN usc.id as id, usc.section_name as section_name
+    ORDER BY usc.id
+    LIMIT $max_results
+"""
+
+_Q_SECTION_BY_ID = """
+    MATCH (usc:USCSection {id: $id})
+    RETURN usc.id as id, usc.section_name as section_name
+"""
+
+# A Public Law and every section it amends or enacts, in one round-trip.
+# Bare "117-58" citations get the "Pub. L. " prefix inside the query.
+_Q_PUBLIC_LAW = """
+    MATCH (pl:PublicLaw {id: CASE WHEN $id STARTS WITH 'Pub' THEN $id ELSE 'Pub. L. ' + $id END})
+    OPTIONAL MATCH (pl)-[r:AMENDS|ENACTS]->(usc:USCSection)
+    RETURN pl, collect(CASE WHEN r IS NOT NULL THEN
+        {relationship: type(r), section_id: usc.id, section_name: usc.section_name} END) as affected
+"""
+
+_Q_MEDICARE = """
+    MATCH (usc:USCSection)
+    WHERE usc.id STARTS WITH "42 USC 1395"
+    RETURN usc.id as id, usc.section_name as section_name
+    ORDER BY usc.id
+"""
+
+# Query -> placeholder parameters used only to plan it
+_PRIMED_QUERIES: dict[str, dict[str, Any]] = {
+    _Q_SEARCH: {"search_term": "x", "max_results": 1},
+    _Q_SEARCH_SCAN: {"search_term": "", "max_results": 1},
+    _Q_SECTION_BY_ID: {"id": ""},
+    _Q_PUBLIC_LAW: {"id": ""},
+    _Q_MEDICARE: {},
+    **SECTION_CONTEXT_QUERIES,
+}
+
+
+# Characters with meaning in Lucene query syntax
+_LUCENE_SPECIAL_RE = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+
+def _lucene_escape(text: str) -> str:
+    """
+    Escape user input for db.index.fulltext.queryNodes.
+
+    Lowercasing keeps words like AND/OR/NOT from being read as operators; the
+    index analyzer lowercases terms anyway.
+    """
+    return _LUCENE_SPECIAL_RE.sub(r"\\\1", text.lower())
+
+
+# Words as the full-text index's standard analyzer splits them
+_SEARCH_TERM_RE = re.compile(r"\w+")
+
+
+def _lucene_query(text: str) -> str | None:
+    """
+    Build the usc_search_idx query for a /search string.
+
+    Every word must match (AND), as a prefix (term*), so the index behaves
+    like the substring search it replaced: "semicond" finds "semiconductor"
+    and "42 USC 1889" only finds sections whose id has all three words.
+    Returns None when the input has no searchable words.
+    """
+    terms = _SEARCH_TERM_RE.findall(text)
+    if not terms:
+        return None
+    return " AND ".join(f"{_lucene_escape(term)}*" for term in terms)
+
+
+def _prime_query_plans(store: Neo4jStore) -> None:
+    """EXPLAIN each endpoint query once so its plan is cached before traffic."""
+    with store.session() as session:
+        for query, params in _PRIMED_QUERIES.items():
+            try:
+                session.run(f"EXPLAIN {query}", **params).consume()
+            except Exception as e:
+                # Priming is an optimization only; the API still works without it
+                logger.warning(f"Could not prime Cypher plan for query: {e}")
+
 
 # Global instances (initialized on startup)
 graph_store: Neo4jStore | None = None
@@ -40,6 +154,11 @@ story_generator: StoryOfALaw | None = None
 citation_parser: CitationParser | None = None
 narrative_generator: NarrativeGenerator | None = None
 
+# /stats counts change slowly; serve them from memory for this long
+STATS_CACHE_SECONDS = 60.0
+_stats_cache: tuple[float, bytes] | None = None  # (fetched at, encoded StatsResponse)
+_stats_lock: asyncio.Lock | None = None  # created on first use, inside the server's loop
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -49,6 +168,7 @@ async def lifespan(app: FastAPI):
     # Startup
     graph_store = Neo4jStore()
     graph_store.connect()
+    await asyncio.to_thread(_prime_query_plans, graph_store)
     story_generator = StoryOfALaw(graph_store)
     citation_parser = CitationParser()
     narrative_generator = NarrativeGenerator(graph_store)
@@ -60,6 +180,7 @@ async def lifespan(app: FastAPI):
         story_generator.close()
     if narrative_generator:
         narrative_generator.close()
+    close_store()
 
 
 app = FastAPI(
@@ -67,6 +188,7 @@ app = FastAPI(
     description="Trace the story of any law - from enactment through amendments, regulations, and court interpretations.",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS for local development
@@ -215,24 +337,45 @@ async def search_sections(
     if not graph_store:
         raise HTTPException(status_code=503, detail="Service not initialized")
 
-    with graph_store.session() as session:
+    # At most 100 rows: read them all before responding, so a driver error
+    # becomes a 500 instead of a truncated 200 body
+    rows = await asyncio.to_thread(_search_rows, graph_store, q, limit)
+    return ORJSONResponse(rows)
+
+
+def _search_rows(store: Neo4jStore, q: str, limit: int) -> list[dict[str, Any]]:
+    """Run a /search query and return its results."""
+    with store.session() as session:
+        # A bare citation ("42 USC 18911") is answered by the unique id index
+        if citation_parser:
+            parsed = citation_parser.parse(q)
+            if len(parsed) == 1 and parsed[0].citation_type.name == "USC":
+                record = session.run(_Q_SECTION_BY_ID, id=parsed[0].canonical).single()
+                if record:
+                    return [{"id": record["id"], "section_name": record["section_name"],
+                             "score": None, "snippet": None}]
+
         # Search section name and citation (id)
         # Note: section text is not stored in Aura (too large), so we search names only
-        result = session.run("""
-            MATCH (usc:USCSection)
-            WHERE toLower(usc.section_name) CONTAINS toLower($search_term)
-               OR toLower(usc.id) CONTAINS toLower($search_term)
-            RETURN usc.id as id, usc.section_name as section_name
-            ORDER BY usc.id
-            LIMIT $max_results
-        """, search_term=q, max_results=limit)
+        result = None
+        lucene_query = _lucene_query(q)
+        if lucene_query is not None:
+            try:
+                result = session.run(_Q_SEARCH, search_term=lucene_query, max_results=limit)
+                result.peek()  # surfaces a missing index before anything is sent
+            except ClientError:
+                # usc_search_idx missing - run Neo4jStore.init_schema() to create it
+                result = None
+        if result is None:
+            result = session.run(_Q_SEARCH_SCAN, search_term=q, max_results=limit)
 
         return [
-            SearchResult(
-                id=r["id"],
-                section_name=r["section_name"],
-                snippet=None,  # Text not stored in Aura
-            )
+            {
+                "id": r["id"],
+                "section_name": r["section_name"],
+                "score": r.get("score"),
+                "snippet": None,  # Text not stored in Aura
+            }
             for r in result
         ]
 
@@ -330,76 +473,60 @@ async def get_public_law(
     if not graph_store:
         raise HTTPException(status_code=503, detail="Service not initialized")
 
-    # Normalize citation
-    if not citation.startswith("Pub"):
-        citation = f"Pub. L. {citation}"
-
     with graph_store.session() as session:
-        result = session.run("""
-            MATCH (pl:PublicLaw {id: $id})
-            RETURN pl
-        """, id=citation)
-        record = result.single()
-
-        if not record:
-            raise HTTPException(status_code=404, detail=f"Public Law not found: {citation}")
-
-        pl = dict(record["pl"])
-
-        if amendments:
-            # Get sections this law amends
-            amend_result = session.run("""
-                MATCH (pl:PublicLaw {id: $id})-[r:AMENDS|ENACTS]->(usc:USCSection)
-                RETURN type(r) as rel_type, usc.id as section_id, usc.section_name as section_name
-            """, id=citation)
-            pl["affected_sections"] = [
-                {
-                    "relationship": r["rel_type"],
-                    "section_id": r["section_id"],
-                    "section_name": r["section_name"],
-                }
-                for r in amend_result
-            ]
-
-        if full:
-            return pl
-
-        return PublicLawSummary(
-            id=pl.get("id", ""),
-            title=pl.get("title"),
-            enacted_date=pl.get("enacted_date"),
-            congress=pl.get("congress"),
-        )
+        record = session.run(_Q_PUBLIC_LAW, id=citation).single()
+
+    if not record:
+        raise HTTPException(status_code=404, detail=f"Public Law not found: {citation}")
+
+    pl = dict(record["pl"])
+
+    if amendments:
+        # Sections this law amends
+        pl["affected_sections"] = record["affected"]
+
+    if full:
+        return pl
+
+    return PublicLawSummary(
+        id=pl.get("id", ""),
+        title=pl.get("title"),
+        enacted_date=pl.get("enacted_date"),
+        congress=pl.get("congress"),
+    )
 
 
 @app.get("/stats", response_model=StatsResponse)
-async def get_stats():
-    """Get database statistics."""
+async def get_stats(request: Request):
+    """
+    Get database statistics.
+
+    Counts are cached for STATS_CACHE_SECONDS; concurrent requests during a
+    refresh wait for and share the same query.
+    """
+    global _stats_cache, _stats_lock
+
     if not graph_store:
         raise HTTPException(status_code=503, detail="Service not initialized")
 
-    with graph_store.session() as session:
-        # Count nodes by label
-        node_result = session.run("""
-            MATCH (n)
-            WITH labels(n)[0] as label
-            RETURN label, count(*) as count
-        """)
-        nodes = {r["label"]: r["count"] for r in node_result}
-
-        # Count relationships by type
-        rel_result = session.run("""
-            MATCH ()-[r]->()
-            RETURN type(r) as type, count(*) as count
-        """)
-        relationships = {r["type"]: r["count"] for r in rel_result}
-
-    return StatsResponse(
-        nodes=nodes,
-        relationships=relationships,
-        total_nodes=sum(nodes.values()),
-        total_relationships=sum(relationships.values()),
-    )
+    if _stats_lock is None:
+        _stats_lock = asyncio.Lock()
+    async with _stats_lock:
+        if not _stats_cache or time.monotonic() - _stats_cache[0] >= STATS_CACHE_SECONDS:
+            counts = await asyncio.to_thread(graph_store.get_stats)
+            nodes = counts["nodes"]
+            relationships = counts["relationships"]
+
+            stats = StatsResponse(
+                nodes=nodes,
+                relationships=relationships,
+                total_nodes=sum(nodes.values()),
+                total_relationships=sum(relationships.values()),
+            )
+            _stats_cache = (time.monotonic(), orjson.dumps(stats.model_dump()))
+        body = _stats_cache[1]
+
+    return conditional_response(request, body, max_age=int(STATS_CACHE_SECONDS))
 
 
 @app.get("/medicare")
@@ -412,21 +539,19 @@ async def get_medicare_sections():
     if not graph_store:
         raise HTTPException(status_code=503, detail="Service not initialized")
 
-    with graph_store.session() as session:
-        result = session.run("""
-            MATCH (usc:USCSection)
-            WHERE usc.id STARTS WITH "42 USC 1395"
-            RETURN usc.id as id, usc.section_name as section_name
-            ORDER BY usc.id
-        """)
-
-        return {
-            "count": 0,  # Will be updated
-            "sections": [
-                {"id": r["id"], "section_name": r["section_name"]}
-                for r in result
-            ]
-        }
+    return stream_json(_medicare_body(graph_store))
+
+
+def _medicare_body(store: Neo4jStore) -> Iterator[bytes]:
+    """Encode the /medicare response while the sections are read."""
+    count = 0
+    with store.session() as session:
+        yield b'{"sections":['
+        for r in session.run(_Q_MEDICARE):
+            row = orjson.dumps({"id": r["id"], "section_name": r["section_name"]})
+            yield row if count == 0 else b"," + row
+            count += 1
+    yield b'],"count":%d}' % count
 
 
 # =============================================================================
@@ -435,22 +560,32 @@ async def get_medicare_sections():
 
 
 @app.get("/ui", response_class=HTMLResponse)
-async def serve_ui():
+async def serve_ui(request: Request):
     """
     Serve the CHIPS demo web UI.
 
     This is a single-page application that visualizes the CHIPS and Science Act
     narrative with topics, timeline, and section details.
     """
-    template_path = WEB_TEMPLATES_DIR / "index.html"
-    if not template_path.exists():
-        raise HTTPException(status_code=500, detail="UI template not found")
+    global _ui_html
 
-    return HTMLResponse(content=template_path.read_text())
+    if _ui_html is None or RELOAD_UI:
+        template_path = WEB_TEMPLATES_DIR / "index.html"
+        try:
+            mtime_ns = template_path.stat().st_mtime_ns
+            if _ui_html is None or _ui_html[0] != mtime_ns:
+                _ui_html = (mtime_ns, template_path.read_bytes())
+        except OSError:
+            raise HTTPException(status_code=500, detail="UI template not found")
+
+    return conditional_response(
+        request, _ui_html[1], media_type="text/html; charset=utf-8",
+        max_age=0 if RELOAD_UI else 3600,
+    )
 
 
 @app.get("/chips")
-async def get_chips_narrative():
+async def get_chips_narrative(request: Request):
     """
     Get the complete CHIPS and Science Act narrative.
 
@@ -467,7 +602,7 @@ async def get_chips_narrative():
         raise HTTPException(status_code=503, detail="Narrative generator not initialized")
 
     chips = narrative_generator.generate_chips_story()
-    return chips.to_dict()
+    return conditional_response(request, orjson.dumps(chips.to_dict(), default=str))
 
 
 @app.get("/section-narrative/{citation:path}")
@@ -6,16 +6,27 @@ using the BillNarrator for LLM generation.
 """
 from __future__ import annotations
 
+import asyncio
 import os
-import json
 import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel
 
+from .responses import conditional_response
+
+if TYPE_CHECKING:
+    from ..graph.neo4j_store import Neo4jStore
+
 from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent.parent.parent / '.env', override=True)
 
@@ -27,6 +38,39 @@ router = APIRouter(prefix="/narrative", tags=["narrative"])
 CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "cache"
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+# Generated narratives are reused for this long
+CACHE_TTL_SECONDS = 24 * 3600
+
+# In-process tier in front of CACHE_DIR: key -> (generated at, encoded JSON)
+MEMORY_CACHE_SIZE = 256
+_MEM: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+_MEM_LOCK = threading.Lock()
+
+
+# =============================================================================
+# Cypher Queries
+# =============================================================================
+
+# A section with its amendments (oldest first) and up to five sections from
+# the same chapter, in one round-trip
+_Q_SECTION_CONTEXT = """
+    MATCH (usc:USCSection {id: $id})
+    OPTIONAL MATCH (pl:PublicLaw)-[:AMENDS]->(usc)
+    WITH usc, pl
+    ORDER BY pl.enacted_date
+    WITH usc, collect(CASE WHEN pl IS NOT NULL THEN
+        {public_law: pl.id, title: pl.title, date: pl.enacted_date} END) as amendments
+    OPTIONAL MATCH (usc)-[:IN_CHAPTER]->(:Chapter)<-[:IN_CHAPTER]-(other:USCSection)
+    RETURN usc, amendments,
+        collect(CASE WHEN other IS NOT NULL THEN
+            {citation: other.id, name: other.section_name} END)[0..5] as related
+"""
+
+# Primed by the app on startup (see main._prime_query_plans)
+SECTION_CONTEXT_QUERIES: dict[str, dict[str, Any]] = {
+    _Q_SECTION_CONTEXT: {"id": ""},
+}
+
 
 # =============================================================================
 # Response Models
@@ -86,76 +130,182 @@ class ChipsNarrativeResponse(BaseModel):
 # Helper Functions
 # =============================================================================
 
+def _remember(key: str, generated: float, raw: bytes) -> None:
+    """Store an entry in the in-process tier, evicting the least recently used."""
+    with _MEM_LOCK:
+        _MEM[key] = (generated, raw)
+        _MEM.move_to_end(key)
+        while len(_MEM) > MEMORY_CACHE_SIZE:
+            _MEM.popitem(last=False)
+
+
+def _get_cached_raw(key: str) -> bytes | None:
+    """Get the encoded JSON of a cached narrative if it is fresh (< 24 hours)."""
+    now = time.time()
+    with _MEM_LOCK:
+        entry = _MEM.get(key)
+        if entry is not None:
+            if now - entry[0] < CACHE_TTL_SECONDS:
+                _MEM.move_to_end(key)
+                return entry[1]
+            del _MEM[key]
+
+    cache_file = CACHE_DIR / f"{key}.json"
+    try:
+        stat = cache_file.stat()
+    except OSError:
+        return None
+
+    # The file is written once per generation, so its mtime is the
+    # generation time - no need to parse generated_at to check freshness
+    if now - stat.st_mtime >= CACHE_TTL_SECONDS:
+        return None
+    try:
+        with open(cache_file, "rb") as f:
+            raw = f.read()
+        orjson.loads(raw)  # only checked once, when loaded into memory
+    except Exception as e:
+        logger.warning(f"Cache read error for {key}: {e}")
+        return None
+
+    _remember(key, stat.st_mtime, raw)
+    return raw
+
+
 def _get_cached(key: str) -> dict | None:
     """Get cached narrative if it exists and is fresh (< 24 hours)."""
-    cache_file = CACHE_DIR / f"{key}.json"
-    if cache_file.exists():
-        try:
-            data = json.loads(cache_file.read_text())
-            generated_at = datetime.fromisoformat(data.get("generated_at", "2000-01-01"))
-            age_hours = (datetime.now() - generated_at).total_seconds() / 3600
-            if age_hours < 24:
-                return data
-        except Exception as e:
-            logger.warning(f"Cache read error for {key}: {e}")
-    return None
+    raw = _get_cached_raw(key)
+    return orjson.loads(raw) if raw else None
 
 
 def _set_cached(key: str, data: dict) -> None:
     """Cache narrative data."""
     cache_file = CACHE_DIR / f"{key}.json"
+    data["generated_at"] = datetime.now().isoformat()
+    raw = orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    _remember(key, time.time(), raw)
     try:
-        data["generated_at"] = datetime.now().isoformat()
-        cache_file.write_text(json.dumps(data, indent=2, default=str))
+        cache_file.write_bytes(raw)
     except Exception as e:
         logger.warning(f"Cache write error for {key}: {e}")
 
 
+def _cached_response(key: str, request: Request) -> Response | None:
+    """
+    Serve a cache hit as the stored bytes.
+
+    Cached payloads were validated against the response model when they were
+    generated, so hits skip decoding and re-validating them. Clients that
+    send a matching If-None-Match get a bodiless 304.
+    """
+    raw = _get_cached_raw(key)
+    if raw is None:
+        return None
+    return conditional_response(request, raw)
+
+
+# Shared by every request; the driver is thread-safe and pools connections
+_STORE: Neo4jStore | None = None
+_STORE_LOCK = threading.Lock()
+
+
+def _store() -> Neo4jStore:
+    """Get the module's Neo4jStore, creating it on first use."""
+    global _STORE
+    if _STORE is None:
+        with _STORE_LOCK:
+            if _STORE is None:
+                from ..graph.neo4j_store import Neo4jStore
+                _STORE = Neo4jStore()
+    return _STORE
+
+
+def close_store() -> None:
+    """Close the shared Neo4jStore. Called from the app's shutdown."""
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is not None:
+            _STORE.close()
+            _STORE = None
+
+
 def _get_narrator():
     """Get or create BillNarrator instance."""
     from ..analysis.bill_narrator import BillNarrator
     return BillNarrator()
 
 
+# Most sections handed to the LLM for provision linking
+SAMPLE_SECTIONS_LIMIT = 50
+
+# Generating /chips/full needs the CHIPS data up to three times at once
+CHIPS_DATA_TTL_SECONDS = 60.0
+_chips_data: tuple[float, dict] | None = None
+_CHIPS_DATA_LOCK = threading.Lock()
+
+
 def _get_chips_data() -> dict:
-    """Get CHIPS data from the graph for narrative generation."""
-    from ..graph.neo4j_store import Neo4jStore
+    """
+    Get CHIPS data from the graph for narrative generation.
+
+    Reused for CHIPS_DATA_TTL_SECONDS. Concurrent callers wait on the lock
+    and share one build instead of each querying the graph.
+    """
+    global _chips_data
+    with _CHIPS_DATA_LOCK:
+        if _chips_data and time.monotonic() - _chips_data[0] < CHIPS_DATA_TTL_SECONDS:
+            return _chips_data[1]
+        data = _build_chips_data()
+        _chips_data = (time.monotonic(), data)
+        return data
+
+
+def _build_chips_data() -> dict:
+    """Query the graph and assemble the CHIPS data."""
     from ..narrative.generator import NarrativeGenerator
 
-    store = Neo4jStore()
+    store = _store()
     gen = NarrativeGenerator(store)
     chips = gen.generate_chips_story()
 
-    # Get amendment counts for all sections in one query
+    # Get amendment counts for all amended sections in one query
+    # (amendment_count is maintained on ingest and indexed)
     amendment_counts = {}
     with store.session() as session:
         result = session.run("""
             MATCH (usc:USCSection)
-            OPTIONAL MATCH (usc)<-[r:AMENDS]-(pl:PublicLaw)
-            WITH usc.id as citation, count(r) as amendment_count
-            WHERE amendment_count > 0
-            RETURN citation, amendment_count
+            WHERE usc.amendment_count > 0
+            RETURN usc.id as citation, usc.amendment_count as amendment_count
         """)
         for r in result:
             amendment_counts[r["citation"]] = r["amendment_count"]
 
-    # Extract data for narrator
+    # Extract data for narrator in one pass over the topic groups
     topic_breakdown = {}
     topic_groups_raw = []
+    sample_sections = []
     for group in chips.by_topic:
-        topic_breakdown[group.topic] = len(group.sections)
+        section_count = len(group.sections)
+        head = group.sections[:5]
+        topic_breakdown[group.topic] = section_count
         topic_groups_raw.append({
             "topic": group.topic,
-            "section_count": len(group.sections),
+            "section_count": section_count,
             "sample_sections": [
                 {
                     "citation": s["citation"],
                     "name": s["name"],
                     "amendment_count": amendment_counts.get(s["citation"], 0),
                 }
-                for s in group.sections[:5]
+                for s in head
             ],
         })
+        # Provide more sections to the LLM for better provision linking
+        # Include 5 from each topic group to give good coverage
+        sample_sections.extend(islice(
+            ({"citation": s["citation"], "name": s["name"]} for s in head),
+            SAMPLE_SECTIONS_LIMIT - len(sample_sections),
+        ))
 
     # Get most amended sections THAT CHIPS TOUCHED
     # This prevents showing unrelated sections like Medicare/Medicaid that happen to be heavily amended
@@ -163,9 +313,8 @@ def _get_chips_data() -> dict:
     with store.session() as session:
         result = session.run("""
             MATCH (chips:PublicLaw {id: "Pub. L. 117-167"})-[:AMENDS]->(usc:USCSection)
-            OPTIONAL MATCH (usc)<-[r:AMENDS]-(pl:PublicLaw)
-            WITH usc, count(r) as amendment_count
-            RETURN usc.id as citation, usc.section_name as name, amendment_count
+            RETURN usc.id as citation, usc.section_name as name,
+                   coalesce(usc.amendment_count, 0) as amendment_count
             ORDER BY amendment_count DESC
             LIMIT 10
         """)
@@ -180,8 +329,9 @@ def _get_chips_data() -> dict:
     newest = []
     with store.session() as session:
         result = session.run("""
-            MATCH (pl:PublicLaw {id: "Pub. L. 117-167"})-[:ENACTS]->(usc:USCSection)
+            MATCH (pl:PublicLaw {id: "Pub. L. 117-167"})-[r:ENACTS]->(usc:USCSection)
             RETURN usc.id as citation, usc.section_name as name
+            ORDER BY r.enacted_at DESC, usc.id
             LIMIT 10
         """)
         for r in result:
@@ -190,8 +340,6 @@ def _get_chips_data() -> dict:
                 "name": r["name"],
             })
 
-    store.close()
-
     return {
         "chips_narrative": chips.to_dict(),
         "topic_breakdown": topic_breakdown,
@@ -199,25 +347,195 @@ def _get_chips_data() -> dict:
         "most_amended": most_amended,
         "newest": newest,
         "predecessor_laws": [
-            {"citation": p.content.split(":")[0] if ":" in p.content else p.content, "title": p.content.split(": ")[1].split(" (")[0] if ": " in p.content else "", "year": ""}
+            {"citation": p.citation, "title": p.law_title, "year": p.year or ""}
             for p in chips.predecessors
         ],
-        # Provide more sections to the LLM for better provision linking
-        # Include 5 from each topic group to give good coverage
-        "sample_sections": [
-            {"citation": s["citation"], "name": s["name"]}
-            for group in chips.by_topic
-            for s in group.sections[:5]
-        ][:50],
+        "sample_sections": sample_sections,
     }
 
 
+# =============================================================================
+# Generation
+# =============================================================================
+# Each generator builds a response dict, stores it with _set_cached and
+# returns it. They block on Neo4j and the LLM, so endpoints run them through
+# _singleflight rather than calling them directly.
+
+# cache_key -> task generating that entry
+_INFLIGHT: dict[str, asyncio.Task] = {}
+
+
+async def _singleflight(key: str, factory: Callable[[], Awaitable[dict]]) -> dict:
+    """
+    Run factory() once per key, however many requests ask concurrently.
+
+    Callers that arrive while a generation for the key is running await the
+    same task instead of starting another LLM call. The task is shielded so
+    a client disconnecting does not cancel work other callers are waiting on.
+    """
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    return await asyncio.shield(task)
+
+
+def _generate_executive_summary(cache_key: str) -> dict:
+    """Generate and cache the CHIPS executive summary."""
+    from ..narrative.generator import CHIPS_FUNDING
+
+    narrator = _get_narrator()
+    data = _get_chips_data()
+
+    summary = narrator.generate_executive_summary(
+        bill_title="CHIPS and Science Act",
+        bill_citation="Pub. L. 117-167",
+        enacted_date="August 9, 2022",
+        sections_created=144,
+        sections_amended=51,
+        topic_breakdown=data["topic_breakdown"],
+        predecessor_laws=data["predecessor_laws"],
+        sample_sections=data["sample_sections"],
+        funding_data=CHIPS_FUNDING,
+    )
+
+    result = {
+        "headline": summary.headline,
+        "overview": summary.overview,
+        "key_provisions": summary.key_provisions,
+        "key_provisions_linked": [
+            {"text": p.text, "sections": p.sections}
+            for p in summary.key_provisions_linked
+        ],
+        "why_it_matters": summary.why_it_matters,
+        "historical_context": summary.historical_context,
+        "generated_at": datetime.now().isoformat(),
+    }
+
+    _set_cached(cache_key, result)
+    return result
+
+
+def _generate_navigation(cache_key: str) -> dict:
+    """Generate and cache the CHIPS navigation guide."""
+    narrator = _get_narrator()
+    data = _get_chips_data()
+
+    guide = narrator.generate_navigation_guide(
+        bill_title="CHIPS and Science Act",
+        topic_groups=data["topic_groups"],
+        most_amended_sections=data["most_amended"],
+        newest_sections=data["newest"],
+    )
+
+    result = {
+        "pathways": [
+            {
+                "interest": p.interest,
+                "description": p.description,
+                "start_with": p.start_with,
+                "also_see": p.sections,
+            }
+            for p in guide.pathways
+        ],
+        "most_amended": guide.most_amended,
+        "newest": guide.newest,
+        "highlight": guide.highlight,
+        "generated_at": datetime.now().isoformat(),
+    }
+
+    _set_cached(cache_key, result)
+    return result
+
+
+async def _cached_or_generate(
+    cache_key: str, generate: Callable[[str], dict], regenerate: bool,
+) -> dict:
+    """Get cached data for cache_key, or run its blocking generator."""
+    if not regenerate:
+        cached = _get_cached(cache_key)
+        if cached:
+            return cached
+    return await _singleflight(cache_key, partial(asyncio.to_thread, generate, cache_key))
+
+
+async def _generate_full_narrative(cache_key: str, regenerate: bool) -> dict:
+    """Assemble and cache the full CHIPS narrative."""
+    # Get individual components (they may be cached) and the structured
+    # data concurrently - on a cold cache the two LLM calls dominate
+    summary, navigation, data = await asyncio.gather(
+        _cached_or_generate("chips_executive_summary", _generate_executive_summary, regenerate),
+        _cached_or_generate("chips_navigation", _generate_navigation, regenerate),
+        asyncio.to_thread(_get_chips_data),
+    )
+    chips = data["chips_narrative"]
+
+    result = {
+        "executive_summary": ExecutiveSummaryResponse(**summary).model_dump(),
+        "navigation": NavigationGuideResponse(**navigation).model_dump(),
+        "scope": {
+            "sections_created": 144,
+            "sections_amended": 51,
+        },
+        "topic_groups": data["topic_groups"],
+        "timeline": chips.get("timeline", []),
+        "generated_at": datetime.now().isoformat(),
+    }
+
+    _set_cached(cache_key, result)
+    return result
+
+
+def _generate_section_context(cache_key: str, citation: str) -> dict:
+    """Generate and cache the context for one section."""
+    from ..services.section_text import get_section_text
+
+    store = _store()
+    narrator = _get_narrator()
+
+    # Get section data, amendments and related sections (same chapter)
+    with store.session() as session:
+        record = session.run(_Q_SECTION_CONTEXT, id=citation).single()
+    if not record:
+        raise HTTPException(status_code=404, detail=f"Section not found: {citation}")
+
+    section = dict(record["usc"])
+    amendments = record["amendments"]
+    related = record["related"]
+
+    # Get section text from XML/cache (not stored in Neo4j Aura)
+    section_text = section.get("text") or get_section_text(citation) or ""
+
+    # Generate context
+    context = narrator.generate_section_context(
+        section_citation=citation,
+        section_name=section.get("section_name", ""),
+        section_text=section_text,
+        amendments=amendments,
+        related_sections=related,
+    )
+
+    result = {
+        "citation": citation,
+        "name": section.get("section_name", ""),
+        "plain_english": context.plain_english,
+        "why_exists": context.why_exists,
+        "connections": context.connections,
+        "amendment_story": context.amendment_story,
+        "generated_at": datetime.now().isoformat(),
+    }
+
+    _set_cached(cache_key, result)
+    return result
+
+
 # =============================================================================
 # Endpoints
 # =============================================================================
 
 @router.get("/chips/executive-summary", response_model=ExecutiveSummaryResponse)
-async def get_chips_executive_summary(regenerate: bool = False):
+async def get_chips_executive_summary(request: Request, regenerate: bool = False):
     """
     Get LLM-generated executive summary for CHIPS and Science Act.
 
@@ -230,43 +548,15 @@ async def get_chips_executive_summary(regenerate: bool = False):
     cache_key = "chips_executive_summary"
 
     if not regenerate:
-        cached = _get_cached(cache_key)
+        cached = _cached_response(cache_key, request)
         if cached:
-            return ExecutiveSummaryResponse(**cached)
+            return cached
 
     # Generate fresh summary
     try:
-        from ..narrative.generator import CHIPS_FUNDING
-
-        narrator = _get_narrator()
-        data = _get_chips_data()
-
-        summary = narrator.generate_executive_summary(
-            bill_title="CHIPS and Science Act",
-            bill_citation="Pub. L. 117-167",
-            enacted_date="August 9, 2022",
-            sections_created=144,
-            sections_amended=51,
-            topic_breakdown=data["topic_breakdown"],
-            predecessor_laws=data["predecessor_laws"],
-            sample_sections=data["sample_sections"],
-            funding_data=CHIPS_FUNDING,
+        result = await _singleflight(
+            cache_key, partial(asyncio.to_thread, _generate_executive_summary, cache_key),
         )
-
-        result = {
-            "headline": summary.headline,
-            "overview": summary.overview,
-            "key_provisions": summary.key_provisions,
-            "key_provisions_linked": [
-                {"text": p.text, "sections": p.sections}
-                for p in summary.key_provisions_linked
-            ],
-            "why_it_matters": summary.why_it_matters,
-            "historical_context": summary.historical_context,
-            "generated_at": datetime.now().isoformat(),
-        }
-
-        _set_cached(cache_key, result)
         return ExecutiveSummaryResponse(**result)
 
     except Exception as e:
@@ -275,7 +565,7 @@ async def get_chips_executive_summary(regenerate: bool = False):
 
 
 @router.get("/chips/navigation", response_model=NavigationGuideResponse)
-async def get_chips_navigation(regenerate: bool = False):
+async def get_chips_navigation(request: Request, regenerate: bool = False):
     """
     Get LLM-generated navigation guide for CHIPS and Science Act.
 
@@ -286,38 +576,14 @@ async def get_chips_navigation(regenerate: bool = False):
     cache_key = "chips_navigation"
 
     if not regenerate:
-        cached = _get_cached(cache_key)
+        cached = _cached_response(cache_key, request)
         if cached:
-            return NavigationGuideResponse(**cached)
+            return cached
 
     try:
-        narrator = _get_narrator()
-        data = _get_chips_data()
-
-        guide = narrator.generate_navigation_guide(
-            bill_title="CHIPS and Science Act",
-            topic_groups=data["topic_groups"],
-            most_amended_sections=data["most_amended"],
-            newest_sections=data["newest"],
+        result = await _singleflight(
+            cache_key, partial(asyncio.to_thread, _generate_navigation, cache_key),
         )
-
-        result = {
-            "pathways": [
-                {
-                    "interest": p.interest,
-                    "description": p.description,
-                    "start_with": p.start_with,
-                    "also_see": p.sections,
-                }
-                for p in guide.pathways
-            ],
-            "most_amended": guide.most_amended,
-            "newest": guide.newest,
-            "highlight": guide.highlight,
-            "generated_at": datetime.now().isoformat(),
-        }
-
-        _set_cached(cache_key, result)
         return NavigationGuideResponse(**result)
 
     except Exception as e:
@@ -326,7 +592,7 @@ async def get_chips_navigation(regenerate: bool = False):
 
 
 @router.get("/chips/full", response_model=ChipsNarrativeResponse)
-async def get_chips_full_narrative(regenerate: bool = False):
+async def get_chips_full_narrative(request: Request, regenerate: bool = False):
     """
     Get complete CHIPS narrative with all LLM-generated content.
 
@@ -336,32 +602,14 @@ async def get_chips_full_narrative(regenerate: bool = False):
     cache_key = "chips_full_narrative"
 
     if not regenerate:
-        cached = _get_cached(cache_key)
+        cached = _cached_response(cache_key, request)
         if cached:
-            return ChipsNarrativeResponse(**cached)
+            return cached
 
     try:
-        # Get individual components (they may be cached)
-        summary = await get_chips_executive_summary(regenerate=regenerate)
-        navigation = await get_chips_navigation(regenerate=regenerate)
-
-        # Get structured data
-        data = _get_chips_data()
-        chips = data["chips_narrative"]
-
-        result = {
-            "executive_summary": summary.dict(),
-            "navigation": navigation.dict(),
-            "scope": {
-                "sections_created": 144,
-                "sections_amended": 51,
-            },
-            "topic_groups": data["topic_groups"],
-            "timeline": chips.get("timeline", []),
-            "generated_at": datetime.now().isoformat(),
-        }
-
-        _set_cached(cache_key, result)
+        result = await _singleflight(
+            cache_key, partial(_generate_full_narrative, cache_key, regenerate),
+        )
         return ChipsNarrativeResponse(**result)
 
     except Exception as e:
@@ -370,7 +618,7 @@ async def get_chips_full_narrative(regenerate: bool = False):
 
 
 @router.get("/section/{citation:path}", response_model=SectionContextResponse)
-async def get_section_context(citation: str, regenerate: bool = False):
+async def get_section_context(request: Request, citation: str, regenerate: bool = False):
     """
     Get LLM-generated context for a specific section.
 
@@ -381,78 +629,15 @@ async def get_section_context(citation: str, regenerate: bool = False):
     cache_key = f"section_{citation.replace(' ', '_').replace('.', '_')}"
 
     if not regenerate:
-        cached = _get_cached(cache_key)
+        cached = _cached_response(cache_key, request)
         if cached:
-            return SectionContextResponse(**cached)
+            return cached
 
     try:
-        from ..graph.neo4j_store import Neo4jStore
-        from ..services.section_text import get_section_text
-
-        store = Neo4jStore()
-        narrator = _get_narrator()
-
-        # Get section data
-        section = store.get_usc_section(citation)
-        if not section:
-            raise HTTPException(status_code=404, detail=f"Section not found: {citation}")
-
-        # Get section text from XML/cache (not stored in Neo4j Aura)
-        section_text = section.get("text") or get_section_text(citation) or ""
-
-        # Get amendments
-        amendments = []
-        with store.session() as session:
-            result = session.run("""
-                MATCH (pl:PublicLaw)-[r:AMENDS]->(usc:USCSection {id: $id})
-                RETURN pl.id as public_law, pl.title as title, pl.enacted_date as date
-                ORDER BY pl.enacted_date
-            """, id=citation)
-            for r in result:
-                amendments.append({
-                    "public_law": r["public_law"],
-                    "title": r["title"],
-                    "date": r["date"],
-                })
-
-        # Get related sections (same chapter or linked)
-        related = []
-        with store.session() as session:
-            result = session.run("""
-                MATCH (usc:USCSection {id: $id})
-                MATCH (other:USCSection)
-                WHERE other.chapter = usc.chapter AND other.id <> usc.id
-                RETURN other.id as citation, other.section_name as name
-                LIMIT 5
-            """, id=citation)
-            for r in result:
-                related.append({
-                    "citation": r["citation"],
-                    "name": r["name"],
-                })
-
-        store.close()
-
-        # Generate context
-        context = narrator.generate_section_context(
-            section_citation=citation,
-            section_name=section.get("section_name", ""),
-            section_text=section_text,
-            amendments=amendments,
-            related_sections=related,
+        result = await _singleflight(
+            cache_key,
+            partial(asyncio.to_thread, _generate_section_context, cache_key, citation),
         )
-
-        result = {
-            "citation": citation,
-            "name": section.get("section_name", ""),
-            "plain_english": context.plain_english,
-            "why_exists": context.why_exists,
-            "connections": context.connections,
-            "amendment_story": context.amendment_story,
-            "generated_at": datetime.now().isoformat(),
-        }
-
-        _set_cached(cache_key, result)
         return SectionContextResponse(**result)
 
     except HTTPException:
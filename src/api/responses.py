@@ -0,0 +1,75 @@
+"""
+Response classes shared by the API routers.
+
+FastAPI's stock JSONResponse encodes with the standard library json module.
+Story timelines and bill narratives are large nested payloads, so the app
+renders JSON with orjson instead.
+"""
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Iterable
+
+import orjson
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Defined here rather than imported from fastapi.responses, which deprecates
+    its own ORJSONResponse in newer releases; this one behaves the same on
+    every supported FastAPI version.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def stream_json(chunks: Iterable[bytes]) -> StreamingResponse:
+    """
+    Stream already-encoded JSON.
+
+    Pass a synchronous iterator: Starlette drains it in a worker thread, so
+    blocking driver reads inside it don't stall the event loop.
+    """
+    return StreamingResponse(chunks, media_type="application/json")
+
+
+def _etag(body: bytes) -> str:
+    """Weak validator derived from the response body."""
+    return 'W/"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against our ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:]
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def conditional_response(
+    request: Request,
+    body: bytes,
+    media_type: str = "application/json",
+    max_age: int = 3600,
+) -> Response:
+    """
+    Respond with body, or 304 Not Modified if the client already has it.
+
+    Sets ETag and Cache-Control so browsers and CDNs can revalidate (or skip
+    the request entirely within max_age).
+    """
+    etag = _etag(body)
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
@@ -12,18 +12,72 @@ The output can be:
 """
 from __future__ import annotations
 
+import io
+import re
+import sys
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import date
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any
 
+import orjson
 from dotenv import load_dotenv
 load_dotenv()
 
+from ..compat import DATACLASS_SLOTS
 from ..graph.neo4j_store import Neo4jStore
-from ..parsers.citations import CitationParser, CitationType
+from ..parsers.citations import CitationParser
 
+# "42 U.S.C. § 1395" -> ("42", "1395"), for inputs the citation parser misses
+_USC_CITATION_RE = re.compile(r"(\d+)\s*U\.?\s*S\.?\s*C\.?\s*§?\s*(\d+[a-z]*)", re.IGNORECASE)
 
-@dataclass
+_CITATION_PARSER = CitationParser()
+
+
+def _parse_iso_date(value: Any) -> date | None:
+    """Parse an ISO date property, or None if it's missing or malformed."""
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+
+
+# Markdown timeline markers by event type (📌 for anything else)
+_EVENT_EMOJI = {
+    "enacted": "📜",
+    "amended": "✏️",
+    "interpreted": "⚖️",
+    "implemented": "📋",
+    "repealed": "🗑️",
+    "renamed": "🏷️",
+}
+
+# Stories kept by each StoryOfALaw, least recently used evicted first
+STORY_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=1024)
+def _normalize_usc_citation(citation: str) -> str | None:
+    """Normalize a USC citation to canonical form ("42 USC 1395")."""
+    # Same pick as the first USC hit of CitationParser.parse (earliest in the
+    # text), without running the parser's other six citation patterns
+    first = min(_CITATION_PARSER.parse_usc(citation), key=attrgetter("start"), default=None)
+    if first:
+        return first.canonical
+
+    match = _USC_CITATION_RE.match(citation)
+    if match:
+        return f"{match.group(1)} USC {match.group(2)}"
+
+    return None
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TimelineEvent:
     """A single event in the law's timeline."""
 
@@ -47,7 +101,7 @@ class TimelineEvent:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LawStory:
     """The complete story of a law."""
 
@@ -55,7 +109,7 @@ class LawStory:
     section_name: str | None
     title_name: str | None
     current_text: str | None
-    timeline: list[TimelineEvent]
+    timeline: list[TimelineEvent]  # chronological, as built by _build_timeline
     enacting_law: dict[str, Any] | None
     amendments: list[dict[str, Any]]
     regulations: list[dict[str, Any]]
@@ -76,20 +130,29 @@ class LawStory:
             "related_sections": self.related_sections,
         }
 
+    def to_json(self) -> bytes:
+        """
+        Serialize the story as JSON, the same document as to_dict().
+
+        orjson encodes the dataclasses and dates natively, so no
+        intermediate dict tree is built.
+        """
+        return orjson.dumps(self)
+
     def to_markdown(self) -> str:
         """Generate a markdown narrative of the law's story."""
-        lines = []
+        buf = io.StringIO()
+        w = buf.write
 
-        # Header
-        lines.append(f"# The Story of {self.citation}")
+        # Header. Every later block opens with the blank line that
+        # separates it from the previous one.
+        w(f"# The Story of {self.citation}\n")
         if self.section_name:
-            lines.append(f"## {self.section_name}")
-        lines.append("")
+            w(f"## {self.section_name}\n")
 
         # Introduction
         if self.title_name:
-            lines.append(f"*Part of {self.title_name}*")
-            lines.append("")
+            w(f"\n*Part of {self.title_name}*\n")
 
         # Origin
         if self.enacting_law:
@@ -98,118 +161,86 @@ class LawStory:
             pl_title = pl.get("title", "")
             enacted_date = pl.get("enacted_date", "")
 
-            lines.append("## Origin")
-            lines.append("")
+            w("\n## Origin\n\n")
             if enacted_date:
-                lines.append(f"This section was enacted on **{enacted_date}** by **{pl_citation}**")
+                w(f"This section was enacted on **{enacted_date}** by **{pl_citation}**\n")
             else:
-                lines.append(f"This section was enacted by **{pl_citation}**")
+                w(f"This section was enacted by **{pl_citation}**\n")
             if pl_title:
-                lines.append(f"({pl_title})")
-            lines.append("")
+                w(f"({pl_title})\n")
 
         # Timeline
         if self.timeline:
-            lines.append("## Timeline")
-            lines.append("")
-
-            for event in sorted(self.timeline, key=lambda e: e.date or date.min):
-                date_str = event.date.strftime("%B %d, %Y") if event.date else "Date unknown"
-                emoji = self._get_event_emoji(event.event_type)
-                lines.append(f"- **{date_str}** {emoji} {event.title}")
-                if event.description:
-                    lines.append(f"  - {event.description}")
-            lines.append("")
+            w("\n## Timeline\n\n")
+            w("".join([
+                f"- **{event.date.strftime('%B %d, %Y') if event.date else 'Date unknown'}** "
+                f"{_EVENT_EMOJI.get(event.event_type, '📌')} {event.title}\n"
+                + (f"  - {event.description}\n" if event.description else "")
+                for event in self.timeline
+            ]))
 
         # Amendments
         if self.amendments:
-            lines.append("## Legislative History")
-            lines.append("")
-            lines.append(f"This section has been amended **{len(self.amendments)} times**:")
-            lines.append("")
+            w("\n## Legislative History\n\n")
+            w(f"This section has been amended **{len(self.amendments)} times**:\n\n")
 
+            chunk = []
             for amend in self.amendments:
                 pl = amend.get("public_law", {})
                 pl_id = pl.get("id", "Unknown")
                 pl_title = pl.get("title", "")
-                amend_info = amend.get("amendment", {})
-                effective = amend_info.get("effective_date", "")
+                effective = amend.get("amendment", {}).get("effective_date", "")
 
-                if effective:
-                    lines.append(f"- **{effective}**: {pl_id}")
-                else:
-                    lines.append(f"- {pl_id}")
+                chunk.append(f"- **{effective}**: {pl_id}\n" if effective else f"- {pl_id}\n")
                 if pl_title:
-                    lines.append(f"  - *{pl_title}*")
-            lines.append("")
+                    chunk.append(f"  - *{pl_title}*\n")
+            w("".join(chunk))
 
         # Regulations
         if self.regulations:
-            lines.append("## Regulatory Implementation")
-            lines.append("")
-            lines.append(f"This section is implemented by **{len(self.regulations)} CFR sections**:")
-            lines.append("")
+            w("\n## Regulatory Implementation\n\n")
+            w(f"This section is implemented by **{len(self.regulations)} CFR sections**:\n\n")
 
+            chunk = []
             for reg in self.regulations:
                 cfr = reg.get("cfr", {})
-                cfr_id = cfr.get("id", "Unknown")
                 cfr_name = cfr.get("section_name", "")
 
-                lines.append(f"- **{cfr_id}**")
+                chunk.append(f"- **{cfr.get('id', 'Unknown')}**\n")
                 if cfr_name:
-                    lines.append(f"  - {cfr_name}")
-            lines.append("")
+                    chunk.append(f"  - {cfr_name}\n")
+            w("".join(chunk))
 
         # Cases
         if self.cases:
-            lines.append("## Judicial Interpretation")
-            lines.append("")
-            lines.append(f"This section has been interpreted in **{len(self.cases)} cases**:")
-            lines.append("")
+            w("\n## Judicial Interpretation\n\n")
+            w(f"This section has been interpreted in **{len(self.cases)} cases**:\n\n")
 
+            chunk = []
             for case_data in self.cases[:10]:  # Limit to top 10
                 case = case_data.get("case", {})
                 case_name = case.get("name", "Unknown")
                 case_citation = case.get("id", "")
                 court = case.get("court", "")
                 decided = case.get("decided_date", "")
+                holding_type = case_data.get("interprets", {}).get("holding_type", "")
 
-                interp = case_data.get("interprets", {})
-                holding_type = interp.get("holding_type", "")
-
-                lines.append(f"- **{case_name}** ({case_citation})")
+                chunk.append(f"- **{case_name}** ({case_citation})\n")
                 if court and decided:
-                    lines.append(f"  - {court}, {decided}")
+                    chunk.append(f"  - {court}, {decided}\n")
                 if holding_type:
-                    lines.append(f"  - *{holding_type}*")
-            lines.append("")
+                    chunk.append(f"  - *{holding_type}*\n")
+            w("".join(chunk))
 
         # Current Text (truncated)
         if self.current_text:
-            lines.append("## Current Text")
-            lines.append("")
-            lines.append("```")
-            # Truncate to first 2000 chars
-            text = self.current_text[:2000]
-            if len(self.current_text) > 2000:
-                text += "\n... [truncated]"
-            lines.append(text)
-            lines.append("```")
-            lines.append("")
-
-        return "\n".join(lines)
-
-    def _get_event_emoji(self, event_type: str) -> str:
-        """Get an emoji for the event type."""
-        emojis = {
-            "enacted": "📜",
-            "amended": "✏️",
-            "interpreted": "⚖️",
-            "implemented": "📋",
-            "repealed": "🗑️",
-            "renamed": "🏷️",
-        }
-        return emojis.get(event_type, "📌")
+            text = self.current_text
+            if len(text) > 2000:
+                # Truncate to first 2000 chars
+                text = text[:2000] + "\n... [truncated]"
+            w(f"\n## Current Text\n\n```\n{text}\n```\n")
+
+        return buf.getvalue()
 
 
 class StoryOfALaw:
@@ -225,8 +256,9 @@ class StoryOfALaw:
         # Print as markdown
         print(story.to_markdown())
 
-        # Get as JSON-serializable dict
+        # Get as JSON-serializable dict, or encoded JSON
         data = story.to_dict()
+        body = story.to_json()
     """
 
     def __init__(self, graph_store: Neo4jStore | None = None):
@@ -234,16 +266,37 @@ class StoryOfALaw:
         Initialize the story generator.
 
         Args:
-            graph_store: Neo4j store instance (or creates one from env vars)
+            graph_store: Neo4j store instance (or creates one from env vars).
+                Its driver connects on the first query, not here.
         """
         self.graph = graph_store or Neo4jStore()
-        self.graph.connect()
         self.citation_parser = CitationParser()
+        self._story_cache: OrderedDict[str, LawStory] = OrderedDict()
+        self._story_cache_lock = threading.Lock()
 
     def close(self):
         """Clean up resources."""
         self.graph.close()
 
+    def clear_cache(self):
+        """Forget cached stories, e.g. after the graph has been re-ingested."""
+        with self._story_cache_lock:
+            self._story_cache.clear()
+
+    def _cached_story(self, citation: str) -> LawStory | None:
+        with self._story_cache_lock:
+            story = self._story_cache.get(citation)
+            if story is not None:
+                self._story_cache.move_to_end(citation)
+            return story
+
+    def _cache_story(self, story: LawStory):
+        with self._story_cache_lock:
+            self._story_cache[story.citation] = story
+            self._story_cache.move_to_end(story.citation)
+            while len(self._story_cache) > STORY_CACHE_SIZE:
+                self._story_cache.popitem(last=False)
+
     def get_story(self, citation: str) -> LawStory | None:
         """
         Get the complete story for a USC citation.
@@ -259,35 +312,18 @@ class StoryOfALaw:
         if not normalized:
             return None
 
-        # Get the section
-        section = self.graph.get_usc_section(normalized)
-        if not section:
-            return None
-
-        # Get all related data
-        enacting_law = self.graph.get_enacting_law(normalized)
-        amendments = self.graph.get_amendments(normalized)
-        regulations = self.graph.get_implementing_regulations(normalized)
-        cases = self.graph.get_interpreting_cases(normalized)
+        story = self._cached_story(normalized)
+        if story:
+            return story
 
-        # Build timeline
-        timeline = self._build_timeline(section, enacting_law, amendments, regulations, cases)
+        # Get the section and all related data in one round-trip
+        bundle = self.graph.get_story_bundle(normalized)
+        if not bundle:
+            return None
 
-        # Get related sections (same chapter)
-        related = self._get_related_sections(section)
-
-        return LawStory(
-            citation=normalized,
-            section_name=section.get("section_name"),
-            title_name=section.get("title_name"),
-            current_text=section.get("text"),
-            timeline=timeline,
-            enacting_law=enacting_law,
-            amendments=amendments,
-            regulations=regulations,
-            cases=cases,
-            related_sections=related,
-        )
+        story = self._story_from_bundle(normalized, bundle)
+        self._cache_story(story)
+        return story
 
     def get_story_markdown(self, citation: str) -> str | None:
         """Get the story as a markdown string."""
@@ -307,37 +343,46 @@ class StoryOfALaw:
             List of LawStory objects for matching sections
         """
         results = self.graph.search_sections(query, limit=10)
-        stories = []
 
-        for result in results:
-            section = result.get("section", {})
-            citation = section.get("id")
-            if citation:
-                story = self.get_story(citation)
-                if story:
-                    stories.append(story)
+        # Search hits are already canonical ids; fetch all their bundles at once
+        ids = list(dict.fromkeys(
+            r["section"]["id"] for r in results if r.get("section", {}).get("id")
+        ))
+        stories = {i: story for i in ids if (story := self._cached_story(i))}
+        bundles = self.graph.get_stories_bundle([i for i in ids if i not in stories])
+        for i, bundle in bundles.items():
+            stories[i] = self._story_from_bundle(i, bundle)
+            self._cache_story(stories[i])
+
+        return [stories[i] for i in ids if i in stories]
+
+    def _story_from_bundle(self, citation: str, bundle: dict[str, Any]) -> LawStory:
+        """Assemble a LawStory from a Neo4jStore story bundle."""
+        section = bundle["section"]
+        enacting_law = bundle["enacting_law"]
+        amendments = bundle["amendments"]
+        regulations = bundle["regulations"]
+        cases = bundle["cases"]
 
-        return stories
+        # Build timeline
+        timeline = self._build_timeline(section, enacting_law, amendments, regulations, cases)
+
+        return LawStory(
+            citation=citation,
+            section_name=section.get("section_name"),
+            title_name=section.get("title_name"),
+            current_text=section.get("text"),
+            timeline=timeline,
+            enacting_law=enacting_law,
+            amendments=amendments,
+            regulations=regulations,
+            cases=cases,
+            related_sections=bundle["related"],
+        )
 
     def _normalize_citation(self, citation: str) -> str | None:
         """Normalize a citation to canonical form."""
-        # Try to parse it
-        parsed = self.citation_parser.parse(citation)
-
-        # Find USC citation
-        for cite in parsed:
-            if cite.citation_type == CitationType.USC:
-                return cite.canonical
-
-        # If parsing didn't work, try simple normalization
-        # "42 U.S.C. § 1395" -> "42 USC 1395"
-        import re
-
-        match = re.match(r"(\d+)\s*U\.?\s*S\.?\s*C\.?\s*§?\s*(\d+[a-z]*)", citation, re.IGNORECASE)
-        if match:
-            return f"{match.group(1)} USC {match.group(2)}"
-
-        return None
+        return _normalize_usc_citation(citation)
 
     def _build_timeline(
         self,
@@ -353,18 +398,9 @@ class StoryOfALaw:
         # Enactment
         if enacting_law:
             pl = enacting_law.get("public_law", {})
-            enacted_date = pl.get("enacted_date")
-            if enacted_date:
-                try:
-                    event_date = date.fromisoformat(enacted_date)
-                except (ValueError, TypeError):
-                    event_date = None
-            else:
-                event_date = None
-
             events.append(
                 TimelineEvent(
-                    date=event_date,
+                    date=_parse_iso_date(pl.get("enacted_date")),
                     event_type="enacted",
                     title=f"Enacted by {pl.get('id', 'Unknown')}",
                     description=pl.get("title", ""),
@@ -379,20 +415,10 @@ class StoryOfALaw:
 
             effective = amend_info.get("effective_date")
             if effective:
-                try:
-                    event_date = date.fromisoformat(effective)
-                except (ValueError, TypeError):
-                    event_date = None
+                event_date = _parse_iso_date(effective)
             else:
                 # Fall back to enacted date
-                enacted = pl.get("enacted_date")
-                if enacted:
-                    try:
-                        event_date = date.fromisoformat(enacted)
-                    except (ValueError, TypeError):
-                        event_date = None
-                else:
-                    event_date = None
+                event_date = _parse_iso_date(pl.get("enacted_date"))
 
             events.append(
                 TimelineEvent(
@@ -409,18 +435,9 @@ class StoryOfALaw:
             case = case_data.get("case", {})
             interp = case_data.get("interprets", {})
 
-            decided = case.get("decided_date")
-            if decided:
-                try:
-                    event_date = date.fromisoformat(decided)
-                except (ValueError, TypeError):
-                    event_date = None
-            else:
-                event_date = None
-
             events.append(
                 TimelineEvent(
-                    date=event_date,
+                    date=_parse_iso_date(case.get("decided_date")),
                     event_type="interpreted",
                     title=f"Interpreted in {case.get('name', 'Unknown')}",
                     description=interp.get("interpretation_summary", ""),
@@ -434,29 +451,6 @@ class StoryOfALaw:
 
         return events
 
-    def _get_related_sections(self, section: dict) -> list[dict]:
-        """Get other sections in the same chapter."""
-        title = section.get("citation_title") or section.get("title")
-        chapter = section.get("chapter")
-
-        if not title or not chapter:
-            return []
-
-        # Query for sections in the same chapter
-        with self.graph.session() as session:
-            result = session.run(
-                """
-                MATCH (usc:USCSection)
-                WHERE usc.title = $title AND usc.chapter = $chapter AND usc.id <> $id
-                RETURN usc
-                LIMIT 20
-                """,
-                title=title,
-                chapter=chapter,
-                id=section.get("id"),
-            )
-            return [dict(r["usc"]) for r in result]
-
 
 # =============================================================================
 # CLI
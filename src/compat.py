@@ -0,0 +1,6 @@
+"""Shims for differences between the Python versions the package supports."""
+
+import sys
+
+# dataclass(slots=True) needs Python 3.10+; spread into @dataclass(...)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
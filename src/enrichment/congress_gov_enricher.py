@@ -37,6 +37,7 @@ from rich.table import Table
 
 from ..graph.neo4j_store import Neo4jStore
 from ..adapters.congress_gov import CongressGovAdapter
+from ..models import PublicLaw
 
 console = Console()
 
@@ -47,6 +48,9 @@ REQUEST_DELAY = 0.75
 # Pre-93rd Congress (before 1973) data may not be available
 MINIMUM_CONGRESS = 93
 
+# PublicLaw nodes written per UNWIND query
+UPDATE_BATCH_SIZE = 1000
+
 
 class CongressGovEnricher:
     """
@@ -228,29 +232,52 @@ class CongressGovEnricher:
         Returns:
             True if updated successfully
         """
+        self.update_laws_batch([{
+            "id": node_id,
+            "title": title,
+            "bill_origin_congress": bill_origin_congress,
+            "bill_origin_bill_type": bill_origin_bill_type,
+            "bill_origin_number": bill_origin_number,
+            "enacted_date": enacted_date,
+            "source_url": source_url,
+        }])
+        return True
+
+    def update_laws_batch(self, rows: list[dict]) -> int:
+        """
+        Update many PublicLaw nodes with enrichment data.
+
+        Each row has the update_law_with_enrichment arguments as keys
+        (id, title, bill_origin_*, enacted_date, source_url). Rows are
+        written UPDATE_BATCH_SIZE at a time, one query per batch.
+
+        Returns the number of rows written.
+        """
+        if not rows:
+            return 0
+
+        retrieved_at = datetime.utcnow().isoformat()
+
         with self.graph.session() as session:
-            session.run("""
-                MATCH (pl:PublicLaw {id: $id})
-                SET pl.title = $title,
-                    pl.bill_origin_congress = $bill_origin_congress,
-                    pl.bill_origin_bill_type = $bill_origin_bill_type,
-                    pl.bill_origin_number = $bill_origin_number,
-                    pl.enacted_date = $enacted_date,
-                    pl.enrichment_source_url = $source_url,
-                    pl.enrichment_retrieved_at = $retrieved_at,
-                    pl.enrichment_attempted = true,
-                    pl.enrichment_failed = false
-            """,
-                id=node_id,
-                title=title,
-                bill_origin_congress=bill_origin_congress,
-                bill_origin_bill_type=bill_origin_bill_type,
-                bill_origin_number=bill_origin_number,
-                enacted_date=enacted_date,
-                source_url=source_url,
-                retrieved_at=datetime.utcnow().isoformat(),
-            )
-            return True
+            for i in range(0, len(rows), UPDATE_BATCH_SIZE):
+                session.run("""
+                    UNWIND $rows AS r
+                    MATCH (pl:PublicLaw {id: r.id})
+                    SET pl.title = r.title,
+                        pl.bill_origin_congress = r.bill_origin_congress,
+                        pl.bill_origin_bill_type = r.bill_origin_bill_type,
+                        pl.bill_origin_number = r.bill_origin_number,
+                        pl.enacted_date = r.enacted_date,
+                        pl.enrichment_source_url = r.source_url,
+                        pl.enrichment_retrieved_at = $retrieved_at,
+                        pl.enrichment_attempted = true,
+                        pl.enrichment_failed = false
+                """,
+                    rows=rows[i : i + UPDATE_BATCH_SIZE],
+                    retrieved_at=retrieved_at,
+                )
+
+        return len(rows)
 
     def mark_enrichment_failed(self, node_id: str, reason: str | None = None) -> bool:
         """
@@ -259,19 +286,52 @@ class CongressGovEnricher:
         This prevents retrying nodes that are known to not have data
         (e.g., pre-93rd Congress laws not in Congress.gov).
         """
+        self.mark_failed_batch([{"id": node_id, "reason": reason}])
+        return True
+
+    def mark_failed_batch(self, rows: list[dict]) -> int:
+        """
+        Mark many PublicLaw nodes as failed enrichment.
+
+        Each row is {"id": ..., "reason": ...}. Returns the number of rows
+        written.
+        """
+        if not rows:
+            return 0
+
+        retrieved_at = datetime.utcnow().isoformat()
+
         with self.graph.session() as session:
-            session.run("""
-                MATCH (pl:PublicLaw {id: $id})
-                SET pl.enrichment_attempted = true,
-                    pl.enrichment_failed = true,
-                    pl.enrichment_failed_reason = $reason,
-                    pl.enrichment_retrieved_at = $retrieved_at
-            """,
-                id=node_id,
-                reason=reason,
-                retrieved_at=datetime.utcnow().isoformat(),
-            )
-            return True
+            for i in range(0, len(rows), UPDATE_BATCH_SIZE):
+                session.run("""
+                    UNWIND $rows AS r
+                    MATCH (pl:PublicLaw {id: r.id})
+                    SET pl.enrichment_attempted = true,
+                        pl.enrichment_failed = true,
+                        pl.enrichment_failed_reason = r.reason,
+                        pl.enrichment_retrieved_at = $retrieved_at
+                """,
+                    rows=rows[i : i + UPDATE_BATCH_SIZE],
+                    retrieved_at=retrieved_at,
+                )
+
+        return len(rows)
+
+    @staticmethod
+    def _enrichment_row(node_id: str, law: PublicLaw) -> dict:
+        """Build an update_laws_batch row from a fetched PublicLaw."""
+        bill_origin = law.bill_origin
+        return {
+            "id": node_id,
+            "title": law.title,
+            "bill_origin_congress": bill_origin.congress if bill_origin else None,
+            "bill_origin_bill_type": (
+                bill_origin.bill_type.value if bill_origin and bill_origin.bill_type else None
+            ),
+            "bill_origin_number": bill_origin.number if bill_origin else None,
+            "enacted_date": law.enacted_date.isoformat() if law.enacted_date else None,
+            "source_url": law.provenance.source_url if law.provenance else None,
+        }
 
     # =========================================================================
     # Enrichment Logic
@@ -313,26 +373,8 @@ class CongressGovEnricher:
                 self.mark_enrichment_failed(node_id, "Not found in Congress.gov API")
                 return False
 
-            # Extract bill origin info if present
-            bill_origin_congress = None
-            bill_origin_type = None
-            bill_origin_number = None
-
-            if law.bill_origin:
-                bill_origin_congress = law.bill_origin.congress
-                bill_origin_type = law.bill_origin.bill_type.value if law.bill_origin.bill_type else None
-                bill_origin_number = law.bill_origin.number
-
             # Update the node
-            self.update_law_with_enrichment(
-                node_id=node_id,
-                title=law.title,
-                bill_origin_congress=bill_origin_congress,
-                bill_origin_bill_type=bill_origin_type,
-                bill_origin_number=bill_origin_number,
-                enacted_date=law.enacted_date.isoformat() if law.enacted_date else None,
-                source_url=law.provenance.source_url if law.provenance else None,
-            )
+            self.update_laws_batch([self._enrichment_row(node_id, law)])
 
             return True
 
@@ -341,7 +383,7 @@ class CongressGovEnricher:
             self.mark_enrichment_failed(node_id, str(e))
             return False
 
-    def enrich_congress(self, congress: int) -> dict:
+    def enrich_congress(self, congress: int, laws_to_enrich: list[dict] | None = None) -> dict:
         """
         Enrich all PublicLaw nodes from a specific Congress.
 
@@ -351,6 +393,8 @@ class CongressGovEnricher:
 
         Args:
             congress: Congress number to enrich
+            laws_to_enrich: This Congress's get_unenriched_laws rows, if the
+                caller already has them (default: query them)
 
         Returns:
             Dict with enrichment statistics
@@ -358,7 +402,8 @@ class CongressGovEnricher:
         console.print(f"\n[bold blue]Enriching Public Laws from {congress}th Congress[/bold blue]")
 
         # Get laws that need enrichment for this Congress
-        laws_to_enrich = self.get_unenriched_laws(congress)
+        if laws_to_enrich is None:
+            laws_to_enrich = self.get_unenriched_laws(congress)
 
         if not laws_to_enrich:
             console.print("[yellow]No laws need enrichment for this Congress[/yellow]")
@@ -371,11 +416,8 @@ class CongressGovEnricher:
             console.print(f"[yellow]Congress {congress} predates Congress.gov data (minimum: {MINIMUM_CONGRESS})[/yellow]")
             console.print("Marking all as enrichment_failed...")
 
-            for law in laws_to_enrich:
-                self.mark_enrichment_failed(
-                    law["id"],
-                    f"Pre-{MINIMUM_CONGRESS}rd Congress - data not available"
-                )
+            reason = f"Pre-{MINIMUM_CONGRESS}rd Congress - data not available"
+            self.mark_failed_batch([{"id": law["id"], "reason": reason} for law in laws_to_enrich])
 
             return {"total": len(laws_to_enrich), "enriched": 0, "failed": len(laws_to_enrich)}
 
@@ -415,41 +457,27 @@ class CongressGovEnricher:
 
                 progress.update(task, description="Processing fetched laws...")
 
-                # Now update the nodes
+                # Write everything the bulk fetch found in batches first, so
+                # an interrupted run keeps them
+                found_rows = [
+                    self._enrichment_row(f"Pub. L. {key[0]}-{key[1]}", found_laws[key])
+                    for key in needed_laws if key in found_laws
+                ]
+                self.update_laws_batch(found_rows)
+                enriched += len(found_rows)
+                progress.advance(task, len(found_rows))
+
+                # Laws not found in bulk fetch - try individual lookups
                 for key in needed_laws:
+                    if key in found_laws:
+                        continue
                     congress_num, law_num = key
-                    node_id = f"Pub. L. {congress_num}-{law_num}"
 
-                    if key in found_laws:
-                        law = found_laws[key]
-
-                        # Extract bill origin info
-                        bill_origin_congress = None
-                        bill_origin_type = None
-                        bill_origin_number = None
-
-                        if law.bill_origin:
-                            bill_origin_congress = law.bill_origin.congress
-                            bill_origin_type = law.bill_origin.bill_type.value if law.bill_origin.bill_type else None
-                            bill_origin_number = law.bill_origin.number
-
-                        self.update_law_with_enrichment(
-                            node_id=node_id,
-                            title=law.title,
-                            bill_origin_congress=bill_origin_congress,
-                            bill_origin_bill_type=bill_origin_type,
-                            bill_origin_number=bill_origin_number,
-                            enacted_date=law.enacted_date.isoformat() if law.enacted_date else None,
-                            source_url=law.provenance.source_url if law.provenance else None,
-                        )
+                    time.sleep(REQUEST_DELAY)
+                    if self.enrich_single_law(congress_num, law_num, adapter):
                         enriched += 1
                     else:
-                        # Law not found in bulk fetch - try individual lookup
-                        time.sleep(REQUEST_DELAY)
-                        if self.enrich_single_law(congress_num, law_num, adapter):
-                            enriched += 1
-                        else:
-                            failed += 1
+                        failed += 1
 
                     progress.advance(task)
 
@@ -508,8 +536,9 @@ class CongressGovEnricher:
         total_enriched = 0
         total_failed = 0
 
+        # Reuse the rows fetched above rather than re-querying each Congress
         for cong in sorted(by_congress.keys()):
-            result = self.enrich_congress(cong)
+            result = self.enrich_congress(cong, by_congress[cong])
             total_enriched += result["enriched"]
             total_failed += result["failed"]
 
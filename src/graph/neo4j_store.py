@@ -19,7 +19,7 @@ from datetime import date, datetime
 from typing import Any, Iterator
 
 from neo4j import GraphDatabase, Driver, Session, Result
-from neo4j.exceptions import ServiceUnavailable
+from neo4j.exceptions import ClientError, ServiceUnavailable
 
 from ..models import (
     USCSection,
@@ -76,6 +76,8 @@ class Neo4jStore:
         self.user = user or os.getenv("NEO4J_USER", "neo4j")
         self.password = password or os.getenv("NEO4J_PASSWORD", "password")
         self._driver: Driver | None = None
+        # Whether apoc.meta.stats() can be called (None until first tried)
+        self._apoc_available: bool | None = None
 
     def connect(self) -> None:
         """Establish connection to Neo4j."""
@@ -141,6 +143,7 @@ class Neo4jStore:
                 ("CRSReport", "id"),
                 ("LobbyingRecord", "id"),
                 ("RFIComment", "id"),
+                ("Chapter", "id"),
             ]
 
             for label, prop in constraints:
@@ -157,6 +160,7 @@ class Neo4jStore:
             indexes = [
                 ("USCSection", "title"),
                 ("USCSection", "section"),
+                ("USCSection", "amendment_count"),
                 ("PublicLaw", "congress"),
                 ("Bill", "congress"),
                 ("Bill", "status"),
@@ -173,6 +177,15 @@ class Neo4jStore:
                 except Exception:
                     pass
 
+            # Relationship index for ordering sections by enactment
+            try:
+                session.run(
+                    "CREATE INDEX enacts_enacted_at_idx IF NOT EXISTS "
+                    "FOR ()-[r:ENACTS]-() ON (r.enacted_at)"
+                )
+            except Exception:
+                pass
+
             # Full-text indexes for search
             try:
                 session.run(
@@ -182,6 +195,15 @@ class Neo4jStore:
             except Exception:
                 pass
 
+            # Name/citation index behind the API's /search endpoint
+            try:
+                session.run(
+                    "CREATE FULLTEXT INDEX usc_search_idx IF NOT EXISTS "
+                    "FOR (n:USCSection) ON EACH [n.section_name, n.id]"
+                )
+            except Exception:
+                pass
+
     def clear_all(self, confirm: bool = False) -> None:
         """
         Delete all nodes and relationships. Requires explicit confirmation.
@@ -290,6 +312,9 @@ class Neo4jStore:
                 props=props,
             )
 
+        if rel_type == "AMENDS":
+            self.refresh_amendment_counts([edge.to_id])
+
     def upsert_edges_batch(self, edges: list[BaseEdge], batch_size: int = 1000) -> int:
         """Batch upsert multiple edges of the same type."""
         if not edges:
@@ -320,8 +345,90 @@ class Neo4jStore:
                 )
                 count += len(batch)
 
+        if rel_type == "AMENDS":
+            self.refresh_amendment_counts(list({e.to_id for e in edges}))
+
         return count
 
+    def refresh_amendment_counts(self, section_ids: list[str] | None = None) -> int:
+        """
+        Recompute USCSection.amendment_count from incoming AMENDS edges.
+
+        Keeps the count denormalized on the node so "most amended" queries
+        read an indexed property instead of aggregating edges per request.
+        Recounting (rather than incrementing) keeps re-ingesting idempotent.
+
+        Args:
+            section_ids: Only refresh these sections (default: every section)
+
+        Returns the number of sections updated.
+        """
+        if section_ids is None:
+            match = "MATCH (usc:USCSection) "
+        else:
+            match = "UNWIND $ids AS section_id MATCH (usc:USCSection {id: section_id}) "
+
+        with self.session() as session:
+            record = session.run(
+                match +
+                "SET usc.amendment_count = size([(usc)<-[:AMENDS]-(:PublicLaw) | 1]) "
+                "RETURN count(usc) AS updated",
+                ids=section_ids,
+            ).single()
+            return record["updated"] if record else 0
+
+    def stamp_enactment_dates(self) -> int:
+        """
+        Copy each enacting law's date onto its ENACTS edges as enacted_at.
+
+        Lets "newest sections" queries order on the indexed edge property
+        instead of joining back to the PublicLaw. Safe to re-run.
+
+        Returns the number of edges stamped.
+        """
+        with self.session() as session:
+            record = session.run(
+                """
+                MATCH (pl:PublicLaw)-[r:ENACTS]->(:USCSection)
+                WHERE pl.enacted_date IS NOT NULL
+                SET r.enacted_at = pl.enacted_date
+                RETURN count(r) AS stamped
+                """
+            ).single()
+            return record["stamped"] if record else 0
+
+    def link_chapters(self, section_ids: list[str] | None = None) -> int:
+        """
+        Create Chapter nodes and IN_CHAPTER edges from USCSection.chapter.
+
+        Sections that share a chapter are then one hop apart through their
+        Chapter node instead of joined on a property. Chapter numbers repeat
+        across titles, so a chapter's id includes the title taken from the
+        section id (e.g. "42 USC ch. 149"). Safe to re-run.
+
+        Args:
+            section_ids: Only link these sections (default: every section)
+
+        Returns the number of sections linked.
+        """
+        if section_ids is None:
+            match = "MATCH (usc:USCSection) "
+        else:
+            match = "UNWIND $ids AS section_id MATCH (usc:USCSection {id: section_id}) "
+
+        with self.session() as session:
+            record = session.run(
+                match +
+                "WITH usc WHERE usc.chapter IS NOT NULL "
+                "WITH usc, split(usc.id, ' ')[0] + ' USC ch. ' + usc.chapter AS chapter_id "
+                "MERGE (c:Chapter {id: chapter_id}) "
+                "ON CREATE SET c.chapter = usc.chapter, c.name = usc.chapter_name "
+                "MERGE (usc)-[:IN_CHAPTER]->(c) "
+                "RETURN count(usc) AS linked",
+                ids=section_ids,
+            ).single()
+            return record["linked"] if record else 0
+
     # =========================================================================
     # Query Helpers - Common Traversal Patterns
     # =========================================================================
@@ -389,6 +496,79 @@ class Neo4jStore:
             )
             return [{"case": dict(r["c"]), "interprets": dict(r["i"])} for r in result]
 
+    def get_story_bundle(self, usc_canonical: str) -> dict[str, Any] | None:
+        """
+        Get a USC section with everything its story needs, in one query.
+
+        Equivalent to get_usc_section, get_enacting_law, get_amendments,
+        get_implementing_regulations and get_interpreting_cases combined,
+        plus up to 20 other sections from the same chapter.
+
+        Returns {section, enacting_law, amendments, regulations, cases,
+        related} or None if the section doesn't exist.
+        """
+        return self.get_stories_bundle([usc_canonical]).get(usc_canonical)
+
+    def get_stories_bundle(self, usc_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Batch form of get_story_bundle: one query for any number of sections.
+
+        Pattern comprehensions keep the four lists independent (no
+        cross-product rows); they can't be ordered in Cypher, so the
+        amendment and case orderings of the single-purpose helpers are
+        applied here.
+
+        Returns bundles keyed by section id; missing sections are absent.
+        """
+        if not usc_ids:
+            return {}
+
+        with self.session() as session:
+            result = session.run(
+                """
+                UNWIND $ids AS id
+                MATCH (usc:USCSection {id: id})
+                RETURN id, usc,
+                    [(pl:PublicLaw)-[e:ENACTS]->(usc) |
+                        {public_law: properties(pl), enacts: properties(e)}] AS enacting,
+                    [(pl:PublicLaw)-[a:AMENDS]->(usc) |
+                        {public_law: properties(pl), amendment: properties(a)}] AS amendments,
+                    [(cfr:CFRSection)-[i:IMPLEMENTS]->(usc) |
+                        {cfr: properties(cfr), implements: properties(i)}] AS regulations,
+                    [(c:Case)-[i:INTERPRETS]->(usc) |
+                        {case: properties(c), interprets: properties(i)}] AS cases,
+                    [(usc)-[:IN_CHAPTER]->(:Chapter)<-[:IN_CHAPTER]-(other:USCSection) |
+                        properties(other)][0..20] AS related
+                """,
+                ids=list(usc_ids),
+            )
+            return {record["id"]: self._story_bundle(record) for record in result}
+
+    @staticmethod
+    def _story_bundle(record: Any) -> dict[str, Any]:
+        """Shape a get_stories_bundle row like the single-purpose helpers."""
+        amendments = record["amendments"]
+        # ORDER BY a.effective_date: ascending, missing dates last
+        amendments.sort(key=lambda r: (
+            r["amendment"].get("effective_date") is None,
+            r["amendment"].get("effective_date") or "",
+        ))
+        cases = record["cases"]
+        # ORDER BY c.decided_date DESC: missing dates first
+        cases.sort(key=lambda r: (
+            r["case"].get("decided_date") is None,
+            r["case"].get("decided_date") or "",
+        ), reverse=True)
+
+        return {
+            "section": dict(record["usc"]),
+            "enacting_law": record["enacting"][0] if record["enacting"] else None,
+            "amendments": amendments,
+            "regulations": record["regulations"],
+            "cases": cases,
+            "related": record["related"],
+        }
+
     def get_related_lobbying(self, bill_canonical: str) -> list[dict[str, Any]]:
         """Get lobbying records related to a bill."""
         with self.session() as session:
@@ -469,26 +649,45 @@ class Neo4jStore:
             )
             return [{"section": dict(r["node"]), "score": r["score"]} for r in result]
 
-    def get_stats(self) -> dict[str, int]:
-        """Get counts of nodes and relationships."""
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Get counts of nodes by label and relationships by type.
+
+        Uses apoc.meta.stats(), which reads Neo4j's counts store instead of
+        scanning the graph. Without APOC, falls back to a single UNION query
+        (one round-trip) over all nodes and relationships.
+        """
         with self.session() as session:
-            # Node counts
-            node_result = session.run(
-                """
-                MATCH (n)
-                RETURN labels(n)[0] as label, count(*) as count
-                """
-            )
-            nodes = {r["label"]: r["count"] for r in node_result}
+            if self._apoc_available is not False:
+                try:
+                    record = session.run(
+                        """
+                        CALL apoc.meta.stats() YIELD labels, relTypesCount
+                        RETURN labels, relTypesCount
+                        """
+                    ).single()
+                    self._apoc_available = True
+                    return {
+                        "nodes": dict(record["labels"]),
+                        "relationships": dict(record["relTypesCount"]),
+                    }
+                except ClientError:
+                    # Procedure not installed; don't try again on this store
+                    self._apoc_available = False
 
-            # Relationship counts
-            rel_result = session.run(
+            result = session.run(
                 """
+                MATCH (n)
+                RETURN 'node' as kind, labels(n)[0] as key, count(*) as count
+                UNION ALL
                 MATCH ()-[r]->()
-                RETURN type(r) as type, count(*) as count
+                RETURN 'relationship' as kind, type(r) as key, count(*) as count
                 """
             )
-            rels = {r["type"]: r["count"] for r in rel_result}
+            nodes: dict[str, int] = {}
+            rels: dict[str, int] = {}
+            for r in result:
+                (nodes if r["kind"] == "node" else rels)[r["key"]] = r["count"]
 
             return {"nodes": nodes, "relationships": rels}
 
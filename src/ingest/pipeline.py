@@ -141,6 +141,7 @@ class IngestionPipeline:
             task2 = progress.add_task("Inserting into graph...", total=len(sections))
 
             count = self.graph.upsert_nodes_batch(sections, batch_size=batch_size)
+            self.graph.link_chapters([s.id for s in sections])
             progress.update(task2, completed=len(sections))
 
         self.stats["usc_sections"] += count
@@ -266,6 +267,7 @@ class IngestionPipeline:
         # Batch insert edges
         if enacts_edges:
             count = self.graph.upsert_edges_batch(enacts_edges)
+            self.graph.stamp_enactment_dates()
             edges_created += count
             self.stats["enacts_edges"] += count
             console.print(f"[green]✓[/green] Created {count} ENACTS edges")
@@ -272,7 +272,8 @@ class NarrativeFact(BaseModel):
         content: str,
         tier: int,
         source: str,
-        hedging: str | None = None
+        hedging: str | None = None,
+        **fields: Any,
     ) -> "NarrativeFact":
         """Create a fact with confidence derived from tier."""
         confidence = TIER_TO_CONFIDENCE.get(tier, ConfidenceLevel.SPECULATIVE)
@@ -290,6 +291,7 @@ class NarrativeFact(BaseModel):
             confidence=confidence,
             source=source,
             hedging=hedging,
+            **fields,
         )
 
     def to_prose(self, include_hedging: bool = True) -> str:
@@ -309,6 +311,13 @@ class NarrativeFact(BaseModel):
         }
 
 
+class PredecessorFact(NarrativeFact):
+    """A fact about a predecessor law, keeping the law's details structured."""
+    citation: str
+    law_title: str = ""
+    year: int | None = None
+
+
 class TimelineEntry(BaseModel):
     """A single entry in a chronological timeline."""
     date: date | None
@@ -555,7 +564,7 @@ class ChipsNarrative(BaseModel):
     enacted_date: date = CHIPS_ENACTED_DATE
     overview: str
     scope: NarrativeFact  # "Created X sections, amended Y sections"
-    predecessors: list[NarrativeFact] = Field(default_factory=list)
+    predecessors: list[PredecessorFact] = Field(default_factory=list)
     by_topic: list[TopicGroup] = Field(default_factory=list)
     sections_created: list[dict[str, Any]] = Field(default_factory=list)
     sections_amended: list[dict[str, Any]] = Field(default_factory=list)
@@ -1317,7 +1326,7 @@ class NarrativeGenerator:
             learn_more=learn_more,
         )
 
-    def _build_predecessor_facts(self) -> list[NarrativeFact]:
+    def _build_predecessor_facts(self) -> list[PredecessorFact]:
         """Build facts about CHIPS predecessor laws."""
         facts = []
 
@@ -1333,26 +1342,31 @@ class NarrativeGenerator:
                         date_obj = date.fromisoformat(enacted)
                         year = date_obj.year
                     except (ValueError, TypeError):
-                        year = ""
+                        year = None
                 else:
-                    year = ""
+                    year = None
 
                 content = f"{pred['citation']}: {pred['title']}"
                 if year:
                     content += f" ({year})"
 
-                facts.append(self._track_fact(NarrativeFact.from_tier(
+                facts.append(self._track_fact(PredecessorFact.from_tier(
                     content=content,
                     tier=1,
-                    source="PublicLaw node in graph"
+                    source="PublicLaw node in graph",
+                    citation=pred["citation"],
+                    law_title=pred["title"],
+                    year=year,
                 )))
             else:
                 # Using hardcoded data - Tier 5
-                facts.append(self._track_fact(NarrativeFact.from_tier(
+                facts.append(self._track_fact(PredecessorFact.from_tier(
                     content=f"{pred['citation']}: {pred['title']}",
                     tier=5,
                     source="Curated external reference",
-                    hedging="Historical context"
+                    hedging="Historical context",
+                    citation=pred["citation"],
+                    law_title=pred["title"],
                 )))
 
         return facts
@@ -46,6 +46,32 @@ from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Iterator
 
+# re2 matches in guaranteed linear time (no backtracking) - optional, used for
+# the citation patterns when installed
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = None
+    RE2_AVAILABLE = False
+
+
+def _compile_pattern(pattern: str):
+    """
+    Compile a case-insensitive citation pattern.
+
+    Uses re2 when available; its match objects offer the group/start/end API
+    the parser relies on. re2's \\s is ASCII-only, so it is widened to Unicode
+    separators to keep matching the non-breaking spaces common in USLM text.
+    Patterns re2 rejects use the standard library engine.
+    """
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile("(?i)" + pattern.replace(r"\s", r"[\s\p{Z}]"))
+        except re2.error:
+            pass
+    return re.compile(pattern, re.IGNORECASE)
+
 
 class CitationType(Enum):
     """Types of citations we can parse."""
@@ -107,87 +133,73 @@ class CitationParser:
     # ==========================================================================
 
     # Standard forms: "42 U.S.C. § 1395" or "42 USC 1395"
-    USC_STANDARD = re.compile(
+    USC_STANDARD = _compile_pattern(
         r"\b(\d{1,2})\s*"  # Title number
         r"U\.?\s*S\.?\s*C\.?\s*"  # U.S.C. with variations
         r"(?:§+\s*|[Ss]ections?\s+|[Ss]ec\.?\s+)?"  # Optional section symbol
         r"(\d+[a-z]*(?:-\d+[a-z]*)?)"  # Section number (e.g., 1395, 1395a, 1395-1)
         r"(?:\s*\(([^)]+(?:\)\s*\([^)]+)*)\))?"  # Subsections (a)(1)(A)
         r"(?:\s+et\s+seq\.?)?"  # Optional "et seq."
-        ,
-        re.IGNORECASE,
     )
 
     # Inverted form: "section 1395 of title 42"
-    USC_INVERTED = re.compile(
+    USC_INVERTED = _compile_pattern(
         r"[Ss]ections?\s+(\d+[a-z]*(?:-\d+[a-z]*)?)"  # Section
         r"(?:\s*\(([^)]+(?:\)\s*\([^)]+)*)\))?"  # Subsections
         r"\s+of\s+[Tt]itle\s+(\d{1,2})"  # Title
-        ,
-        re.IGNORECASE,
     )
 
     # ==========================================================================
     # Public Law Patterns
     # ==========================================================================
 
-    PUBLIC_LAW = re.compile(
+    PUBLIC_LAW = _compile_pattern(
         r"\b(?:Pub(?:lic)?\.?\s*L(?:aw)?\.?\s*(?:No\.?\s*)?|P\.?\s*L\.?\s*)"
         r"(\d{1,3})\s*[-–—]\s*(\d{1,4})"  # Congress-LawNumber
-        ,
-        re.IGNORECASE,
     )
 
     # ==========================================================================
     # Bill Patterns
     # ==========================================================================
 
-    BILL = re.compile(
+    BILL = _compile_pattern(
         r"\b(H\.?\s*R\.?|S\.?|H\.?\s*J\.?\s*Res\.?|S\.?\s*J\.?\s*Res\.?|"
         r"H\.?\s*Con\.?\s*Res\.?|S\.?\s*Con\.?\s*Res\.?|"
         r"H\.?\s*Res\.?|S\.?\s*Res\.?)"  # Bill type
         r"\s*(\d{1,5})"  # Bill number
         r"(?:\s*\((\d{2,3})(?:th|st|nd|rd)?\s*(?:Congress|Cong\.?)?\))?"  # Optional congress
-        ,
-        re.IGNORECASE,
     )
 
     # ==========================================================================
     # CFR Patterns
     # ==========================================================================
 
-    CFR = re.compile(
+    CFR = _compile_pattern(
         r"\b(\d{1,2})\s*"  # Title
         r"C\.?\s*F\.?\s*R\.?\s*"  # C.F.R.
         r"(?:§+\s*|[Pp]art\s+|[Ss]ections?\s+|[Ss]ec\.?\s+)?"
         r"(\d+)"  # Part number
         r"(?:\.(\d+[a-z]*))?"  # Optional section
-        ,
-        re.IGNORECASE,
     )
 
     # ==========================================================================
     # Federal Register Patterns
     # ==========================================================================
 
-    FEDERAL_REGISTER = re.compile(
+    FEDERAL_REGISTER = _compile_pattern(
         r"\b(\d{1,3})\s*"  # Volume
         r"(?:Fed\.?\s*Reg\.?|FR)\s*"  # Fed. Reg. or FR
         r"(\d{1,6})"  # Page
-        ,
-        re.IGNORECASE,
     )
 
     # ==========================================================================
     # Statutes at Large Patterns
     # ==========================================================================
 
-    STATUTES_AT_LARGE = re.compile(
+    STATUTES_AT_LARGE = _compile_pattern(
         r"\b(\d{1,3})\s*"  # Volume
         r"Stat\.?\s*"  # Stat.
         r"(\d{1,5})"  # Page
-        ,
-        re.IGNORECASE,
     )
 
     # ==========================================================================
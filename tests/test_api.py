@@ -0,0 +1,39 @@
+"""
+Tests for the API's query building.
+
+These cover the pure helpers only - no Neo4j connection.
+"""
+
+from src.api.main import _lucene_escape, _lucene_query
+
+
+class TestLuceneEscape:
+    """Test escaping user input for the full-text index."""
+
+    def test_special_characters_escaped(self):
+        """Test that Lucene syntax characters are backslash-escaped."""
+        assert _lucene_escape('a+b-c "d" (e):f*') == r'a\+b\-c \"d\" \(e\)\:f\*'
+
+    def test_operators_lowercased(self):
+        """Test that AND/OR/NOT can't be read as operators."""
+        assert _lucene_escape("Grants OR Loans") == "grants or loans"
+
+
+class TestLuceneQuery:
+    """Test building the /search full-text query."""
+
+    def test_terms_are_required_prefixes(self):
+        """Test that every word must match, as a prefix."""
+        assert _lucene_query("semicond research") == "semicond* AND research*"
+
+    def test_citation_terms_all_required(self):
+        """Test that a citation doesn't match on the title number alone."""
+        assert _lucene_query("42 USC 1889") == "42* AND usc* AND 1889*"
+
+    def test_punctuation_dropped(self):
+        """Test that symbols the analyzer ignores don't become terms."""
+        assert _lucene_query("§ 1395w-4 (hospitals)") == "1395w* AND 4* AND hospitals*"
+
+    def test_no_terms(self):
+        """Test that input without words yields no query."""
+        assert _lucene_query("  §§ -- ") is None
@@ -0,0 +1,92 @@
+"""
+Tests for the bill narrator.
+
+These cover prompt rendering and response parsing only - no API calls.
+"""
+
+import pytest
+from src.analysis.bill_narrator import (
+    BillNarrator,
+    EXECUTIVE_SUMMARY_HEADERS,
+    SECTION_CONTEXT_HEADERS,
+)
+
+
+@pytest.fixture
+def narrator():
+    return BillNarrator(api_key="test-key")
+
+
+class TestHeaderSplitting:
+    """Test splitting LLM responses on section headers."""
+
+    def test_markdown_header_variants(self, narrator):
+        """Test that markdown-decorated headers are recognized."""
+        text = "## HEADLINE:\nChips law\n**OVERVIEW:**\nSome text\n# **WHY IT MATTERS**:\nImpact"
+        sections = narrator._split_by_headers(text, EXECUTIVE_SUMMARY_HEADERS)
+
+        assert sections["HEADLINE"] == "Chips law"
+        assert sections["OVERVIEW"] == "Some text"
+        assert sections["WHY IT MATTERS"] == "Impact"
+
+    def test_all_caps_content_is_not_a_header(self, narrator):
+        """Test that all-caps lines inside a section stay in that section."""
+        text = "CONNECTIONS:\n- Relates to NSF\nSEE 42 USC 1863\n"
+        sections = narrator._split_by_headers(text, SECTION_CONTEXT_HEADERS)
+
+        assert list(sections) == ["CONNECTIONS"]
+        assert "SEE 42 USC 1863" in sections["CONNECTIONS"]
+
+    def test_headers_from_other_generators_ignored(self, narrator):
+        """Test that the executive summary parser doesn't consume PATHWAYS."""
+        text = "HEADLINE:\nA law\nPATHWAYS:\n- IF YOU CARE ABOUT: X"
+        sections = narrator._split_by_headers(text, EXECUTIVE_SUMMARY_HEADERS)
+
+        assert "PATHWAYS" not in sections
+        assert "PATHWAYS:" in sections["HEADLINE"]
+
+    def test_parse_section_context(self, narrator):
+        """Test parsing a full section context response."""
+        response = (
+            "PLAIN ENGLISH:\nCreates a board.\n\n"
+            "WHY THIS EXISTS:\nOversight.\n\n"
+            "CONNECTIONS:\n- Links to 42 USC 1862\n- Links to 42 USC 1864\n"
+        )
+        context = narrator._parse_section_context(response)
+
+        assert context.plain_english == "Creates a board."
+        assert context.why_exists == "Oversight."
+        assert len(context.connections) == 2
+        assert context.amendment_story is None
+
+
+class TestPromptRendering:
+    """Test prompt construction."""
+
+    def test_section_prompt_is_deterministic(self, narrator):
+        """Test that identical inputs render identical prompts."""
+        args = ("42 USC 1863", "National Science Board", "Text  \n", [], [])
+        assert narrator._build_section_context_prompt(*args) == \
+            narrator._build_section_context_prompt(*args)
+
+    def test_amendment_story_only_with_amendments(self, narrator):
+        """Test that the amendment story instructions depend on amendments."""
+        without, _ = narrator._build_section_context_prompt("42 USC 1863", "Board", "Text", [], [])
+        with_amendments, _ = narrator._build_section_context_prompt(
+            "42 USC 1863", "Board", "Text",
+            [{"public_law": "Pub. L. 117-167", "date": "2022-08-09", "title": "CHIPS"}], [],
+        )
+
+        assert "AMENDMENT STORY:" not in without[0]["text"]
+        assert "AMENDMENT STORY:" in with_amendments[0]["text"]
+
+    def test_instructions_sent_as_cached_system_prompt(self, narrator):
+        """Test that static instructions are a cacheable system block, not user text."""
+        system, prompt = narrator._build_section_context_prompt(
+            "42 USC 1863", "Board", "Text", [], []
+        )
+
+        assert system[0]["cache_control"] == {"type": "ephemeral"}
+        assert "PLAIN ENGLISH:" in system[0]["text"]
+        assert "PLAIN ENGLISH:" not in prompt
+        assert "42 USC 1863" in prompt
@@ -10,7 +10,7 @@ content that requires appropriate hedging language.
 
 import json
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
 from src.analysis.text_diff import SectionDiff, DiffResult, DiffChunk, ChunkType
 from src.analysis.llm_summarizer import (
@@ -20,6 +20,10 @@ from src.analysis.llm_summarizer import (
     TrivialChangeResult,
     Confidence,
     RateLimiter,
+    SummarizerStats,
+    shared_rate_limiter,
+    MAX_RETRY_AFTER_SECONDS,
+    _wait_retry_after_or_jitter,
     ANTHROPIC_AVAILABLE,
 )
 
@@ -212,6 +216,27 @@ class TestTrivialChangeDetection:
         # Should detect this as changes
         assert diff_result.has_changes
 
+    @pytest.mark.skipif(not ANTHROPIC_AVAILABLE, reason="anthropic package not available")
+    def test_classify_trivial_bulk(self, differ):
+        """Test bulk classification matches per-diff trivial checks."""
+        diffs = [
+            differ.diff_sections("Same text", "Same text"),
+            differ.diff_sections(
+                "The Secretary shall establish standards for all hospitals in each State.",
+                "The Secretary shall establish standards for all hospitals in each State",
+            ),
+            differ.diff_sections("Old text", "Entirely different new text"),
+        ]
+
+        summarizer = AmendmentSummarizer(api_key="test-key")
+        kinds = summarizer.classify_trivial_bulk(diffs)
+
+        assert kinds[0] == "empty"
+        assert kinds[2] is None
+        for diff_result, kind in zip(diffs, kinds):
+            single = summarizer._check_trivial_change(diff_result, {})
+            assert (single.change_type if single else None) == kind
+
 
 # =============================================================================
 # Rate Limiter Tests
@@ -242,6 +267,81 @@ class TestRateLimiter:
         # First request should be nearly instant
         assert elapsed < 0.1
 
+    def test_rate_limiter_burst(self):
+        """Test that a burst of requests goes out without waiting."""
+        import time
+
+        limiter = RateLimiter(requests_per_minute=6.0, burst=3)
+
+        start = time.time()
+        for _ in range(3):
+            limiter.wait()
+        elapsed = time.time() - start
+
+        assert elapsed < 0.1
+
+    def test_rate_limiter_spaces_requests(self):
+        """Test that requests beyond the burst are spaced by min_interval."""
+        import time
+
+        limiter = RateLimiter(requests_per_minute=600.0)  # 0.1s interval
+
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.wait()
+        elapsed = time.monotonic() - start
+
+        assert 0.18 < elapsed < 0.5
+
+    def test_rate_limiter_uses_monotonic_clock(self):
+        """Test that the limiter never reads the wall clock."""
+        limiter = RateLimiter(requests_per_minute=6000.0)
+
+        with patch("src.analysis.llm_summarizer.time.time", side_effect=AssertionError("wall clock")):
+            limiter.wait()
+            limiter.wait()
+
+    def test_shared_rate_limiter(self):
+        """Test that callers with the same rate share one bucket."""
+        assert shared_rate_limiter(50.0) is shared_rate_limiter(50.0)
+        assert shared_rate_limiter(50.0) is not shared_rate_limiter(25.0)
+
+
+class TestRetryWait:
+    """Test the wait between retried API calls."""
+
+    @staticmethod
+    def _retry_state(retry_after):
+        exc = Mock(response=Mock(headers={"retry-after": retry_after}))
+        return Mock(outcome=Mock(exception=Mock(return_value=exc)))
+
+    def test_retry_after_honored(self):
+        """Test that a reasonable Retry-After is used as-is."""
+        assert _wait_retry_after_or_jitter(self._retry_state("5")) == 5.0
+
+    def test_retry_after_clamped(self):
+        """Test that a huge or negative Retry-After is clamped."""
+        assert _wait_retry_after_or_jitter(self._retry_state("86400")) == MAX_RETRY_AFTER_SECONDS
+        assert _wait_retry_after_or_jitter(self._retry_state("inf")) == MAX_RETRY_AFTER_SECONDS
+        assert _wait_retry_after_or_jitter(self._retry_state("-3")) == 0.0
+
+
+class TestSummarizerStats:
+    """Test the summarizer's running counts."""
+
+    def test_dict_style_access(self):
+        """Test that callers written against the old stats dict still work."""
+        stats = SummarizerStats()
+        stats.errors += 1
+        stats["total_summarized"] += 2
+
+        assert stats["errors"] == 1
+        assert stats.total_summarized == 2
+        assert dict(stats)["high_confidence"] == 0
+        assert ("errors", 1) in stats.items()
+        with pytest.raises(KeyError):
+            stats["unknown"]
+
 
 # =============================================================================
 # LLM Summarizer Tests (Mocked)
@@ -296,6 +396,165 @@ class TestAmendmentSummarizerMocked:
             for result in results:
                 assert isinstance(result, (SummaryResult, TrivialChangeResult))
 
+    def test_response_cache(self, differ, sample_context, mock_anthropic_client, tmp_path):
+        """Test that identical prompts are answered from the on-disk cache."""
+        diff_result = differ.diff_sections("Old text 1", "New text 1")
+
+        with patch("src.analysis.llm_summarizer.anthropic") as mock_anthropic:
+            mock_anthropic.Anthropic.return_value = mock_anthropic_client
+
+            summarizer = AmendmentSummarizer(
+                api_key="test-key", cache=True, cache_path=tmp_path / "cache.sqlite3"
+            )
+            summarizer.client = mock_anthropic_client
+
+            first = summarizer.summarize_diff(diff_result, sample_context)
+            second = summarizer.summarize_diff(diff_result, sample_context)
+
+        assert mock_anthropic_client.messages.create.call_count == 1
+        assert first.summary == second.summary
+
+    def test_batch_summarize_marshaled(self, differ, sample_context, mock_anthropic_client):
+        """Test packing several diffs into one prompt with single-row fallback."""
+        diffs = [
+            (differ.diff_sections(f"Old text {i}", f"New text {i}"), sample_context)
+            for i in range(3)
+        ]
+
+        marshaled = Mock(content=[Mock(text=json.dumps([
+            {"index": 1, "summary": "First.", "confidence": "high", "key_changes": []},
+            {"index": 3, "summary": "Third.", "confidence": "medium", "key_changes": []},
+        ]))])
+        single = mock_anthropic_client.messages.create.return_value
+        mock_anthropic_client.messages.create.side_effect = [marshaled, single]
+
+        with patch("src.analysis.llm_summarizer.anthropic") as mock_anthropic:
+            mock_anthropic.Anthropic.return_value = mock_anthropic_client
+
+            summarizer = AmendmentSummarizer(api_key="test-key", rows_per_prompt=5)
+            summarizer.client = mock_anthropic_client
+
+            results = summarizer.batch_summarize(diffs)
+
+        # One marshaled call, then one single-row call for the missing diff
+        assert mock_anthropic_client.messages.create.call_count == 2
+        first_prompt = mock_anthropic_client.messages.create.call_args_list[0].kwargs["messages"][0]["content"]
+        assert "### DIFF 3" in first_prompt
+
+        assert results[0].summary == "First."
+        assert results[1].confidence == Confidence.HIGH
+        assert results[2].summary == "Third."
+
+    def test_batch_summarize_marshaled_malformed_rows(self, differ, sample_context, mock_anthropic_client):
+        """Test that string indexes are accepted and a bad row only retries that diff."""
+        diffs = [
+            (differ.diff_sections(f"Old text {i}", f"New text {i}"), sample_context)
+            for i in range(3)
+        ]
+
+        marshaled = Mock(content=[Mock(text=json.dumps([
+            {"index": "1", "summary": "First.", "confidence": "high", "key_changes": []},
+            {"index": 2, "summary": "Second.", "confidence": None, "key_changes": []},
+            {"index": 3, "summary": "Third.", "confidence": "medium", "key_changes": []},
+        ]))])
+        single = mock_anthropic_client.messages.create.return_value
+        mock_anthropic_client.messages.create.side_effect = [marshaled, single]
+
+        with patch("src.analysis.llm_summarizer.anthropic") as mock_anthropic:
+            mock_anthropic.Anthropic.return_value = mock_anthropic_client
+
+            summarizer = AmendmentSummarizer(api_key="test-key", rows_per_prompt=5)
+            summarizer.client = mock_anthropic_client
+
+            results = summarizer.batch_summarize(diffs)
+
+        # Only the row with the null confidence goes out again on its own
+        assert mock_anthropic_client.messages.create.call_count == 2
+        assert results[0].summary == "First."
+        assert results[1].summary != "Second."
+        assert results[2].summary == "Third."
+
+    async def test_batch_summarize_async(self, differ, sample_context, mock_anthropic_client):
+        """Test concurrent batch summarization keeps input order."""
+        diffs = [
+            (differ.diff_sections("Old text 1", "New text 1"), sample_context),
+            (differ.diff_sections("Same text", "Same text"), sample_context),
+        ]
+
+        with patch("src.analysis.llm_summarizer.anthropic") as mock_anthropic:
+            mock_anthropic.Anthropic.return_value = mock_anthropic_client
+
+            summarizer = AmendmentSummarizer(api_key="test-key")
+            summarizer.async_client = Mock()
+            summarizer.async_client.messages.create = AsyncMock(
+                return_value=mock_anthropic_client.messages.create.return_value
+            )
+
+            results = await summarizer.batch_summarize_async(diffs, max_concurrency=2)
+
+        assert isinstance(results[0], SummaryResult)
+        assert results[0].confidence == Confidence.HIGH
+        assert isinstance(results[1], TrivialChangeResult)
+
+    async def test_async_retry_honors_retry_after(self, mock_anthropic_client):
+        """Test that a rate-limited async call is retried after Retry-After."""
+        import anthropic
+        import httpx
+
+        request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+        rate_limited = anthropic.RateLimitError(
+            "rate limited",
+            response=httpx.Response(429, headers={"retry-after": "0"}, request=request),
+            body=None,
+        )
+
+        summarizer = AmendmentSummarizer(api_key="test-key")
+        summarizer.async_client = Mock()
+        summarizer.async_client.messages.create = AsyncMock(
+            side_effect=[rate_limited, mock_anthropic_client.messages.create.return_value]
+        )
+
+        text = await summarizer._call_api_async("system", "user")
+
+        assert "expand eligibility" in text
+        assert summarizer.async_client.messages.create.call_count == 2
+
+    def test_batch_summarize_api(self, differ, sample_context, mock_anthropic_client):
+        """Test batch summarization through the Message Batches API."""
+        diffs = [
+            (differ.diff_sections("Old text 1", "New text 1"), sample_context),
+            (differ.diff_sections("Same text", "Same text"), sample_context),
+            (differ.diff_sections("Old text 3", "New text 3"), sample_context),
+        ]
+
+        batches = mock_anthropic_client.messages.batches
+        batches.create.return_value = Mock(id="batch-1", processing_status="ended")
+        response_text = mock_anthropic_client.messages.create.return_value.content[0].text
+        batches.results.return_value = [
+            Mock(custom_id="diff-2", result=Mock(
+                type="succeeded", message=Mock(content=[Mock(text=response_text)])
+            )),
+            Mock(custom_id="diff-0", result=Mock(type="errored")),
+        ]
+
+        with patch("src.analysis.llm_summarizer.anthropic") as mock_anthropic:
+            mock_anthropic.Anthropic.return_value = mock_anthropic_client
+
+            summarizer = AmendmentSummarizer(api_key="test-key")
+            summarizer.client = mock_anthropic_client
+
+            results = summarizer.batch_summarize_api(diffs)
+
+        # Only the two non-trivial diffs are submitted
+        submitted = batches.create.call_args.kwargs["requests"]
+        assert [r["custom_id"] for r in submitted] == ["diff-0", "diff-2"]
+
+        assert len(results) == 3
+        assert results[0].confidence == Confidence.LOW  # errored -> fallback
+        assert isinstance(results[1], TrivialChangeResult)
+        assert results[2].confidence == Confidence.HIGH
+        assert summarizer.stats.errors == 1
+
 
 # =============================================================================
 # Hedging Language Tests
@@ -384,6 +643,22 @@ class TestEdgeCases:
         data = result.model_dump()
         assert data["key_changes"] == []
 
+    @pytest.mark.skipif(not ANTHROPIC_AVAILABLE, reason="anthropic package not available")
+    def test_parse_response_with_fences_and_prose(self, differ, sample_context):
+        """Test that JSON wrapped in markdown fences and prose is still parsed."""
+        diff_result = differ.diff_sections("Old text", "New text")
+        response = (
+            "Here is the analysis:\n```json\n"
+            '{"summary": "Replaces old text.", "confidence": "high", "key_changes": ["x"]}'
+            "\n```\nLet me know if you need more."
+        )
+
+        summarizer = AmendmentSummarizer(api_key="test-key")
+        result = summarizer._parse_summary_response(response, diff_result, sample_context)
+
+        assert result.summary == "Replaces old text."
+        assert result.confidence == Confidence.HIGH
+
 
 # =============================================================================
 # Integration Tests (Require API Key - Skipped by Default)
@@ -15,6 +15,7 @@ from src.analysis.text_diff import (
     AmendmentInstruction,
     diff_sections,
     diff_from_amendment,
+    _patience_opcodes,
 )
 
 
@@ -44,6 +45,9 @@ class TestBasicDiff:
         assert result.similarity_score == 1.0
         assert not result.has_changes
         assert result.change_magnitude == "none"
+        # Matches the summary for text that only differs in whitespace
+        assert result.summary == "No substantive changes (whitespace only)"
+        assert result.old_word_count == result.new_word_count == 5
 
     def test_whitespace_only_changes(self, differ):
         """Test that whitespace-only changes are detected but minimal."""
@@ -96,6 +100,27 @@ class TestLegalTextQuirks:
         # The subsection detection should work
         assert any("(a)" in (s or "") for s in modified_subsections) or len(result.modifications) > 0
 
+    def test_change_attributed_to_its_subsection(self, differ):
+        """Test that an edit in (b) is labeled (b), not the first marker."""
+        old = "(a) First subsection.\n(b) Second subsection.\n(c) Third subsection."
+        new = "(a) First subsection.\n(b) Amended second subsection.\n(c) Third subsection."
+
+        result = differ.diff_sections(old, new)
+
+        assert [c.subsection for c in result.modifications] == ["(b)"]
+        assert result.modifications[0].line_number == 2
+        assert result.paragraphs_affected == 1
+
+    def test_reflowed_lines_are_whitespace_only(self, differ):
+        """Test that moving line breaks alone isn't reported as a change."""
+        old = "(a) The Secretary shall\nestablish standards."
+        new = "(a) The Secretary\n\n  shall establish standards."
+
+        result = differ.diff_sections(old, new)
+
+        assert not result.has_changes
+        assert result.old_word_count == result.new_word_count == 6
+
     def test_nested_subsections(self, differ):
         """Test handling of deeply nested subsections."""
         old = """
@@ -120,6 +145,14 @@ class TestLegalTextQuirks:
         # Should treat as identical after normalization
         assert result.similarity_score == 1.0
 
+    def test_smart_quote_normalization(self, differ):
+        """Test that curly single and double quotes fold to straight quotes."""
+        old = "The term \"qualified\" means the individual's plan."
+        new = "The term “qualified” means the individual’s plan."
+
+        result = differ.diff_sections(old, new)
+        assert result.similarity_score == 1.0
+
     def test_dash_normalization(self, differ):
         """Test that various dash types are normalized."""
         old = "health care-related factors"  # hyphen
@@ -210,6 +243,53 @@ class TestChangeMagnitude:
         assert result.change_magnitude in ("substantial", "major", "moderate")
 
 
+class TestPatienceDiff:
+    """Test the line-level patience diff."""
+
+    def _apply(self, old_lines, new_lines, opcodes):
+        """Rebuild new_lines from old_lines using the edit script."""
+        rebuilt = []
+        for tag, i1, i2, j1, j2 in opcodes:
+            rebuilt.extend(old_lines[i1:i2] if tag == "equal" else new_lines[j1:j2])
+        return rebuilt
+
+    def test_opcodes_reconstruct_new_text(self):
+        """Test that the edit script covers both sides exactly."""
+        old = ["(A)", "shall apply;", "(B)", "and", "(C)", "shall apply;"]
+        new = ["(A)", "and", "(B)", "shall apply;", "(D)", "(C)"]
+        opcodes = _patience_opcodes(old, new)
+
+        assert self._apply(old, new, opcodes) == new
+        assert opcodes[-1][2] == len(old) and opcodes[-1][4] == len(new)
+
+    def test_unique_lines_anchor_alignment(self):
+        """Test that a line unique to both sides is kept as unchanged."""
+        old = ["and", "(1) IN GENERAL.--The Secretary shall report.", "and"]
+        new = ["and", "and", "(1) IN GENERAL.--The Secretary shall report.", "and"]
+        opcodes = _patience_opcodes(old, new)
+
+        assert ("equal", 1, 3, 2, 4) in opcodes
+        assert self._apply(old, new, opcodes) == new
+
+    def test_struck_subparagraph_not_paired_with_next(self, differ):
+        """Test that striking (A) leaves an unchanged (B) out of the diff."""
+        old = (
+            "(A) is a resident of the State;\nand\n"
+            "(B) is enrolled in a qualified plan;\n(C) is not incarcerated."
+        )
+        new = "(B) is enrolled in a qualified plan;\nand\n(C) is not incarcerated."
+
+        result = differ.diff_sections(old, new)
+
+        # A plain LCS over lines pairs (A) with (B) as a modification and
+        # deletes the old (B); the unique (B) line anchors the alignment
+        assert result.modifications == []
+        assert [(c.subsection, c.text) for c in result.deletions] == [
+            ("(A)", "(A) is a resident of the State; and"),
+        ]
+        assert [(c.text, c.line_number) for c in result.additions] == [("and", 4)]
+
+
 # =============================================================================
 # Amendment Parsing Tests
 # =============================================================================
@@ -289,6 +369,36 @@ class TestAmendmentParsing:
         assert "insert_after" in types
         assert "add_end" in types
 
+    def test_mixed_kinds_all_reported(self, amendment_parser):
+        """Test that no kind is lost when several share a text, grouped by kind."""
+        text = (
+            'by redesignating subsection (c) as subsection (d); '
+            'by striking "shall" and inserting "may"; '
+            'by inserting "qualified" after "each"; '
+            'by striking "annual" and inserting "biennial".\n\n'
+            'Subsection (e) is amended to read as follows: "(e) REPORT."'
+        )
+        instructions = amendment_parser.parse(text)
+
+        assert [i.instruction_type for i in instructions] == [
+            "strike_insert", "strike_insert", "insert_after", "replace_all", "redesignate",
+        ]
+        assert instructions[0].strike_text == "shall"
+        assert instructions[1].strike_text == "annual"
+
+    def test_instruction_inside_add_end_body(self, amendment_parser):
+        """Test that an add_end body doesn't hide a later instruction."""
+        text = (
+            'Section 1395 is amended--\n'
+            '(1) by adding at the end the following: new paragraph (5); and\n'
+            '(2) by striking "shall" and inserting "may".'
+        )
+        instructions = amendment_parser.parse(text)
+
+        assert [i.instruction_type for i in instructions] == ["strike_insert", "add_end"]
+        assert instructions[0].strike_text == "shall"
+        assert instructions[0].insert_text == "may"
+
 
 class TestDiffFromAmendment:
     """Test reconstructing diffs from amendment instructions."""
@@ -477,6 +587,30 @@ class TestEdgeCases:
         result = differ.diff_sections(old, new)
         assert result.has_changes
 
+    def test_iter_chunks_matches_diff_sections(self, differ):
+        """Test that streaming chunks yields the same changes as the full diff."""
+        old = "The Secretary shall establish minimum standards."
+        new = "The Secretary shall establish maximum standards."
+
+        result = differ.diff_sections(old, new)
+        streamed = list(differ.iter_chunks(old, new))
+
+        assert streamed == result.additions + result.deletions + result.modifications
+        assert list(differ.iter_chunks(old, old)) == []
+
+    def test_repeated_diff_is_cached_copy(self, differ):
+        """Test that repeated comparisons return equal, independent results."""
+        old = "The Secretary shall establish standards."
+        new = "The Secretary shall establish appropriate standards."
+
+        first = differ.diff_sections(old, new)
+        first.modifications.clear()
+        second = differ.diff_sections(old, new)
+
+        assert second is not first
+        assert second.has_changes
+        assert second.summary == first.summary
+
     def test_multiline_strings(self, differ):
         """Test proper handling of multiline strings."""
         old = """Line 1